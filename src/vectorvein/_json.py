@@ -0,0 +1,75 @@
+"""JSON encoding shared by the API client and CLI; uses orjson when it is installed."""
+
+import json
+import math
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+if orjson is not None:
+    # Dict keys stay str-only (no OPT_NON_STR_KEYS): other keys go through the standard library like everywhere else.
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _raise_type_error(obj: Any) -> Any:
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_default(obj: Any) -> Any:
+    """Encode the non-JSON types orjson handles natively the same way orjson does."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    return _raise_type_error(obj)
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in obj)
+    return False
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, compact unless ``indent`` asks for two-space indentation.
+
+    Both backends produce the same result: ``Enum`` values encode as their value and ``UUID`` values as
+    their string form; dataclasses, datetimes and non-str dict keys other than int/float/bool/None raise
+    ``TypeError``, and NaN/Infinity raise ``ValueError``. Values orjson rejects (e.g. integers wider
+    than 64 bits, int dict keys) are encoded by the standard library.
+    """
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        try:
+            data = orjson.dumps(obj, default=_raise_type_error, option=option)
+        except TypeError:
+            pass
+        else:
+            # orjson writes NaN/Infinity as null; only then is the slower check needed
+            if b"null" not in data or not _has_non_finite_float(obj):
+                return data
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, allow_nan=False, default=_stdlib_default).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False, default=_stdlib_default).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON bytes or text; raises ``ValueError`` on invalid input.
+
+    Input orjson rejects but the standard library accepts (NaN, a UTF-8 BOM) still decodes.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass
+    return json.loads(data)
@@ -2,6 +2,7 @@
 
 import time
 import base64
+import asyncio
 from urllib.parse import quote
 from typing import Any, Literal
 
@@ -9,6 +10,7 @@ import httpx
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad
 
+from .._json import dumps_bytes, loads
 from .exceptions import (
     VectorVeinAPIError,
     APIKeyError,
@@ -37,11 +39,20 @@ class BaseClient:
 
         self.api_key = api_key
         self.base_url = base_url or self.BASE_URL
+        self._endpoint_urls: dict[tuple[str, str], httpx.URL] = {}
         self.default_headers = {
             "VECTORVEIN-API-KEY": api_key,
             "VECTORVEIN-API-VERSION": self.API_VERSION,
         }
 
+    def _endpoint_url(self, endpoint: str) -> httpx.URL:
+        """Absolute URL for an endpoint, parsed once per client"""
+        key = (self.base_url, endpoint)
+        url = self._endpoint_urls.get(key)
+        if url is None:
+            url = self._endpoint_urls[key] = httpx.URL(f"{self.base_url}/{endpoint}")
+        return url
+
     @staticmethod
     def _is_api_key_error(status_code: int, message: str) -> bool:
         if status_code == 401:
@@ -55,7 +66,8 @@ class BaseClient:
     @classmethod
     def _parse_response(cls, response: httpx.Response) -> dict[str, Any]:
         try:
-            result = response.json()
+            # Decode straight from bytes; httpx's response.json() first builds response.text
+            result = loads(response.content)
         except ValueError as e:
             raise RequestError(f"Request failed: invalid JSON response (HTTP {response.status_code})") from e
 
@@ -79,14 +91,29 @@ class BaseClient:
 class BaseSyncClient(BaseClient):
     """Base synchronous client"""
 
-    def __init__(self, api_key: str, base_url: str | None = None):
+    def __init__(self, api_key: str, base_url: str | None = None, http2: bool = False, read_cache_ttl: float = 0.0):
+        """Initialize the client
+
+        Args:
+            api_key: API key
+            base_url: API base URL
+            http2: Use HTTP/2 so concurrent requests share one connection.
+                Requires the ``http2`` extra (``pip install vectorvein-sdk[http2]``).
+            read_cache_ttl: Seconds to cache read-mostly workflow lookups (templates, tags,
+                database descriptors). 0 disables the cache.
+        """
         super().__init__(api_key, base_url)
-        self._client = httpx.Client(timeout=60)
+        self.read_cache_ttl = read_cache_ttl
+        self._client = httpx.Client(timeout=60, http2=http2)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool"""
         self._client.close()
 
     def _request(
@@ -118,17 +145,21 @@ class BaseSyncClient(BaseClient):
             VectorVeinAPIError: API error
             APIKeyError: API key is invalid or expired
         """
-        url = f"{self.base_url}/{endpoint}"
+        url = self._endpoint_url(endpoint)
         headers = self.default_headers.copy()
         if api_key_type == "VAPP":
             headers["VECTORVEIN-API-KEY-TYPE"] = "VAPP"
+        content = None
+        if json is not None and files is None:
+            content = dumps_bytes(json)
+            headers["Content-Type"] = "application/json"
 
         try:
             response = self._client.request(
                 method=method,
                 url=url,
                 params=params,
-                json=json,
+                content=content,
                 files=files,
                 headers=headers,
                 **kwargs,
@@ -174,14 +205,32 @@ class BaseSyncClient(BaseClient):
 class BaseAsyncClient(BaseClient):
     """Base asynchronous client"""
 
-    def __init__(self, api_key: str, base_url: str | None = None):
+    # Response bodies larger than this (bytes) are JSON-decoded in a worker thread
+    THREAD_PARSE_THRESHOLD = 1 << 20
+
+    def __init__(self, api_key: str, base_url: str | None = None, http2: bool = False, read_cache_ttl: float = 0.0):
+        """Initialize the client
+
+        Args:
+            api_key: API key
+            base_url: API base URL
+            http2: Use HTTP/2 so concurrent requests share one connection.
+                Requires the ``http2`` extra (``pip install vectorvein-sdk[http2]``).
+            read_cache_ttl: Seconds to cache read-mostly workflow lookups (templates, tags,
+                database descriptors). 0 disables the cache.
+        """
         super().__init__(api_key, base_url)
-        self._client = httpx.AsyncClient(timeout=60)
+        self.read_cache_ttl = read_cache_ttl
+        self._client = httpx.AsyncClient(timeout=60, http2=http2)
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool"""
         await self._client.aclose()
 
     async def _request(
@@ -213,21 +262,28 @@ class BaseAsyncClient(BaseClient):
             VectorVeinAPIError: API error
             APIKeyError: API key is invalid or expired
         """
-        url = f"{self.base_url}/{endpoint}"
+        url = self._endpoint_url(endpoint)
         headers = self.default_headers.copy()
         if api_key_type == "VAPP":
             headers["VECTORVEIN-API-KEY-TYPE"] = "VAPP"
+        content = None
+        if json is not None and files is None:
+            content = dumps_bytes(json)
+            headers["Content-Type"] = "application/json"
 
         try:
             response = await self._client.request(
                 method=method,
                 url=url,
                 params=params,
-                json=json,
+                content=content,
                 files=files,
                 headers=headers,
                 **kwargs,
             )
+            if len(response.content) > self.THREAD_PARSE_THRESHOLD:
+                # Keep the event loop responsive while large bodies (workflow graphs, big pages) are decoded
+                return await asyncio.to_thread(self._parse_response, response)
             return self._parse_response(response)
         except httpx.HTTPError as e:
             raise RequestError(f"Request failed: {str(e)}") from e
@@ -1,7 +1,7 @@
 """VectorVein API data model definitions"""
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple
 
 
 @dataclass
@@ -15,12 +15,11 @@ class VApp:
     images: list[str]
 
 
-@dataclass
-class APIUserIdentity:
+class APIUserIdentity(NamedTuple):
     """Validated user identity."""
 
-    user_id: str
-    username: str
+    user_id: str = ""
+    username: str = ""
 
 
 @dataclass
@@ -53,7 +52,7 @@ class WorkflowInputField:
     value: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowOutput:
     """Workflow output result"""
 
@@ -61,8 +60,13 @@ class WorkflowOutput:
     title: str
     value: Any
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "WorkflowOutput":
+        """Build from an API output item without a ``**data`` keyword unpack"""
+        return cls(data["type"], data["title"], data["value"])
 
-@dataclass
+
+@dataclass(slots=True)
 class WorkflowRunResult:
     """Workflow run result"""
 
@@ -82,7 +86,7 @@ class AccessKeyListResponse:
     page: int
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowTag:
     """Workflow tag"""
 
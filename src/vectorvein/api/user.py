@@ -1,19 +1,27 @@
 """User API functionality."""
 
+import asyncio
+import copy
 from typing import Any
 
 from .exceptions import VectorVeinAPIError
 from .models import APIUserIdentity
 
 
-def _parse_user_identity(response_data: Any) -> APIUserIdentity:
-    if not isinstance(response_data, dict):
-        raise VectorVeinAPIError("Invalid API response for user identity")
+def _response_data(response: dict[str, Any], label: str) -> dict[str, Any]:
+    data = response.get("data")
+    if not isinstance(data, dict):
+        raise VectorVeinAPIError(f"Invalid API response for {label}", status_code=response.get("status"))
+    return data
 
-    return APIUserIdentity(
-        user_id=str(response_data.get("user_id", "")),
-        username=str(response_data.get("username", "")),
-    )
+
+def _finalize_user_info(response: dict[str, Any]) -> dict[str, Any]:
+    return _response_data(response, "user info")
+
+
+def _finalize_validate(response: dict[str, Any]) -> APIUserIdentity:
+    data = _response_data(response, "user identity")
+    return APIUserIdentity(str(data.get("user_id", "")), str(data.get("username", "")))
 
 
 class UserSyncMixin:
@@ -21,30 +29,34 @@ class UserSyncMixin:
 
     def get_user_info(self) -> dict[str, Any]:
         """Get current user profile information."""
-        response = self._request("GET", "user-info/get")
-        data = response.get("data")
-        if not isinstance(data, dict):
-            raise VectorVeinAPIError("Invalid API response for user info", status_code=response.get("status"))
-        return data
+        return _finalize_user_info(self._request("GET", "user-info/get"))
 
     def validate_api_key(self) -> APIUserIdentity:
         """Validate API key and return identity info."""
-        response = self._request("GET", "user/validate-api-key")
-        return _parse_user_identity(response.get("data"))
+        return _finalize_validate(self._request("GET", "user/validate-api-key"))
 
 
 class UserAsyncMixin:
     """Asynchronous user API methods."""
 
+    _user_info_inflight: "asyncio.Future[dict[str, Any]] | None" = None
+
     async def get_user_info(self) -> dict[str, Any]:
-        """Get current user profile information."""
-        response = await self._request("GET", "user-info/get")
-        data = response.get("data")
-        if not isinstance(data, dict):
-            raise VectorVeinAPIError("Invalid API response for user info", status_code=response.get("status"))
-        return data
+        """Get current user profile information.
+
+        Concurrent callers share a single in-flight request; each gets its own copy of the result.
+        """
+        inflight = self._user_info_inflight
+        if inflight is None or inflight.done():
+            inflight = asyncio.ensure_future(self._request("GET", "user-info/get"))
+            self._user_info_inflight = inflight
+            inflight.add_done_callback(self._clear_user_info_inflight)
+        return copy.deepcopy(_finalize_user_info(await asyncio.shield(inflight)))
+
+    def _clear_user_info_inflight(self, future: "asyncio.Future[dict[str, Any]]") -> None:
+        if self._user_info_inflight is future:
+            self._user_info_inflight = None
 
     async def validate_api_key(self) -> APIUserIdentity:
         """Validate API key and return identity info."""
-        response = await self._request("GET", "user/validate-api-key")
-        return _parse_user_identity(response.get("data"))
+        return _finalize_validate(await self._request("GET", "user/validate-api-key"))
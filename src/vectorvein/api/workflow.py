@@ -1,10 +1,15 @@
 """Workflow API functionality"""
 
+import copy
+import json
 import time
+import hashlib
 import asyncio
+from collections import OrderedDict
 from typing import Any, Literal, overload
 
-from .exceptions import WorkflowError, TimeoutError, VectorVeinAPIError
+from .._json import dumps_bytes
+from .exceptions import WorkflowError, TimeoutError, VectorVeinAPIError, RequestError
 from .models import (
     WorkflowInputField,
     WorkflowOutput,
@@ -17,49 +22,171 @@ from .models import (
 class WorkflowMixin:
     """Workflow API mixin with shared logic"""
 
+    # Status polling backoff used by run_workflow(wait_for_completion=True)
+    _POLL_INITIAL_DELAY = 0.1
+    _POLL_MAX_DELAY = 5.0
+
+    # Read-mostly endpoints served from the per-instance read cache when read_cache_ttl > 0
+    _READ_CACHE_ENDPOINTS = frozenset(
+        {
+            "workflow/template/get",
+            "workflow/tag/list",
+            "workflow/vector-database/get",
+            "workflow/relational-database/get",
+            "workflow/relational-database-table/get",
+            "workflow/relational-database-task/get-table-schema",
+        }
+    )
+    _READ_CACHE_MAXSIZE = 512
+    _READ_CACHE_STALE_TTL = 300.0
+    read_cache_ttl: float = 0.0
+    _read_cache: "OrderedDict[tuple[str, str], tuple[float, Any]] | None" = None
+    # Bumped by every write; a read only fills the cache if no write happened while it was in flight
+    _read_cache_generation: int = 0
+
+    def _read_cache_key(self, endpoint: str, payload: dict[str, Any] | None) -> tuple[str, str] | None:
+        """Cache key for a cacheable read, or None when the call must bypass the cache.
+
+        A call to a mutating endpoint drops every cached entry; other reads leave the cache alone.
+        """
+        if endpoint.rsplit("/", 1)[-1] not in self._READ_ACTIONS:
+            self._read_cache_generation += 1
+            if self._read_cache:
+                self._read_cache.clear()
+            return None
+        if not self.read_cache_ttl or endpoint not in self._READ_CACHE_ENDPOINTS:
+            return None
+        return endpoint, json.dumps(payload or {}, sort_keys=True, default=str)
+
+    def _read_cache_get(self, key: tuple[str, str], max_age: float) -> tuple[bool, Any]:
+        """Look up a cached read; hits are deep copies so callers may mutate what they get back"""
+        entry = self._read_cache.get(key) if self._read_cache else None
+        if entry is None or time.monotonic() - entry[0] > max_age:
+            return False, None
+        self._read_cache.move_to_end(key)
+        return True, copy.deepcopy(entry[1])
+
+    def _read_cache_put(self, key: tuple[str, str], value: Any, generation: int) -> None:
+        if generation != self._read_cache_generation:
+            return
+        if self._read_cache is None:
+            self._read_cache = OrderedDict()
+        self._read_cache[key] = (time.monotonic(), copy.deepcopy(value))
+        self._read_cache.move_to_end(key)
+        while len(self._read_cache) > self._READ_CACHE_MAXSIZE:
+            self._read_cache.popitem(last=False)
+
+    # Endpoint actions (last path segment) that only read server state
+    _READ_ACTIONS = frozenset({"get", "list", "search", "batch-get", "check-access", "check-status", "get-table-schema"})
+
+    _RUN_MEMO_MAXSIZE = 256
+    _run_memo: "OrderedDict[str, tuple[str, float, WorkflowRunResult]] | None" = None
+
+    @staticmethod
+    def _run_memo_key(payload: dict[str, Any], api_key_type: str) -> str:
+        return hashlib.blake2b(dumps_bytes([api_key_type, payload]), digest_size=16).hexdigest()
+
+    def _run_memo_get(self, key: str, ttl: float) -> WorkflowRunResult | None:
+        entry = self._run_memo.get(key) if self._run_memo else None
+        if entry is None or time.monotonic() - entry[1] > ttl:
+            return None
+        self._run_memo.move_to_end(key)
+        return copy.deepcopy(entry[2])
+
+    def _run_memo_put(self, key: str, wid: str, result: WorkflowRunResult) -> None:
+        if self._run_memo is None:
+            self._run_memo = OrderedDict()
+        self._run_memo[key] = (wid, time.monotonic(), copy.deepcopy(result))
+        self._run_memo.move_to_end(key)
+        while len(self._run_memo) > self._RUN_MEMO_MAXSIZE:
+            self._run_memo.popitem(last=False)
+
+    def clear_workflow_memo(self, wid: str | None = None) -> None:
+        """Drop memoized run_workflow results, for one workflow or all of them
+
+        Args:
+            wid: Workflow ID; clears every memoized result when omitted
+        """
+        if not self._run_memo:
+            return
+        if wid is None:
+            self._run_memo.clear()
+            return
+        for key in [key for key, entry in self._run_memo.items() if entry[0] == wid]:
+            del self._run_memo[key]
+
+    @staticmethod
+    def _require_vapp_wid(wid: str | None, api_key_type: Literal["WORKFLOW", "VAPP"]) -> None:
+        if api_key_type == "VAPP" and not wid:
+            raise VectorVeinAPIError("Workflow ID cannot be empty when api_key_type is 'VAPP'")
+
+    @staticmethod
+    def _is_stale_if_error(error: VectorVeinAPIError) -> bool:
+        return isinstance(error, RequestError) or (error.status_code or 0) >= 500
+
+    @classmethod
+    def _poll_delay(cls, attempt: int, deadline: float) -> float:
+        """Exponential backoff delay for the given attempt, clamped to the time left before deadline"""
+        # Bound the exponent: the cap is reached long before 2**32, and an unbounded int overflows float()
+        delay = min(cls._POLL_INITIAL_DELAY * (2 ** min(attempt, 32)), cls._POLL_MAX_DELAY)
+        return max(0.0, min(delay, deadline - time.monotonic()))
+
     @staticmethod
     def _create_workflow_response(response: dict[str, Any]) -> Workflow:
         """Parse workflow creation response"""
-        workflow_tags = []
-        if response["data"].get("tags"):
-            for tag_data in response["data"]["tags"]:
-                if isinstance(tag_data, dict):
-                    workflow_tags.append(WorkflowTag(**tag_data))
+        data = response["data"]
+        workflow_tags = [WorkflowTag(**tag_data) for tag_data in data.get("tags") or () if isinstance(tag_data, dict)]
 
         return Workflow(
-            wid=response["data"]["wid"],
-            title=response["data"]["title"],
-            brief=response["data"]["brief"],
-            data=response["data"]["data"],
-            language=response["data"]["language"],
-            images=response["data"]["images"],
+            wid=data["wid"],
+            title=data["title"],
+            brief=data["brief"],
+            data=data["data"],
+            language=data["language"],
+            images=data["images"],
             tags=workflow_tags,
-            source_workflow=response["data"].get("source_workflow"),
-            tool_call_data=response["data"].get("tool_call_data"),
-            create_time=response["data"].get("create_time"),
-            update_time=response["data"].get("update_time"),
+            source_workflow=data.get("source_workflow"),
+            tool_call_data=data.get("tool_call_data"),
+            create_time=data.get("create_time"),
+            update_time=data.get("update_time"),
         )
 
     @staticmethod
     def _parse_workflow_result(response: dict[str, Any], rid: str) -> WorkflowRunResult:
         """Parse workflow run result"""
-        if response["status"] in [200, 202]:
+        status = response["status"]
+        if status in (200, 202):
             return WorkflowRunResult(
                 rid=rid,
-                status=response["status"],
+                status=status,
                 msg=response["msg"],
-                data=[WorkflowOutput(**output) for output in response["data"]],
+                data=[WorkflowOutput.from_dict(output) for output in response["data"]],
             )
         else:
             raise WorkflowError(f"Workflow execution failed: {response['msg']}")
 
+    @staticmethod
+    def _run_response_rid(response: dict[str, Any]) -> str:
+        """Run record ID from a workflow/run response, at the top level or inside ``data``"""
+        rid = response.get("rid")
+        if rid:
+            return rid
+        data = response["data"]
+        return (data.get("rid") if isinstance(data, dict) else None) or ""
+
+    @staticmethod
+    def _is_completed_run_response(response: dict[str, Any]) -> bool:
+        """Whether a workflow/run response already carries the finished outputs
+
+        When the server finishes the run within the submit request, ``data`` is the
+        output list and ``rid`` is at the top level, so no status poll is needed.
+        """
+        return response["status"] == 200 and isinstance(response["data"], list)
+
     @staticmethod
     def _build_payload(base: dict[str, Any] | None = None, **kwargs: Any) -> dict[str, Any]:
-        payload: dict[str, Any] = {} if base is None else dict(base)
-        for key, value in kwargs.items():
-            if value is not None:
-                payload[key] = value
-        return payload
+        payload = {key: value for key, value in kwargs.items() if value is not None}
+        return payload if base is None else {**base, **payload}
 
     @staticmethod
     def _extract_data(response: dict[str, Any]) -> Any:
@@ -70,8 +197,25 @@ class WorkflowSyncMixin(WorkflowMixin):
     """Synchronous workflow API methods"""
 
     def _workflow_post(self, endpoint: str, payload: dict[str, Any] | None = None) -> Any:
-        response = self._request("POST", endpoint, json=payload or {})
-        return self._extract_data(response)
+        cache_key = self._read_cache_key(endpoint, payload)
+        if cache_key is None:
+            response = self._request("POST", endpoint, json=payload or {})
+            return self._extract_data(response)
+
+        hit, data = self._read_cache_get(cache_key, self.read_cache_ttl)
+        if hit:
+            return data
+        generation = self._read_cache_generation
+        try:
+            response = self._request("POST", endpoint, json=payload or {})
+        except VectorVeinAPIError as e:
+            hit, data = self._read_cache_get(cache_key, self._READ_CACHE_STALE_TTL)
+            if hit and self._is_stale_if_error(e):
+                return data
+            raise
+        data = self._extract_data(response)
+        self._read_cache_put(cache_key, data, generation)
+        return data
 
     @overload
     def run_workflow(
@@ -82,6 +226,8 @@ class WorkflowSyncMixin(WorkflowMixin):
         wait_for_completion: Literal[False] = False,
         api_key_type: Literal["WORKFLOW", "VAPP"] = "WORKFLOW",
         timeout: int = 30,
+        memoize: bool = False,
+        memoize_ttl: float = 300,
     ) -> str: ...
 
     @overload
@@ -93,6 +239,8 @@ class WorkflowSyncMixin(WorkflowMixin):
         wait_for_completion: Literal[True] = True,
         api_key_type: Literal["WORKFLOW", "VAPP"] = "WORKFLOW",
         timeout: int = 30,
+        memoize: bool = False,
+        memoize_ttl: float = 300,
     ) -> WorkflowRunResult: ...
 
     def run_workflow(
@@ -103,6 +251,8 @@ class WorkflowSyncMixin(WorkflowMixin):
         wait_for_completion: bool = False,
         api_key_type: Literal["WORKFLOW", "VAPP"] = "WORKFLOW",
         timeout: int = 30,
+        memoize: bool = False,
+        memoize_ttl: float = 300,
     ) -> str | WorkflowRunResult:
         """Run workflow
 
@@ -113,6 +263,9 @@ class WorkflowSyncMixin(WorkflowMixin):
             wait_for_completion: Whether to wait for completion
             api_key_type: Key type, optional values: 'WORKFLOW' or 'VAPP'
             timeout: Timeout (seconds)
+            memoize: Reuse the result of an earlier identical run (same workflow, inputs and
+                options) instead of running again; only applies when waiting for completion
+            memoize_ttl: How long (seconds) a memoized result stays valid
 
         Returns:
             Union[str, WorkflowRunResult]: Workflow run ID or run result
@@ -128,16 +281,39 @@ class WorkflowSyncMixin(WorkflowMixin):
             "input_fields": [{"node_id": field.node_id, "field_name": field.field_name, "value": field.value} for field in input_fields],
         }
 
+        memo_key = self._run_memo_key(payload, api_key_type) if memoize and wait_for_completion else None
+        if memo_key is not None:
+            memoized = self._run_memo_get(memo_key, memoize_ttl)
+            if memoized is not None:
+                return memoized
+
         result = self._request("POST", "workflow/run", json=payload, api_key_type=api_key_type)
 
         if not wait_for_completion:
             return result["data"]["rid"]
 
-        rid = result.get("rid") or (isinstance(result["data"], dict) and result["data"].get("rid")) or ""
-        start_time = time.time()
+        rid = self._run_response_rid(result)
+        if self._is_completed_run_response(result):
+            run_result = self._parse_workflow_result(result, rid)
+        else:
+            run_result = self._wait_for_workflow_completion(rid, wid, api_key_type, timeout)
+        if memo_key is not None:
+            self._run_memo_put(memo_key, wid, run_result)
+        return run_result
+
+    def _wait_for_workflow_completion(
+        self,
+        rid: str,
+        wid: str,
+        api_key_type: Literal["WORKFLOW", "VAPP"],
+        timeout: float,
+    ) -> WorkflowRunResult:
+        """Wait until a workflow run finishes, polling check-status with backoff"""
+        deadline = time.monotonic() + timeout
+        attempt = 0
 
         while True:
-            if time.time() - start_time > timeout:
+            if time.monotonic() > deadline:
                 raise TimeoutError(f"Workflow execution timed out after {timeout} seconds")
 
             if api_key_type == "WORKFLOW":
@@ -149,7 +325,8 @@ class WorkflowSyncMixin(WorkflowMixin):
             elif result.status == 500:
                 raise WorkflowError(f"Workflow execution failed: {result.msg}")
 
-            time.sleep(5)
+            time.sleep(self._poll_delay(attempt, deadline))
+            attempt += 1
 
     @overload
     def check_workflow_status(self, rid: str, wid: str | None = None, api_key_type: Literal["WORKFLOW"] = "WORKFLOW") -> WorkflowRunResult: ...
@@ -171,14 +348,30 @@ class WorkflowSyncMixin(WorkflowMixin):
         Raises:
             VectorVeinAPIError: Workflow error
         """
+        self._require_vapp_wid(wid, api_key_type)
+        return self._check_workflow_status(rid, wid, api_key_type)
+
+    def _check_workflow_status(self, rid: str, wid: str | None, api_key_type: Literal["WORKFLOW", "VAPP"]) -> WorkflowRunResult:
         payload = {"rid": rid}
-        if api_key_type == "VAPP" and not wid:
-            raise VectorVeinAPIError("Workflow ID cannot be empty when api_key_type is 'VAPP'")
         if wid:
             payload["wid"] = wid
         response = self._request("POST", "workflow/check-status", json=payload, api_key_type=api_key_type)
         return self._parse_workflow_result(response, rid)
 
+    def check_workflow_statuses(self, rids: list[str], wid: str | None = None, api_key_type: Literal["WORKFLOW", "VAPP"] = "WORKFLOW") -> dict[str, WorkflowRunResult]:
+        """Check the status of several workflow runs
+
+        Args:
+            rids: Workflow run record IDs
+            wid: Workflow ID, required when api_key_type is 'VAPP'
+            api_key_type: Key type, optional values: 'WORKFLOW' or 'VAPP'
+
+        Returns:
+            Dict[str, WorkflowRunResult]: Run result keyed by run record ID
+        """
+        self._require_vapp_wid(wid, api_key_type)
+        return {rid: self._check_workflow_status(rid, wid, api_key_type) for rid in dict.fromkeys(rids)}
+
     def create_workflow(
         self,
         title: str = "New workflow",
@@ -275,6 +468,7 @@ class WorkflowSyncMixin(WorkflowMixin):
             language=language,
             client=client,
         )
+        self.clear_workflow_memo(wid)
         return self._workflow_post("workflow/update", payload)
 
     def update_workflow_tool_call_data(self, wid: str, tool_call_data: dict[str, Any]) -> dict[str, Any]:
@@ -282,6 +476,7 @@ class WorkflowSyncMixin(WorkflowMixin):
         return self._workflow_post("workflow/update-tool-call-data", payload)
 
     def delete_workflow(self, wid: str) -> dict[str, Any]:
+        self.clear_workflow_memo(wid)
         return self._workflow_post("workflow/delete", {"wid": wid})
 
     def run_workflow_template(
@@ -309,6 +504,17 @@ class WorkflowSyncMixin(WorkflowMixin):
     def get_workflow_run_record(self, rid: str) -> dict[str, Any]:
         return self._workflow_post("workflow/run-record/get", {"rid": rid})
 
+    def get_workflow_run_records(self, rids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch several workflow run records
+
+        Args:
+            rids: Workflow run record IDs, e.g. taken from list_workflow_run_records
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Run record keyed by run record ID
+        """
+        return {rid: self.get_workflow_run_record(rid) for rid in dict.fromkeys(rids)}
+
     def list_workflow_run_records(
         self,
         page: int = 1,
@@ -610,9 +816,53 @@ class WorkflowSyncMixin(WorkflowMixin):
 class WorkflowAsyncMixin(WorkflowMixin):
     """Asynchronous workflow API methods"""
 
+    _inflight: "dict[tuple[str, str, bytes], asyncio.Future[dict[str, Any]]] | None" = None
+
+    async def _post(self, endpoint: str, payload: dict[str, Any], api_key_type: Literal["WORKFLOW", "VAPP"] = "WORKFLOW") -> dict[str, Any]:
+        """POST to an endpoint; concurrent identical read requests share one in-flight request
+
+        Each awaiter of a shared request gets its own copy of the response.
+        """
+        if endpoint.rsplit("/", 1)[-1] not in self._READ_ACTIONS:
+            # Reads issued after this write must not join a request that started before it
+            if self._inflight:
+                self._inflight.clear()
+            return await self._request("POST", endpoint, json=payload, api_key_type=api_key_type)
+
+        if self._inflight is None:
+            self._inflight = {}
+        key = (endpoint, api_key_type, dumps_bytes(payload))
+        inflight = self._inflight.get(key)
+        if inflight is None or inflight.done():
+            inflight = asyncio.ensure_future(self._request("POST", endpoint, json=payload, api_key_type=api_key_type))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda future: self._clear_inflight(key, future))
+        return copy.deepcopy(await asyncio.shield(inflight))
+
+    def _clear_inflight(self, key: tuple[str, str, bytes], future: "asyncio.Future[dict[str, Any]]") -> None:
+        if self._inflight and self._inflight.get(key) is future:
+            del self._inflight[key]
+
     async def _workflow_post(self, endpoint: str, payload: dict[str, Any] | None = None) -> Any:
-        response = await self._request("POST", endpoint, json=payload or {})
-        return self._extract_data(response)
+        cache_key = self._read_cache_key(endpoint, payload)
+        if cache_key is None:
+            response = await self._post(endpoint, payload or {})
+            return self._extract_data(response)
+
+        hit, data = self._read_cache_get(cache_key, self.read_cache_ttl)
+        if hit:
+            return data
+        generation = self._read_cache_generation
+        try:
+            response = await self._post(endpoint, payload or {})
+        except VectorVeinAPIError as e:
+            hit, data = self._read_cache_get(cache_key, self._READ_CACHE_STALE_TTL)
+            if hit and self._is_stale_if_error(e):
+                return data
+            raise
+        data = self._extract_data(response)
+        self._read_cache_put(cache_key, data, generation)
+        return data
 
     @overload
     async def run_workflow(
@@ -623,6 +873,8 @@ class WorkflowAsyncMixin(WorkflowMixin):
         wait_for_completion: Literal[False] = False,
         api_key_type: Literal["WORKFLOW", "VAPP"] = "WORKFLOW",
         timeout: int = 30,
+        memoize: bool = False,
+        memoize_ttl: float = 300,
     ) -> str: ...
 
     @overload
@@ -634,6 +886,8 @@ class WorkflowAsyncMixin(WorkflowMixin):
         wait_for_completion: Literal[True] = True,
         api_key_type: Literal["WORKFLOW", "VAPP"] = "WORKFLOW",
         timeout: int = 30,
+        memoize: bool = False,
+        memoize_ttl: float = 300,
     ) -> WorkflowRunResult: ...
 
     async def run_workflow(
@@ -644,6 +898,8 @@ class WorkflowAsyncMixin(WorkflowMixin):
         wait_for_completion: bool = False,
         api_key_type: Literal["WORKFLOW", "VAPP"] = "WORKFLOW",
         timeout: int = 30,
+        memoize: bool = False,
+        memoize_ttl: float = 300,
     ) -> str | WorkflowRunResult:
         """Async run workflow
 
@@ -654,6 +910,9 @@ class WorkflowAsyncMixin(WorkflowMixin):
             wait_for_completion: Whether to wait for completion
             api_key_type: Key type, optional values: 'WORKFLOW' or 'VAPP'
             timeout: Timeout (seconds)
+            memoize: Reuse the result of an earlier identical run (same workflow, inputs and
+                options) instead of running again; only applies when waiting for completion
+            memoize_ttl: How long (seconds) a memoized result stays valid
 
         Returns:
             Union[str, WorkflowRunResult]: Workflow run ID or run result
@@ -669,16 +928,63 @@ class WorkflowAsyncMixin(WorkflowMixin):
             "input_fields": [{"node_id": field.node_id, "field_name": field.field_name, "value": field.value} for field in input_fields],
         }
 
+        memo_key = self._run_memo_key(payload, api_key_type) if memoize and wait_for_completion else None
+        if memo_key is not None:
+            memoized = self._run_memo_get(memo_key, memoize_ttl)
+            if memoized is not None:
+                return memoized
+
         result = await self._request("POST", "workflow/run", json=payload, api_key_type=api_key_type)
 
         if not wait_for_completion:
             return result["data"]["rid"]
 
-        rid = result.get("rid") or (isinstance(result["data"], dict) and result["data"].get("rid")) or ""
-        start_time = time.time()
+        rid = self._run_response_rid(result)
+        if self._is_completed_run_response(result):
+            run_result = self._parse_workflow_result(result, rid)
+        else:
+            run_result = await self._wait_for_workflow_completion(rid, wid, api_key_type, timeout)
+        if memo_key is not None:
+            self._run_memo_put(memo_key, wid, run_result)
+        return run_result
+
+    async def run_workflows_many(self, requests: list[dict[str, Any]], concurrency: int = 16) -> list[str | WorkflowRunResult | BaseException]:
+        """Async run several workflows concurrently
+
+        Args:
+            requests: Keyword arguments for each run_workflow call
+            concurrency: Maximum number of runs in flight at once; keep it at or below the
+                connection pool size (httpx defaults to 100 connections)
+
+        Returns:
+            List[Union[str, WorkflowRunResult, BaseException]]: run_workflow result for each request,
+                in request order, or the exception it raised
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _run_one(kwargs: dict[str, Any]) -> str | WorkflowRunResult:
+            async with semaphore:
+                return await self.run_workflow(**kwargs)
+
+        return await asyncio.gather(*(_run_one(kwargs) for kwargs in requests), return_exceptions=True)
+
+    async def _wait_for_workflow_completion(
+        self,
+        rid: str,
+        wid: str,
+        api_key_type: Literal["WORKFLOW", "VAPP"],
+        timeout: float,
+    ) -> WorkflowRunResult:
+        """Wait until a workflow run finishes, polling check-status with backoff
+
+        The open API has no push or long-poll completion endpoint, so this is the
+        single place that turns status checks into a completion wait.
+        """
+        deadline = time.monotonic() + timeout
+        attempt = 0
 
         while True:
-            if time.time() - start_time > timeout:
+            if time.monotonic() > deadline:
                 raise TimeoutError(f"Workflow execution timed out after {timeout} seconds")
 
             if api_key_type == "WORKFLOW":
@@ -690,7 +996,8 @@ class WorkflowAsyncMixin(WorkflowMixin):
             elif result.status == 500:
                 raise WorkflowError(f"Workflow execution failed: {result.msg}")
 
-            await asyncio.sleep(5)
+            await asyncio.sleep(self._poll_delay(attempt, deadline))
+            attempt += 1
 
     @overload
     async def check_workflow_status(self, rid: str, wid: str | None = None, api_key_type: Literal["WORKFLOW"] = "WORKFLOW") -> WorkflowRunResult: ...
@@ -709,14 +1016,32 @@ class WorkflowAsyncMixin(WorkflowMixin):
         Raises:
             VectorVeinAPIError: Workflow error
         """
+        self._require_vapp_wid(wid, api_key_type)
+        return await self._check_workflow_status(rid, wid, api_key_type)
+
+    async def _check_workflow_status(self, rid: str, wid: str | None, api_key_type: Literal["WORKFLOW", "VAPP"]) -> WorkflowRunResult:
         payload = {"rid": rid}
-        if api_key_type == "VAPP" and not wid:
-            raise VectorVeinAPIError("Workflow ID cannot be empty when api_key_type is 'VAPP'")
         if wid:
             payload["wid"] = wid
-        response = await self._request("POST", "workflow/check-status", json=payload, api_key_type=api_key_type)
+        response = await self._post("workflow/check-status", payload, api_key_type=api_key_type)
         return self._parse_workflow_result(response, rid)
 
+    async def check_workflow_statuses(self, rids: list[str], wid: str | None = None, api_key_type: Literal["WORKFLOW", "VAPP"] = "WORKFLOW") -> dict[str, WorkflowRunResult]:
+        """Async check the status of several workflow runs concurrently
+
+        Args:
+            rids: Workflow run record IDs
+            wid: Workflow ID, required when api_key_type is 'VAPP'
+            api_key_type: Key type, optional values: 'WORKFLOW' or 'VAPP'
+
+        Returns:
+            Dict[str, WorkflowRunResult]: Run result keyed by run record ID
+        """
+        self._require_vapp_wid(wid, api_key_type)
+        unique_rids = list(dict.fromkeys(rids))
+        results = await asyncio.gather(*(self._check_workflow_status(rid, wid, api_key_type) for rid in unique_rids))
+        return dict(zip(unique_rids, results, strict=True))
+
     async def create_workflow(
         self,
         title: str = "New workflow",
@@ -763,7 +1088,7 @@ class WorkflowAsyncMixin(WorkflowMixin):
         return self._create_workflow_response(response)
 
     async def get_workflow(self, wid: str) -> Workflow:
-        response = await self._request("POST", "workflow/get", json={"wid": wid})
+        response = await self._post("workflow/get", {"wid": wid})
         return self._create_workflow_response(response)
 
     async def list_workflows(
@@ -813,6 +1138,7 @@ class WorkflowAsyncMixin(WorkflowMixin):
             language=language,
             client=client,
         )
+        self.clear_workflow_memo(wid)
         return await self._workflow_post("workflow/update", payload)
 
     async def update_workflow_tool_call_data(self, wid: str, tool_call_data: dict[str, Any]) -> dict[str, Any]:
@@ -820,6 +1146,7 @@ class WorkflowAsyncMixin(WorkflowMixin):
         return await self._workflow_post("workflow/update-tool-call-data", payload)
 
     async def delete_workflow(self, wid: str) -> dict[str, Any]:
+        self.clear_workflow_memo(wid)
         return await self._workflow_post("workflow/delete", {"wid": wid})
 
     async def run_workflow_template(
@@ -847,6 +1174,26 @@ class WorkflowAsyncMixin(WorkflowMixin):
     async def get_workflow_run_record(self, rid: str) -> dict[str, Any]:
         return await self._workflow_post("workflow/run-record/get", {"rid": rid})
 
+    async def get_workflow_run_records(self, rids: list[str], concurrency: int = 16) -> dict[str, dict[str, Any]]:
+        """Async fetch several workflow run records concurrently
+
+        Args:
+            rids: Workflow run record IDs, e.g. taken from list_workflow_run_records
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Run record keyed by run record ID
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _get_one(rid: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.get_workflow_run_record(rid)
+
+        unique_rids = list(dict.fromkeys(rids))
+        records = await asyncio.gather(*(_get_one(rid) for rid in unique_rids))
+        return dict(zip(unique_rids, records, strict=True))
+
     async def list_workflow_run_records(
         self,
         page: int = 1,
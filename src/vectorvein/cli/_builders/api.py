@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import argparse
 
-from vectorvein.cli._builders.common import rich_parser_kwargs
+from vectorvein.cli._builders.common import rich_parser_kwargs, set_handler
 from vectorvein.cli._commands.api import _cmd_api_request
 
 
@@ -49,4 +49,4 @@ def register_api_parser(top_level: argparse._SubParsersAction[argparse.ArgumentP
     api_request.add_argument("--params", help="JSON object or @file for query parameters.")
     api_request.add_argument("--body", help="JSON object or @file for request body.")
     api_request.add_argument("--api-key-type", choices=("WORKFLOW", "VAPP"), default="WORKFLOW", help="API key type header (default: WORKFLOW).")
-    api_request.set_defaults(handler=_cmd_api_request, command="api request")
+    set_handler(api_request, "api request", _cmd_api_request)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import argparse
 
-from vectorvein.cli._builders.common import rich_parser_kwargs
+from vectorvein.cli._builders.common import rich_parser_kwargs, set_handler
 from vectorvein.cli._commands.auth import _cmd_auth_whoami, _cmd_user_info, _cmd_user_validate_api_key
 
 
@@ -31,7 +31,7 @@ def register_auth_parsers(top_level: argparse._SubParsersAction[argparse.Argumen
             examples=["vectorvein auth whoami"],
         ),
     )
-    auth_whoami.set_defaults(handler=_cmd_auth_whoami, command="auth whoami")
+    set_handler(auth_whoami, "auth whoami", _cmd_auth_whoami)
 
     user_parser = top_level.add_parser(
         "user",
@@ -52,11 +52,11 @@ def register_auth_parsers(top_level: argparse._SubParsersAction[argparse.Argumen
         help="Fetch current user profile (user-info/get).",
         **rich_parser_kwargs("Fetch the full current user profile from the Open API.", examples=["vectorvein user info"]),
     )
-    user_info.set_defaults(handler=_cmd_user_info, command="user info")
+    set_handler(user_info, "user info", _cmd_user_info)
 
     user_validate = user_sub.add_parser(
         "validate-api-key",
         help="Validate API key (user/validate-api-key).",
         **rich_parser_kwargs("Validate the currently provided API key and return the resolved user identity.", examples=["vectorvein user validate-api-key"]),
     )
-    user_validate.set_defaults(handler=_cmd_user_validate_api_key, command="user validate-api-key")
+    set_handler(user_validate, "user validate-api-key", _cmd_user_validate_api_key)
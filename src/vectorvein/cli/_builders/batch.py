@@ -0,0 +1,36 @@
+"""Batch parser builder."""
+
+from __future__ import annotations
+
+import argparse
+
+from vectorvein.cli._builders.common import rich_parser_kwargs, set_handler
+from vectorvein.cli._commands.batch import _cmd_batch
+
+
+def register_batch_parser(top_level: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
+    batch_parser = top_level.add_parser(
+        "batch",
+        help="Run many commands, one per line, over a single API connection.",
+        **rich_parser_kwargs(
+            "Read one CLI command per line and run them all with one client, so the connection and TLS session are reused. "
+            "Each result is reported with its own ok flag; a failing line does not stop the batch.",
+            examples=[
+                "printf 'workflow get --wid wf_a\\nworkflow get --wid wf_b\\n' | vectorvein --format json batch",
+                "vectorvein batch --input commands.txt",
+                "tail -f commands.txt | vectorvein --format json --compact batch --stream",
+            ],
+            notes=[
+                "Lines are split like a shell command line; blank lines and lines starting with # are skipped.",
+                "Global options such as --api-key and --format apply to the whole batch and are not repeated per line.",
+                "--stream needs --format json; it prints each result as one JSON line as soon as it finishes, then a one-line total/failed summary.",
+            ],
+        ),
+    )
+    batch_parser.add_argument("--input", default="-", help="File with one command per line, or - for stdin (default: -).")
+    batch_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Emit each result immediately as newline-delimited JSON instead of collecting them into one response.",
+    )
+    set_handler(batch_parser, "batch", _cmd_batch)
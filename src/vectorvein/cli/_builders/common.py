@@ -3,10 +3,21 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Callable
 from textwrap import dedent
+from typing import Any
 
 from vectorvein.cli._parsers import _parse_bool_text
 
+_HANDLERS: dict[str, Callable[[argparse.Namespace, Any], Any]] = {}
+"""Command handlers keyed by the ``command`` string each leaf parser sets; filled as builders run."""
+
+
+def set_handler(parser: argparse.ArgumentParser, command: str, handler: Callable[[argparse.Namespace, Any], Any]) -> None:
+    """Register ``handler`` for ``command`` and tag ``parser`` so parsed args carry the command name."""
+    _HANDLERS[command] = handler
+    parser.set_defaults(command=command)
+
 
 def _format_default_value(value: bool | str) -> str:
     if isinstance(value, bool):
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import argparse
 
-from vectorvein.cli._builders.common import rich_parser_kwargs
+from vectorvein.cli._builders.common import rich_parser_kwargs, set_handler
 from vectorvein.cli._commands.file import _cmd_file_upload
 
 
@@ -35,4 +35,4 @@ def register_file_parser(top_level: argparse._SubParsersAction[argparse.Argument
         ),
     )
     file_upload.add_argument("--path", action="append", required=True, help="Local file path to upload. Repeat for multiple files.")
-    file_upload.set_defaults(handler=_cmd_file_upload, command="file upload")
+    set_handler(file_upload, "file upload", _cmd_file_upload)
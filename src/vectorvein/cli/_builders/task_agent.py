@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Callable
 
 from vectorvein.cli._builders.common import (
     add_bool_text_argument,
@@ -10,6 +11,7 @@ from vectorvein.cli._builders.common import (
     add_paging_arguments,
     add_search_argument,
     rich_parser_kwargs,
+    set_handler,
 )
 from vectorvein.cli._commands import task_agent as task_agent_cmd
 
@@ -149,13 +151,13 @@ def _register_agent_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     add_paging_arguments(agent_list)
     add_search_argument(agent_list)
     _add_agent_public_filter_arguments(agent_list)
-    agent_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_agent_list, command="task-agent agent list")
+    set_handler(agent_list, "task-agent agent list", task_agent_cmd._cmd_task_agent_agent_list)
 
     agent_get = agent_sub.add_parser(
         "get", help="Get one saved agent by ID.", **rich_parser_kwargs("Fetch one agent by ID.", examples=["vectorvein task-agent agent get --agent-id agent_xxx"])
     )
     agent_get.add_argument("--agent-id", required=True, help="Agent ID.")
-    agent_get.set_defaults(handler=task_agent_cmd._cmd_task_agent_agent_get, command="task-agent agent get")
+    set_handler(agent_get, "task-agent agent get", task_agent_cmd._cmd_task_agent_agent_get)
 
     agent_create = agent_sub.add_parser(
         "create",
@@ -173,7 +175,7 @@ def _register_agent_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
         ),
     )
     _add_agent_create_update_arguments(agent_create, include_agent_id=False)
-    agent_create.set_defaults(handler=task_agent_cmd._cmd_task_agent_agent_create, command="task-agent agent create")
+    set_handler(agent_create, "task-agent agent create", task_agent_cmd._cmd_task_agent_agent_create)
 
     agent_update = agent_sub.add_parser(
         "update",
@@ -185,13 +187,13 @@ def _register_agent_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
         ),
     )
     _add_agent_create_update_arguments(agent_update, include_agent_id=True)
-    agent_update.set_defaults(handler=task_agent_cmd._cmd_task_agent_agent_update, command="task-agent agent update")
+    set_handler(agent_update, "task-agent agent update", task_agent_cmd._cmd_task_agent_agent_update)
 
     agent_delete = agent_sub.add_parser(
         "delete", help="Delete a saved agent.", **rich_parser_kwargs("Delete a saved agent by ID.", examples=["vectorvein task-agent agent delete --agent-id agent_xxx"])
     )
     agent_delete.add_argument("--agent-id", required=True, help="Agent ID.")
-    agent_delete.set_defaults(handler=task_agent_cmd._cmd_task_agent_agent_delete, command="task-agent agent delete")
+    set_handler(agent_delete, "task-agent agent delete", task_agent_cmd._cmd_task_agent_agent_delete)
 
     agent_search = agent_sub.add_parser(
         "search",
@@ -204,7 +206,7 @@ def _register_agent_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     agent_search.add_argument("--query", required=True, help="Search keyword.")
     add_paging_arguments(agent_search)
     _add_agent_public_filter_arguments(agent_search)
-    agent_search.set_defaults(handler=task_agent_cmd._cmd_task_agent_agent_search, command="task-agent agent search")
+    set_handler(agent_search, "task-agent agent search", task_agent_cmd._cmd_task_agent_agent_search)
 
     agent_favorite_list = agent_sub.add_parser(
         "favorite-list",
@@ -214,7 +216,7 @@ def _register_agent_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     add_paging_arguments(agent_favorite_list)
     add_search_argument(agent_favorite_list)
     agent_favorite_list.add_argument("--tag-ids", help=_json_array_help("favorite tag IDs"))
-    agent_favorite_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_agent_favorite_list, command="task-agent agent favorite-list")
+    set_handler(agent_favorite_list, "task-agent agent favorite-list", task_agent_cmd._cmd_task_agent_agent_favorite_list)
 
     agent_duplicate = agent_sub.add_parser(
         "duplicate",
@@ -223,7 +225,7 @@ def _register_agent_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     )
     agent_duplicate.add_argument("--agent-id", required=True, help="Source agent ID.")
     add_bool_text_argument(agent_duplicate, "--add-templates", help_text="Whether to add related templates during duplication.")
-    agent_duplicate.set_defaults(handler=task_agent_cmd._cmd_task_agent_agent_duplicate, command="task-agent agent duplicate")
+    set_handler(agent_duplicate, "task-agent agent duplicate", task_agent_cmd._cmd_task_agent_agent_duplicate)
 
     agent_toggle_favorite = agent_sub.add_parser(
         "toggle-favorite",
@@ -232,7 +234,7 @@ def _register_agent_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     )
     agent_toggle_favorite.add_argument("--agent-id", required=True, help="Agent ID.")
     add_bool_text_argument(agent_toggle_favorite, "--is-favorited", help_text="Target favorite state.")
-    agent_toggle_favorite.set_defaults(handler=task_agent_cmd._cmd_task_agent_agent_toggle_favorite, command="task-agent agent toggle-favorite")
+    set_handler(agent_toggle_favorite, "task-agent agent toggle-favorite", task_agent_cmd._cmd_task_agent_agent_toggle_favorite)
 
     agent_update_prompt = agent_sub.add_parser(
         "update-system-prompt",
@@ -245,7 +247,7 @@ def _register_agent_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     agent_update_prompt.add_argument("--agent-id", required=True, help="Agent ID.")
     agent_update_prompt.add_argument("--system-prompt", required=True, help="New system prompt.")
     agent_update_prompt.add_argument("--optimization-task-id", help="Prompt optimization task ID.")
-    agent_update_prompt.set_defaults(handler=task_agent_cmd._cmd_task_agent_agent_update_system_prompt, command="task-agent agent update-system-prompt")
+    set_handler(agent_update_prompt, "task-agent agent update-system-prompt", task_agent_cmd._cmd_task_agent_agent_update_system_prompt)
 
     agent_create_optimized = agent_sub.add_parser(
         "create-optimized",
@@ -259,7 +261,7 @@ def _register_agent_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     agent_create_optimized.add_argument("--system-prompt", required=True, help="Optimized system prompt.")
     agent_create_optimized.add_argument("--name", help="New optimized agent name.")
     agent_create_optimized.add_argument("--optimization-task-id", help="Prompt optimization task ID.")
-    agent_create_optimized.set_defaults(handler=task_agent_cmd._cmd_task_agent_agent_create_optimized, command="task-agent agent create-optimized")
+    set_handler(agent_create_optimized, "task-agent agent create-optimized", task_agent_cmd._cmd_task_agent_agent_create_optimized)
 
 
 def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -289,13 +291,13 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     task_list.add_argument("--status", action="append", help="Task status filter. Repeat to pass multiple values.")
     task_list.add_argument("--agent-id", help="Filter tasks by agent ID.")
     add_search_argument(task_list)
-    task_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_list, command="task-agent task list")
+    set_handler(task_list, "task-agent task list", task_agent_cmd._cmd_task_agent_task_list)
 
     task_get = task_sub.add_parser(
         "get", help="Get one task by ID.", **rich_parser_kwargs("Fetch one agent task by task ID.", examples=["vectorvein task-agent task get --task-id task_xxx"])
     )
     task_get.add_argument("--task-id", required=True, help="Task ID.")
-    task_get.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_get, command="task-agent task get")
+    set_handler(task_get, "task-agent task get", task_agent_cmd._cmd_task_agent_task_get)
 
     task_wait = task_sub.add_parser(
         "wait",
@@ -308,7 +310,7 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     )
     task_wait.add_argument("--task-id", required=True, help="Task ID.")
     task_wait.add_argument("--timeout", type=int, default=600, help="Timeout in seconds (default: 600).")
-    task_wait.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_wait, command="task-agent task wait")
+    set_handler(task_wait, "task-agent task wait", task_agent_cmd._cmd_task_agent_task_wait)
 
     task_create = task_sub.add_parser(
         "create",
@@ -345,7 +347,7 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     task_create.add_argument("--agent-settings", help=_json_object_help("AgentSettings"))
     task_create.add_argument("--wait", action="store_true", help="Wait until the task finishes, fails, or asks a question.")
     task_create.add_argument("--timeout", type=int, default=600, help="Timeout in seconds when --wait is set (default: 600).")
-    task_create.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_create, command="task-agent task create")
+    set_handler(task_create, "task-agent task create", task_agent_cmd._cmd_task_agent_task_create)
 
     task_continue = task_sub.add_parser(
         "continue",
@@ -360,13 +362,13 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     _add_attachment_arguments(task_continue, allow_oss_key=False)
     task_continue.add_argument("--wait", action="store_true", help="Wait until the task finishes, fails, or asks another question.")
     task_continue.add_argument("--timeout", type=int, default=600, help="Timeout in seconds when --wait is set (default: 600).")
-    task_continue.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_continue, command="task-agent task continue")
+    set_handler(task_continue, "task-agent task continue", task_agent_cmd._cmd_task_agent_task_continue)
 
     task_pause = task_sub.add_parser(
         "pause", help="Pause a running task.", **rich_parser_kwargs("Pause a running task.", examples=["vectorvein task-agent task pause --task-id task_xxx"])
     )
     task_pause.add_argument("--task-id", required=True, help="Task ID.")
-    task_pause.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_pause, command="task-agent task pause")
+    set_handler(task_pause, "task-agent task pause", task_agent_cmd._cmd_task_agent_task_pause)
 
     task_resume = task_sub.add_parser(
         "resume",
@@ -381,7 +383,7 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     _add_attachment_arguments(task_resume, allow_oss_key=False)
     task_resume.add_argument("--wait", action="store_true", help="Wait until the task finishes, fails, or asks another question.")
     task_resume.add_argument("--timeout", type=int, default=600, help="Timeout in seconds when --wait is set (default: 600).")
-    task_resume.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_resume, command="task-agent task resume")
+    set_handler(task_resume, "task-agent task resume", task_agent_cmd._cmd_task_agent_task_resume)
 
     task_respond = task_sub.add_parser(
         "respond",
@@ -396,13 +398,13 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     task_respond.add_argument("--response", required=True, help="Human response content or @file.")
     task_respond.add_argument("--wait", action="store_true", help="Wait until the task finishes, fails, or asks another question.")
     task_respond.add_argument("--timeout", type=int, default=600, help="Timeout in seconds when --wait is set (default: 600).")
-    task_respond.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_respond, command="task-agent task respond")
+    set_handler(task_respond, "task-agent task respond", task_agent_cmd._cmd_task_agent_task_respond)
 
     task_delete = task_sub.add_parser(
         "delete", help="Delete a task.", **rich_parser_kwargs("Delete a task by task ID.", examples=["vectorvein task-agent task delete --task-id task_xxx"])
     )
     task_delete.add_argument("--task-id", required=True, help="Task ID.")
-    task_delete.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_delete, command="task-agent task delete")
+    set_handler(task_delete, "task-agent task delete", task_agent_cmd._cmd_task_agent_task_delete)
 
     task_search = task_sub.add_parser(
         "search", help="Search tasks by keyword.", **rich_parser_kwargs("Search agent tasks by keyword.", examples=["vectorvein task-agent task search --query summary"])
@@ -411,7 +413,7 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     add_paging_arguments(task_search)
     task_search.add_argument("--status", action="append", help="Task status filter. Repeat for multiple values.")
     task_search.add_argument("--agent-id", help="Filter by agent ID.")
-    task_search.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_search, command="task-agent task search")
+    set_handler(task_search, "task-agent task search", task_agent_cmd._cmd_task_agent_task_search)
 
     task_update_share = task_sub.add_parser(
         "update-share",
@@ -425,13 +427,13 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     add_bool_text_argument(task_update_share, "--shared", help_text="Whether the task is shared.")
     add_bool_text_argument(task_update_share, "--is-public", help_text="Whether the shared task is public.")
     task_update_share.add_argument("--shared-meta", help=_json_object_help("shared_meta"))
-    task_update_share.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_update_share, command="task-agent task update-share")
+    set_handler(task_update_share, "task-agent task update-share", task_agent_cmd._cmd_task_agent_task_update_share)
 
     task_get_shared = task_sub.add_parser(
         "get-shared", help="Get a shared task.", **rich_parser_kwargs("Fetch a shared task by task ID.", examples=["vectorvein task-agent task get-shared --task-id task_xxx"])
     )
     task_get_shared.add_argument("--task-id", required=True, help="Task ID.")
-    task_get_shared.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_get_shared, command="task-agent task get-shared")
+    set_handler(task_get_shared, "task-agent task get-shared", task_agent_cmd._cmd_task_agent_task_get_shared)
 
     task_public_shared_list = task_sub.add_parser(
         "public-shared-list",
@@ -442,7 +444,7 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     add_search_argument(task_public_shared_list)
     task_public_shared_list.add_argument("--sort-field", default="update_time", help="Sort field (default: update_time).")
     task_public_shared_list.add_argument("--sort-order", choices=("ascend", "descend"), default="descend", help="Sort order (default: descend).")
-    task_public_shared_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_public_shared_list, command="task-agent task public-shared-list")
+    set_handler(task_public_shared_list, "task-agent task public-shared-list", task_agent_cmd._cmd_task_agent_task_public_shared_list)
 
     task_batch_delete = task_sub.add_parser(
         "batch-delete",
@@ -450,7 +452,7 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
         **rich_parser_kwargs("Delete multiple tasks with one request.", examples=['vectorvein task-agent task batch-delete --task-ids \'["task_1","task_2"]\'']),
     )
     task_batch_delete.add_argument("--task-ids", required=True, help=_json_array_help("task IDs"))
-    task_batch_delete.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_batch_delete, command="task-agent task batch-delete")
+    set_handler(task_batch_delete, "task-agent task batch-delete", task_agent_cmd._cmd_task_agent_task_batch_delete)
 
     task_add_pending = task_sub.add_parser(
         "add-pending-message",
@@ -463,7 +465,7 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     task_add_pending.add_argument("--message", required=True, help="Pending human message or @file.")
     task_add_pending.add_argument("--action-type", help="Optional action type label.")
     _add_attachment_arguments(task_add_pending, allow_oss_key=False)
-    task_add_pending.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_add_pending_message, command="task-agent task add-pending-message")
+    set_handler(task_add_pending, "task-agent task add-pending-message", task_agent_cmd._cmd_task_agent_task_add_pending_message)
 
     task_toggle_hidden = task_sub.add_parser(
         "toggle-hidden",
@@ -472,7 +474,7 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     )
     task_toggle_hidden.add_argument("--task-id", required=True, help="Task ID.")
     add_bool_text_argument(task_toggle_hidden, "--is-hidden", help_text="Target hidden state.")
-    task_toggle_hidden.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_toggle_hidden, command="task-agent task toggle-hidden")
+    set_handler(task_toggle_hidden, "task-agent task toggle-hidden", task_agent_cmd._cmd_task_agent_task_toggle_hidden)
 
     task_toggle_favorite = task_sub.add_parser(
         "toggle-favorite",
@@ -481,7 +483,7 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     )
     task_toggle_favorite.add_argument("--task-id", required=True, help="Task ID.")
     add_bool_text_argument(task_toggle_favorite, "--is-favorited", help_text="Target favorite state.")
-    task_toggle_favorite.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_toggle_favorite, command="task-agent task toggle-favorite")
+    set_handler(task_toggle_favorite, "task-agent task toggle-favorite", task_agent_cmd._cmd_task_agent_task_toggle_favorite)
 
     task_prompt_opt = task_sub.add_parser(
         "start-prompt-optimization",
@@ -493,21 +495,21 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
     )
     task_prompt_opt.add_argument("--task-id", required=True, help="Task ID.")
     task_prompt_opt.add_argument("--optimization-direction", required=True, help="Prompt optimization goal or direction or @file.")
-    task_prompt_opt.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_start_prompt_optimization, command="task-agent task start-prompt-optimization")
+    set_handler(task_prompt_opt, "task-agent task start-prompt-optimization", task_agent_cmd._cmd_task_agent_task_start_prompt_optimization)
 
     task_prompt_config = task_sub.add_parser(
         "prompt-optimizer-config",
         help="Get prompt optimizer configuration.",
         **rich_parser_kwargs("Fetch prompt optimizer configuration.", examples=["vectorvein task-agent task prompt-optimizer-config"]),
     )
-    task_prompt_config.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_prompt_optimizer_config, command="task-agent task prompt-optimizer-config")
+    set_handler(task_prompt_config, "task-agent task prompt-optimizer-config", task_agent_cmd._cmd_task_agent_task_prompt_optimizer_config)
 
     task_pod_settings = task_sub.add_parser(
         "computer-pod-settings",
         help="List computer pod settings.",
         **rich_parser_kwargs("List available computer pod settings for computer-type agents.", examples=["vectorvein task-agent task computer-pod-settings"]),
     )
-    task_pod_settings.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_computer_pod_settings, command="task-agent task computer-pod-settings")
+    set_handler(task_pod_settings, "task-agent task computer-pod-settings", task_agent_cmd._cmd_task_agent_task_computer_pod_settings)
 
     task_close_computer = task_sub.add_parser(
         "close-computer-environment",
@@ -515,7 +517,7 @@ def _register_task_group(task_agent_sub: argparse._SubParsersAction[argparse.Arg
         **rich_parser_kwargs("Close the computer environment associated with a task.", examples=["vectorvein task-agent task close-computer-environment --task-id task_xxx"]),
     )
     task_close_computer.add_argument("--task-id", required=True, help="Task ID.")
-    task_close_computer.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_close_computer_environment, command="task-agent task close-computer-environment")
+    set_handler(task_close_computer, "task-agent task close-computer-environment", task_agent_cmd._cmd_task_agent_task_close_computer_environment)
 
 
 def _register_cycle_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -540,13 +542,13 @@ def _register_cycle_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     )
     cycle_list.add_argument("--task-id", required=True, help="Task ID.")
     cycle_list.add_argument("--offset", type=int, default=0, help="Cycle index offset (default: 0).")
-    cycle_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_cycle_list, command="task-agent cycle list")
+    set_handler(cycle_list, "task-agent cycle list", task_agent_cmd._cmd_task_agent_cycle_list)
 
     cycle_get = cycle_sub.add_parser(
         "get", help="Get one cycle by ID.", **rich_parser_kwargs("Fetch one reasoning cycle by cycle ID.", examples=["vectorvein task-agent cycle get --cycle-id cycle_xxx"])
     )
     cycle_get.add_argument("--cycle-id", required=True, help="Cycle ID.")
-    cycle_get.set_defaults(handler=task_agent_cmd._cmd_task_agent_cycle_get, command="task-agent cycle get")
+    set_handler(cycle_get, "task-agent cycle get", task_agent_cmd._cmd_task_agent_cycle_get)
 
     cycle_run_workflow = cycle_sub.add_parser(
         "run-workflow",
@@ -560,7 +562,7 @@ def _register_cycle_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     cycle_run_workflow.add_argument("--cycle-id", required=True, help="Cycle ID.")
     cycle_run_workflow.add_argument("--tool-name", required=True, help="Tool name.")
     cycle_run_workflow.add_argument("--workflow-inputs", help=_json_object_help("workflow input payload"))
-    cycle_run_workflow.set_defaults(handler=task_agent_cmd._cmd_task_agent_cycle_run_workflow, command="task-agent cycle run-workflow")
+    set_handler(cycle_run_workflow, "task-agent cycle run-workflow", task_agent_cmd._cmd_task_agent_cycle_run_workflow)
 
     cycle_check = cycle_sub.add_parser(
         "check-workflow-status",
@@ -568,7 +570,7 @@ def _register_cycle_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
         **rich_parser_kwargs("Check status for a workflow triggered from a task-agent cycle.", examples=["vectorvein task-agent cycle check-workflow-status --rid rid_xxx"]),
     )
     cycle_check.add_argument("--rid", required=True, help="Workflow run record ID.")
-    cycle_check.set_defaults(handler=task_agent_cmd._cmd_task_agent_cycle_check_workflow_status, command="task-agent cycle check-workflow-status")
+    set_handler(cycle_check, "task-agent cycle check-workflow-status", task_agent_cmd._cmd_task_agent_cycle_check_workflow_status)
 
     cycle_finish = cycle_sub.add_parser(
         "finish-task",
@@ -579,7 +581,7 @@ def _register_cycle_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     )
     cycle_finish.add_argument("--cycle-id", required=True, help="Cycle ID.")
     cycle_finish.add_argument("--message", default="任务已完成", help="Finish message or @file (default: 任务已完成).")
-    cycle_finish.set_defaults(handler=task_agent_cmd._cmd_task_agent_cycle_finish_task, command="task-agent cycle finish-task")
+    set_handler(cycle_finish, "task-agent cycle finish-task", task_agent_cmd._cmd_task_agent_cycle_finish_task)
 
     cycle_replay = cycle_sub.add_parser(
         "replay",
@@ -591,7 +593,7 @@ def _register_cycle_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     cycle_replay.add_argument("--task-id", required=True, help="Task ID.")
     cycle_replay.add_argument("--start-index", type=int, default=0, help="Replay start cycle index (default: 0).")
     cycle_replay.add_argument("--end-index", type=int, help="Replay end cycle index.")
-    cycle_replay.set_defaults(handler=task_agent_cmd._cmd_task_agent_cycle_replay, command="task-agent cycle replay")
+    set_handler(cycle_replay, "task-agent cycle replay", task_agent_cmd._cmd_task_agent_cycle_replay)
 
     cycle_replay_summary = cycle_sub.add_parser(
         "replay-summary",
@@ -599,7 +601,7 @@ def _register_cycle_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
         **rich_parser_kwargs("Fetch replay summary statistics for a task.", examples=["vectorvein task-agent cycle replay-summary --task-id task_xxx"]),
     )
     cycle_replay_summary.add_argument("--task-id", required=True, help="Task ID.")
-    cycle_replay_summary.set_defaults(handler=task_agent_cmd._cmd_task_agent_cycle_replay_summary, command="task-agent cycle replay-summary")
+    set_handler(cycle_replay_summary, "task-agent cycle replay-summary", task_agent_cmd._cmd_task_agent_cycle_replay_summary)
 
 
 def _register_tag_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -616,13 +618,13 @@ def _register_tag_group(task_agent_sub: argparse._SubParsersAction[argparse.Argu
     )
     tag_create.add_argument("--title", required=True, help="Tag title.")
     tag_create.add_argument("--color", help="Tag color string.")
-    tag_create.set_defaults(handler=task_agent_cmd._cmd_task_agent_tag_create, command="task-agent tag create")
+    set_handler(tag_create, "task-agent tag create", task_agent_cmd._cmd_task_agent_tag_create)
 
     tag_delete = tag_sub.add_parser(
         "delete", help="Delete a tag.", **rich_parser_kwargs("Delete an agent tag by ID.", examples=["vectorvein task-agent tag delete --tag-id tag_xxx"])
     )
     tag_delete.add_argument("--tag-id", required=True, help="Tag ID.")
-    tag_delete.set_defaults(handler=task_agent_cmd._cmd_task_agent_tag_delete, command="task-agent tag delete")
+    set_handler(tag_delete, "task-agent tag delete", task_agent_cmd._cmd_task_agent_tag_delete)
 
     tag_list = tag_sub.add_parser(
         "list",
@@ -635,7 +637,7 @@ def _register_tag_group(task_agent_sub: argparse._SubParsersAction[argparse.Argu
     add_search_argument(tag_list)
     add_bool_text_argument(tag_list, "--public-only", help_text="Whether to limit results to public tags.")
     add_json_data_argument(tag_list)
-    tag_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_tag_list, command="task-agent tag list")
+    set_handler(tag_list, "task-agent tag list", task_agent_cmd._cmd_task_agent_tag_list)
 
     tag_update = tag_sub.add_parser(
         "update",
@@ -645,13 +647,13 @@ def _register_tag_group(task_agent_sub: argparse._SubParsersAction[argparse.Argu
         ),
     )
     tag_update.add_argument("--data", required=True, help="JSON array or @file containing tag update objects.")
-    tag_update.set_defaults(handler=task_agent_cmd._cmd_task_agent_tag_update, command="task-agent tag update")
+    set_handler(tag_update, "task-agent tag update", task_agent_cmd._cmd_task_agent_tag_update)
 
     tag_search = tag_sub.add_parser(
         "search", help="Search tags by title.", **rich_parser_kwargs("Search agent tags by title.", examples=["vectorvein task-agent tag search --title Office"])
     )
     tag_search.add_argument("--title", required=True, help="Tag title keyword.")
-    tag_search.set_defaults(handler=task_agent_cmd._cmd_task_agent_tag_search, command="task-agent tag search")
+    set_handler(tag_search, "task-agent tag search", task_agent_cmd._cmd_task_agent_tag_search)
 
 
 def _register_collection_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -669,7 +671,7 @@ def _register_collection_group(task_agent_sub: argparse._SubParsersAction[argpar
     ]:
         parser = collection_sub.add_parser(name, help=help_text, **rich_parser_kwargs(help_text, examples=[f"vectorvein {command} --collection-id collection_xxx"]))
         parser.add_argument("--collection-id", required=True, help="Collection ID.")
-        parser.set_defaults(handler=handler, command=command)
+        set_handler(parser, command, handler)
 
     collection_create = collection_sub.add_parser(
         "create",
@@ -685,14 +687,14 @@ def _register_collection_group(task_agent_sub: argparse._SubParsersAction[argpar
     add_bool_text_argument(collection_create, "--shared", help_text="Whether the collection is shared.")
     add_bool_text_argument(collection_create, "--is-public", help_text="Whether the collection is public.")
     add_json_data_argument(collection_create)
-    collection_create.set_defaults(handler=task_agent_cmd._cmd_task_agent_collection_create, command="task-agent collection create")
+    set_handler(collection_create, "task-agent collection create", task_agent_cmd._cmd_task_agent_collection_create)
 
     collection_list = collection_sub.add_parser(
         "list", help="List your collections.", **rich_parser_kwargs("List your agent collections.", examples=["vectorvein task-agent collection list --search docs"])
     )
     add_paging_arguments(collection_list)
     add_search_argument(collection_list)
-    collection_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_collection_list, command="task-agent collection list")
+    set_handler(collection_list, "task-agent collection list", task_agent_cmd._cmd_task_agent_collection_list)
 
     collection_public_list = collection_sub.add_parser(
         "public-list",
@@ -701,7 +703,7 @@ def _register_collection_group(task_agent_sub: argparse._SubParsersAction[argpar
     )
     add_paging_arguments(collection_public_list)
     add_search_argument(collection_public_list)
-    collection_public_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_collection_public_list, command="task-agent collection public-list")
+    set_handler(collection_public_list, "task-agent collection public-list", task_agent_cmd._cmd_task_agent_collection_public_list)
 
     collection_update = collection_sub.add_parser(
         "update",
@@ -717,7 +719,7 @@ def _register_collection_group(task_agent_sub: argparse._SubParsersAction[argpar
     add_bool_text_argument(collection_update, "--shared", help_text="Whether the collection is shared.")
     add_bool_text_argument(collection_update, "--is-public", help_text="Whether the collection is public.")
     add_json_data_argument(collection_update)
-    collection_update.set_defaults(handler=task_agent_cmd._cmd_task_agent_collection_update, command="task-agent collection update")
+    set_handler(collection_update, "task-agent collection update", task_agent_cmd._cmd_task_agent_collection_update)
 
     collection_add_agent = collection_sub.add_parser(
         "add-agent",
@@ -726,7 +728,7 @@ def _register_collection_group(task_agent_sub: argparse._SubParsersAction[argpar
     )
     collection_add_agent.add_argument("--collection-id", required=True, help="Collection ID.")
     collection_add_agent.add_argument("--agent-id", required=True, help="Agent ID.")
-    collection_add_agent.set_defaults(handler=task_agent_cmd._cmd_task_agent_collection_add_agent, command="task-agent collection add-agent")
+    set_handler(collection_add_agent, "task-agent collection add-agent", task_agent_cmd._cmd_task_agent_collection_add_agent)
 
     collection_remove_agent = collection_sub.add_parser(
         "remove-agent",
@@ -735,7 +737,7 @@ def _register_collection_group(task_agent_sub: argparse._SubParsersAction[argpar
     )
     collection_remove_agent.add_argument("--collection-id", required=True, help="Collection ID.")
     collection_remove_agent.add_argument("--agent-id", required=True, help="Agent ID.")
-    collection_remove_agent.set_defaults(handler=task_agent_cmd._cmd_task_agent_collection_remove_agent, command="task-agent collection remove-agent")
+    set_handler(collection_remove_agent, "task-agent collection remove-agent", task_agent_cmd._cmd_task_agent_collection_remove_agent)
 
 
 def _register_mcp_server_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -753,7 +755,7 @@ def _register_mcp_server_group(task_agent_sub: argparse._SubParsersAction[argpar
     add_paging_arguments(mcp_list)
     add_search_argument(mcp_list)
     add_json_data_argument(mcp_list)
-    mcp_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_server_list, command="task-agent mcp-server list")
+    set_handler(mcp_list, "task-agent mcp-server list", task_agent_cmd._cmd_task_agent_mcp_server_list)
 
     def _add_mcp_server_payload_args(parser: argparse.ArgumentParser) -> None:
         parser.add_argument("--name", help="Server display name.")
@@ -770,13 +772,13 @@ def _register_mcp_server_group(task_agent_sub: argparse._SubParsersAction[argpar
         **rich_parser_kwargs("Create an MCP server registration.", examples=["vectorvein task-agent mcp-server create --name docs --server-url https://example.com"]),
     )
     _add_mcp_server_payload_args(mcp_create)
-    mcp_create.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_server_create, command="task-agent mcp-server create")
+    set_handler(mcp_create, "task-agent mcp-server create", task_agent_cmd._cmd_task_agent_mcp_server_create)
 
     mcp_get = mcp_server_sub.add_parser(
         "get", help="Get an MCP server.", **rich_parser_kwargs("Fetch one MCP server by ID.", examples=["vectorvein task-agent mcp-server get --server-id server_xxx"])
     )
     mcp_get.add_argument("--server-id", required=True, help="Server ID.")
-    mcp_get.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_server_get, command="task-agent mcp-server get")
+    set_handler(mcp_get, "task-agent mcp-server get", task_agent_cmd._cmd_task_agent_mcp_server_get)
 
     mcp_update = mcp_server_sub.add_parser(
         "update",
@@ -785,7 +787,7 @@ def _register_mcp_server_group(task_agent_sub: argparse._SubParsersAction[argpar
     )
     mcp_update.add_argument("--server-id", required=True, help="Server ID.")
     _add_mcp_server_payload_args(mcp_update)
-    mcp_update.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_server_update, command="task-agent mcp-server update")
+    set_handler(mcp_update, "task-agent mcp-server update", task_agent_cmd._cmd_task_agent_mcp_server_update)
 
     mcp_delete = mcp_server_sub.add_parser(
         "delete",
@@ -793,7 +795,7 @@ def _register_mcp_server_group(task_agent_sub: argparse._SubParsersAction[argpar
         **rich_parser_kwargs("Delete an MCP server registration.", examples=["vectorvein task-agent mcp-server delete --server-id server_xxx"]),
     )
     mcp_delete.add_argument("--server-id", required=True, help="Server ID.")
-    mcp_delete.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_server_delete, command="task-agent mcp-server delete")
+    set_handler(mcp_delete, "task-agent mcp-server delete", task_agent_cmd._cmd_task_agent_mcp_server_delete)
 
     mcp_test = mcp_server_sub.add_parser(
         "test-connection",
@@ -805,7 +807,7 @@ def _register_mcp_server_group(task_agent_sub: argparse._SubParsersAction[argpar
         ),
     )
     _add_mcp_server_payload_args(mcp_test)
-    mcp_test.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_server_test_connection, command="task-agent mcp-server test-connection")
+    set_handler(mcp_test, "task-agent mcp-server test-connection", task_agent_cmd._cmd_task_agent_mcp_server_test_connection)
 
     mcp_test_existing = mcp_server_sub.add_parser(
         "test-existing-server",
@@ -813,7 +815,7 @@ def _register_mcp_server_group(task_agent_sub: argparse._SubParsersAction[argpar
         **rich_parser_kwargs("Test a saved MCP server registration by ID.", examples=["vectorvein task-agent mcp-server test-existing-server --server-id server_xxx"]),
     )
     mcp_test_existing.add_argument("--server-id", required=True, help="Server ID.")
-    mcp_test_existing.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_server_test_existing, command="task-agent mcp-server test-existing-server")
+    set_handler(mcp_test_existing, "task-agent mcp-server test-existing-server", task_agent_cmd._cmd_task_agent_mcp_server_test_existing)
 
 
 def _register_mcp_tool_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -832,7 +834,7 @@ def _register_mcp_tool_group(task_agent_sub: argparse._SubParsersAction[argparse
     add_search_argument(mcp_tool_list)
     mcp_tool_list.add_argument("--server-id", help="Filter by MCP server ID.")
     add_json_data_argument(mcp_tool_list)
-    mcp_tool_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_tool_list, command="task-agent mcp-tool list")
+    set_handler(mcp_tool_list, "task-agent mcp-tool list", task_agent_cmd._cmd_task_agent_mcp_tool_list)
 
     def _add_mcp_tool_payload_args(parser: argparse.ArgumentParser) -> None:
         parser.add_argument("--tool-name", help="Tool name.")
@@ -847,13 +849,13 @@ def _register_mcp_tool_group(task_agent_sub: argparse._SubParsersAction[argparse
         **rich_parser_kwargs("Create an MCP tool registration.", examples=["vectorvein task-agent mcp-tool create --tool-name docs-search --server-id server_xxx"]),
     )
     _add_mcp_tool_payload_args(mcp_tool_create)
-    mcp_tool_create.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_tool_create, command="task-agent mcp-tool create")
+    set_handler(mcp_tool_create, "task-agent mcp-tool create", task_agent_cmd._cmd_task_agent_mcp_tool_create)
 
     mcp_tool_get = mcp_tool_sub.add_parser(
         "get", help="Get an MCP tool.", **rich_parser_kwargs("Fetch one MCP tool by ID.", examples=["vectorvein task-agent mcp-tool get --tool-id tool_xxx"])
     )
     mcp_tool_get.add_argument("--tool-id", required=True, help="Tool ID.")
-    mcp_tool_get.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_tool_get, command="task-agent mcp-tool get")
+    set_handler(mcp_tool_get, "task-agent mcp-tool get", task_agent_cmd._cmd_task_agent_mcp_tool_get)
 
     mcp_tool_update = mcp_tool_sub.add_parser(
         "update",
@@ -862,13 +864,13 @@ def _register_mcp_tool_group(task_agent_sub: argparse._SubParsersAction[argparse
     )
     mcp_tool_update.add_argument("--tool-id", required=True, help="Tool ID.")
     _add_mcp_tool_payload_args(mcp_tool_update)
-    mcp_tool_update.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_tool_update, command="task-agent mcp-tool update")
+    set_handler(mcp_tool_update, "task-agent mcp-tool update", task_agent_cmd._cmd_task_agent_mcp_tool_update)
 
     mcp_tool_delete = mcp_tool_sub.add_parser(
         "delete", help="Delete an MCP tool.", **rich_parser_kwargs("Delete an MCP tool registration.", examples=["vectorvein task-agent mcp-tool delete --tool-id tool_xxx"])
     )
     mcp_tool_delete.add_argument("--tool-id", required=True, help="Tool ID.")
-    mcp_tool_delete.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_tool_delete, command="task-agent mcp-tool delete")
+    set_handler(mcp_tool_delete, "task-agent mcp-tool delete", task_agent_cmd._cmd_task_agent_mcp_tool_delete)
 
     mcp_tool_logs = mcp_tool_sub.add_parser(
         "logs",
@@ -877,7 +879,7 @@ def _register_mcp_tool_group(task_agent_sub: argparse._SubParsersAction[argparse
     )
     mcp_tool_logs.add_argument("--tool-id", required=True, help="Tool ID.")
     add_paging_arguments(mcp_tool_logs, default_page_size=20)
-    mcp_tool_logs.set_defaults(handler=task_agent_cmd._cmd_task_agent_mcp_tool_logs, command="task-agent mcp-tool logs")
+    set_handler(mcp_tool_logs, "task-agent mcp-tool logs", task_agent_cmd._cmd_task_agent_mcp_tool_logs)
 
 
 def _register_user_memory_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -902,13 +904,13 @@ def _register_user_memory_group(task_agent_sub: argparse._SubParsersAction[argpa
         **rich_parser_kwargs("Create a user memory record.", examples=["vectorvein task-agent user-memory create --content 'Remember I prefer markdown.'"]),
     )
     _add_user_memory_payload_args(memory_create)
-    memory_create.set_defaults(handler=task_agent_cmd._cmd_task_agent_user_memory_create, command="task-agent user-memory create")
+    set_handler(memory_create, "task-agent user-memory create", task_agent_cmd._cmd_task_agent_user_memory_create)
 
     memory_get = memory_sub.add_parser(
         "get", help="Get one memory record.", **rich_parser_kwargs("Fetch one user memory record by ID.", examples=["vectorvein task-agent user-memory get --memory-id memory_xxx"])
     )
     memory_get.add_argument("--memory-id", required=True, help="Memory ID.")
-    memory_get.set_defaults(handler=task_agent_cmd._cmd_task_agent_user_memory_get, command="task-agent user-memory get")
+    set_handler(memory_get, "task-agent user-memory get", task_agent_cmd._cmd_task_agent_user_memory_get)
 
     memory_list = memory_sub.add_parser(
         "list",
@@ -919,7 +921,7 @@ def _register_user_memory_group(task_agent_sub: argparse._SubParsersAction[argpa
     memory_list.add_argument("--memory-type", help="Memory type filter.")
     add_bool_text_argument(memory_list, "--is-active", help_text="Filter by active state.")
     add_search_argument(memory_list)
-    memory_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_user_memory_list, command="task-agent user-memory list")
+    set_handler(memory_list, "task-agent user-memory list", task_agent_cmd._cmd_task_agent_user_memory_list)
 
     memory_update = memory_sub.add_parser(
         "update",
@@ -928,13 +930,13 @@ def _register_user_memory_group(task_agent_sub: argparse._SubParsersAction[argpa
     )
     memory_update.add_argument("--memory-id", required=True, help="Memory ID.")
     _add_user_memory_payload_args(memory_update)
-    memory_update.set_defaults(handler=task_agent_cmd._cmd_task_agent_user_memory_update, command="task-agent user-memory update")
+    set_handler(memory_update, "task-agent user-memory update", task_agent_cmd._cmd_task_agent_user_memory_update)
 
     memory_delete = memory_sub.add_parser(
         "delete", help="Delete a memory record.", **rich_parser_kwargs("Delete a user memory record.", examples=["vectorvein task-agent user-memory delete --memory-id memory_xxx"])
     )
     memory_delete.add_argument("--memory-id", required=True, help="Memory ID.")
-    memory_delete.set_defaults(handler=task_agent_cmd._cmd_task_agent_user_memory_delete, command="task-agent user-memory delete")
+    set_handler(memory_delete, "task-agent user-memory delete", task_agent_cmd._cmd_task_agent_user_memory_delete)
 
     memory_toggle = memory_sub.add_parser(
         "toggle",
@@ -942,12 +944,12 @@ def _register_user_memory_group(task_agent_sub: argparse._SubParsersAction[argpa
         **rich_parser_kwargs("Toggle a memory record active state.", examples=["vectorvein task-agent user-memory toggle --memory-id memory_xxx"]),
     )
     memory_toggle.add_argument("--memory-id", required=True, help="Memory ID.")
-    memory_toggle.set_defaults(handler=task_agent_cmd._cmd_task_agent_user_memory_toggle, command="task-agent user-memory toggle")
+    set_handler(memory_toggle, "task-agent user-memory toggle", task_agent_cmd._cmd_task_agent_user_memory_toggle)
 
     memory_stats = memory_sub.add_parser(
         "stats", help="Get memory statistics.", **rich_parser_kwargs("Fetch user memory statistics.", examples=["vectorvein task-agent user-memory stats"])
     )
-    memory_stats.set_defaults(handler=task_agent_cmd._cmd_task_agent_user_memory_stats, command="task-agent user-memory stats")
+    set_handler(memory_stats, "task-agent user-memory stats", task_agent_cmd._cmd_task_agent_user_memory_stats)
 
     memory_batch_delete = memory_sub.add_parser(
         "batch-delete",
@@ -955,7 +957,7 @@ def _register_user_memory_group(task_agent_sub: argparse._SubParsersAction[argpa
         **rich_parser_kwargs("Delete multiple memory records at once.", examples=['vectorvein task-agent user-memory batch-delete --memory-ids \'["memory_1","memory_2"]\'']),
     )
     memory_batch_delete.add_argument("--memory-ids", required=True, help=_json_array_help("memory IDs"))
-    memory_batch_delete.set_defaults(handler=task_agent_cmd._cmd_task_agent_user_memory_batch_delete, command="task-agent user-memory batch-delete")
+    set_handler(memory_batch_delete, "task-agent user-memory batch-delete", task_agent_cmd._cmd_task_agent_user_memory_batch_delete)
 
     memory_batch_toggle = memory_sub.add_parser(
         "batch-toggle",
@@ -966,12 +968,12 @@ def _register_user_memory_group(task_agent_sub: argparse._SubParsersAction[argpa
     )
     memory_batch_toggle.add_argument("--memory-ids", required=True, help=_json_array_help("memory IDs"))
     add_bool_text_argument(memory_batch_toggle, "--is-active", help_text="Target active state.")
-    memory_batch_toggle.set_defaults(handler=task_agent_cmd._cmd_task_agent_user_memory_batch_toggle, command="task-agent user-memory batch-toggle")
+    set_handler(memory_batch_toggle, "task-agent user-memory batch-toggle", task_agent_cmd._cmd_task_agent_user_memory_batch_toggle)
 
     memory_types = memory_sub.add_parser(
         "types", help="List supported memory types.", **rich_parser_kwargs("List supported user memory types.", examples=["vectorvein task-agent user-memory types"])
     )
-    memory_types.set_defaults(handler=task_agent_cmd._cmd_task_agent_user_memory_types, command="task-agent user-memory types")
+    set_handler(memory_types, "task-agent user-memory types", task_agent_cmd._cmd_task_agent_user_memory_types)
 
 
 def _register_skill_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -998,19 +1000,19 @@ def _register_skill_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     add_search_argument(skill_list)
     skill_list.add_argument("--category-id", help="Skill category ID filter.")
     add_json_data_argument(skill_list)
-    skill_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_list, command="task-agent skill list")
+    set_handler(skill_list, "task-agent skill list", task_agent_cmd._cmd_task_agent_skill_list)
 
     skill_my = skill_sub.add_parser(
         "my-skills", help="List your skills.", **rich_parser_kwargs("List skills created by the current user.", examples=["vectorvein task-agent skill my-skills --page-size 50"])
     )
     add_paging_arguments(skill_my, default_page_size=20)
-    skill_my.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_my_skills, command="task-agent skill my-skills")
+    set_handler(skill_my, "task-agent skill my-skills", task_agent_cmd._cmd_task_agent_skill_my_skills)
 
     skill_get = skill_sub.add_parser(
         "get", help="Get one skill.", **rich_parser_kwargs("Fetch one skill by ID.", examples=["vectorvein task-agent skill get --skill-id skill_xxx"])
     )
     skill_get.add_argument("--skill-id", required=True, help="Skill ID.")
-    skill_get.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_get, command="task-agent skill get")
+    set_handler(skill_get, "task-agent skill get", task_agent_cmd._cmd_task_agent_skill_get)
 
     skill_create = skill_sub.add_parser(
         "create",
@@ -1021,7 +1023,7 @@ def _register_skill_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
         ),
     )
     _add_skill_payload_args(skill_create)
-    skill_create.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_create, command="task-agent skill create")
+    set_handler(skill_create, "task-agent skill create", task_agent_cmd._cmd_task_agent_skill_create)
 
     skill_upload = skill_sub.add_parser(
         "upload-and-parse",
@@ -1032,7 +1034,7 @@ def _register_skill_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     )
     skill_upload.add_argument("--path", required=True, help="Local skill archive path.")
     skill_upload.add_argument("--filename", help="Filename to send to the API. Defaults to the local file name.")
-    skill_upload.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_upload_and_parse, command="task-agent skill upload-and-parse")
+    set_handler(skill_upload, "task-agent skill upload-and-parse", task_agent_cmd._cmd_task_agent_skill_upload_and_parse)
 
     skill_update = skill_sub.add_parser(
         "update",
@@ -1041,13 +1043,13 @@ def _register_skill_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     )
     skill_update.add_argument("--skill-id", required=True, help="Skill ID.")
     _add_skill_payload_args(skill_update)
-    skill_update.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_update, command="task-agent skill update")
+    set_handler(skill_update, "task-agent skill update", task_agent_cmd._cmd_task_agent_skill_update)
 
     skill_delete = skill_sub.add_parser(
         "delete", help="Delete a skill.", **rich_parser_kwargs("Delete a skill by ID.", examples=["vectorvein task-agent skill delete --skill-id skill_xxx"])
     )
     skill_delete.add_argument("--skill-id", required=True, help="Skill ID.")
-    skill_delete.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_delete, command="task-agent skill delete")
+    set_handler(skill_delete, "task-agent skill delete", task_agent_cmd._cmd_task_agent_skill_delete)
 
     skill_install = skill_sub.add_parser(
         "install",
@@ -1057,7 +1059,7 @@ def _register_skill_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     skill_install.add_argument("--skill-id", required=True, help="Skill ID.")
     skill_install.add_argument("--agent-id", help="Optional target agent ID.")
     skill_install.add_argument("--permission-level", help="Permission level.")
-    skill_install.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_install, command="task-agent skill install")
+    set_handler(skill_install, "task-agent skill install", task_agent_cmd._cmd_task_agent_skill_install)
 
     skill_uninstall = skill_sub.add_parser(
         "uninstall",
@@ -1066,7 +1068,7 @@ def _register_skill_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     )
     skill_uninstall.add_argument("--skill-id", required=True, help="Skill ID.")
     skill_uninstall.add_argument("--agent-id", help="Optional agent ID.")
-    skill_uninstall.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_uninstall, command="task-agent skill uninstall")
+    set_handler(skill_uninstall, "task-agent skill uninstall", task_agent_cmd._cmd_task_agent_skill_uninstall)
 
     skill_installed = skill_sub.add_parser(
         "installed",
@@ -1074,7 +1076,7 @@ def _register_skill_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
         **rich_parser_kwargs("List installed skills, optionally for a specific agent.", examples=["vectorvein task-agent skill installed --agent-id agent_xxx"]),
     )
     skill_installed.add_argument("--agent-id", help="Optional agent ID.")
-    skill_installed.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_installed, command="task-agent skill installed")
+    set_handler(skill_installed, "task-agent skill installed", task_agent_cmd._cmd_task_agent_skill_installed)
 
     skill_update_installation = skill_sub.add_parser(
         "update-installation",
@@ -1088,7 +1090,7 @@ def _register_skill_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     skill_update_installation.add_argument("--permission-level", help="Permission level.")
     skill_update_installation.add_argument("--metadata", help=_json_object_help("installation metadata"))
     add_json_data_argument(skill_update_installation)
-    skill_update_installation.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_update_installation, command="task-agent skill update-installation")
+    set_handler(skill_update_installation, "task-agent skill update-installation", task_agent_cmd._cmd_task_agent_skill_update_installation)
 
     skill_set_override = skill_sub.add_parser(
         "set-agent-override",
@@ -1100,7 +1102,7 @@ def _register_skill_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     skill_set_override.add_argument("--skill-id", required=True, help="Skill ID.")
     skill_set_override.add_argument("--agent-id", required=True, help="Agent ID.")
     add_bool_text_argument(skill_set_override, "--is-enabled", help_text="Whether the skill is enabled for that agent.")
-    skill_set_override.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_set_agent_override, command="task-agent skill set-agent-override")
+    set_handler(skill_set_override, "task-agent skill set-agent-override", task_agent_cmd._cmd_task_agent_skill_set_agent_override)
 
     skill_remove_override = skill_sub.add_parser(
         "remove-agent-override",
@@ -1109,12 +1111,12 @@ def _register_skill_group(task_agent_sub: argparse._SubParsersAction[argparse.Ar
     )
     skill_remove_override.add_argument("--skill-id", required=True, help="Skill ID.")
     skill_remove_override.add_argument("--agent-id", required=True, help="Agent ID.")
-    skill_remove_override.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_remove_agent_override, command="task-agent skill remove-agent-override")
+    set_handler(skill_remove_override, "task-agent skill remove-agent-override", task_agent_cmd._cmd_task_agent_skill_remove_agent_override)
 
     skill_categories = skill_sub.add_parser(
         "categories", help="List skill categories.", **rich_parser_kwargs("List available skill categories.", examples=["vectorvein task-agent skill categories"])
     )
-    skill_categories.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_categories, command="task-agent skill categories")
+    set_handler(skill_categories, "task-agent skill categories", task_agent_cmd._cmd_task_agent_skill_categories)
 
 
 def _add_eval_dataset_payload_arguments(parser: argparse.ArgumentParser, *, include_dataset_id: bool) -> None:
@@ -1157,7 +1159,7 @@ def _register_eval_dataset_group(task_agent_sub: argparse._SubParsersAction[argp
     add_paging_arguments(list_cmd, default_page_size=20)
     add_search_argument(list_cmd)
     add_json_data_argument(list_cmd)
-    list_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_dataset_list, command="task-agent eval-dataset list")
+    set_handler(list_cmd, "task-agent eval-dataset list", task_agent_cmd._cmd_task_agent_eval_dataset_list)
 
     get_cmd = sub.add_parser(
         "get",
@@ -1165,7 +1167,7 @@ def _register_eval_dataset_group(task_agent_sub: argparse._SubParsersAction[argp
         **rich_parser_kwargs("Fetch one evaluation dataset by ID.", examples=["vectorvein task-agent eval-dataset get --dataset-id dataset_xxx"]),
     )
     get_cmd.add_argument("--dataset-id", required=True, help="Evaluation dataset ID.")
-    get_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_dataset_get, command="task-agent eval-dataset get")
+    set_handler(get_cmd, "task-agent eval-dataset get", task_agent_cmd._cmd_task_agent_eval_dataset_get)
 
     create_cmd = sub.add_parser(
         "create",
@@ -1176,7 +1178,7 @@ def _register_eval_dataset_group(task_agent_sub: argparse._SubParsersAction[argp
         ),
     )
     _add_eval_dataset_payload_arguments(create_cmd, include_dataset_id=False)
-    create_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_dataset_create, command="task-agent eval-dataset create")
+    set_handler(create_cmd, "task-agent eval-dataset create", task_agent_cmd._cmd_task_agent_eval_dataset_create)
 
     update_cmd = sub.add_parser(
         "update",
@@ -1184,7 +1186,7 @@ def _register_eval_dataset_group(task_agent_sub: argparse._SubParsersAction[argp
         **rich_parser_kwargs("Update selected dataset fields.", examples=["vectorvein task-agent eval-dataset update --dataset-id dataset_xxx --description @desc.md"]),
     )
     _add_eval_dataset_payload_arguments(update_cmd, include_dataset_id=True)
-    update_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_dataset_update, command="task-agent eval-dataset update")
+    set_handler(update_cmd, "task-agent eval-dataset update", task_agent_cmd._cmd_task_agent_eval_dataset_update)
 
     delete_cmd = sub.add_parser(
         "delete",
@@ -1192,7 +1194,7 @@ def _register_eval_dataset_group(task_agent_sub: argparse._SubParsersAction[argp
         **rich_parser_kwargs("Delete an evaluation dataset by ID.", examples=["vectorvein task-agent eval-dataset delete --dataset-id dataset_xxx"]),
     )
     delete_cmd.add_argument("--dataset-id", required=True, help="Evaluation dataset ID.")
-    delete_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_dataset_delete, command="task-agent eval-dataset delete")
+    set_handler(delete_cmd, "task-agent eval-dataset delete", task_agent_cmd._cmd_task_agent_eval_dataset_delete)
 
 
 def _add_eval_case_payload_arguments(parser: argparse.ArgumentParser, *, include_case_id: bool, include_dataset_id: bool) -> None:
@@ -1233,7 +1235,7 @@ def _register_eval_case_group(task_agent_sub: argparse._SubParsersAction[argpars
     list_cmd.add_argument("--dataset-id", help="Evaluation dataset ID.")
     add_paging_arguments(list_cmd, default_page_size=50)
     add_json_data_argument(list_cmd)
-    list_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_case_list, command="task-agent eval-case list")
+    set_handler(list_cmd, "task-agent eval-case list", task_agent_cmd._cmd_task_agent_eval_case_list)
 
     create_cmd = sub.add_parser(
         "create",
@@ -1243,7 +1245,7 @@ def _register_eval_case_group(task_agent_sub: argparse._SubParsersAction[argpars
         ),
     )
     _add_eval_case_payload_arguments(create_cmd, include_case_id=False, include_dataset_id=True)
-    create_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_case_create, command="task-agent eval-case create")
+    set_handler(create_cmd, "task-agent eval-case create", task_agent_cmd._cmd_task_agent_eval_case_create)
 
     update_cmd = sub.add_parser(
         "update",
@@ -1251,7 +1253,7 @@ def _register_eval_case_group(task_agent_sub: argparse._SubParsersAction[argpars
         **rich_parser_kwargs("Update selected case fields.", examples=["vectorvein task-agent eval-case update --case-id case_xxx --metadata @metadata.json"]),
     )
     _add_eval_case_payload_arguments(update_cmd, include_case_id=True, include_dataset_id=False)
-    update_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_case_update, command="task-agent eval-case update")
+    set_handler(update_cmd, "task-agent eval-case update", task_agent_cmd._cmd_task_agent_eval_case_update)
 
     delete_cmd = sub.add_parser(
         "delete",
@@ -1259,7 +1261,7 @@ def _register_eval_case_group(task_agent_sub: argparse._SubParsersAction[argpars
         **rich_parser_kwargs("Delete an evaluation case by ID.", examples=["vectorvein task-agent eval-case delete --case-id case_xxx"]),
     )
     delete_cmd.add_argument("--case-id", required=True, help="Evaluation case ID.")
-    delete_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_case_delete, command="task-agent eval-case delete")
+    set_handler(delete_cmd, "task-agent eval-case delete", task_agent_cmd._cmd_task_agent_eval_case_delete)
 
 
 def _register_eval_run_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -1292,7 +1294,7 @@ def _register_eval_run_group(task_agent_sub: argparse._SubParsersAction[argparse
     create_cmd.add_argument("--candidate-config", help=_json_object_help("candidate config"))
     create_cmd.add_argument("--trials-per-case", type=int, help="Trials per case.")
     add_json_data_argument(create_cmd)
-    create_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_run_create, command="task-agent eval-run create")
+    set_handler(create_cmd, "task-agent eval-run create", task_agent_cmd._cmd_task_agent_eval_run_create)
 
     get_cmd = sub.add_parser(
         "get",
@@ -1300,7 +1302,7 @@ def _register_eval_run_group(task_agent_sub: argparse._SubParsersAction[argparse
         **rich_parser_kwargs("Fetch one evaluation run by ID.", examples=["vectorvein task-agent eval-run get --run-id run_xxx"]),
     )
     get_cmd.add_argument("--run-id", required=True, help="Evaluation run ID.")
-    get_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_run_get, command="task-agent eval-run get")
+    set_handler(get_cmd, "task-agent eval-run get", task_agent_cmd._cmd_task_agent_eval_run_get)
 
     list_cmd = sub.add_parser(
         "list",
@@ -1310,7 +1312,7 @@ def _register_eval_run_group(task_agent_sub: argparse._SubParsersAction[argparse
     list_cmd.add_argument("--dataset-id", help="Evaluation dataset ID filter.")
     add_paging_arguments(list_cmd, default_page_size=20)
     add_json_data_argument(list_cmd)
-    list_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_run_list, command="task-agent eval-run list")
+    set_handler(list_cmd, "task-agent eval-run list", task_agent_cmd._cmd_task_agent_eval_run_list)
 
     cancel_cmd = sub.add_parser(
         "cancel",
@@ -1318,7 +1320,7 @@ def _register_eval_run_group(task_agent_sub: argparse._SubParsersAction[argparse
         **rich_parser_kwargs("Cancel a pending or running evaluation run.", examples=["vectorvein task-agent eval-run cancel --run-id run_xxx"]),
     )
     cancel_cmd.add_argument("--run-id", required=True, help="Evaluation run ID.")
-    cancel_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_run_cancel, command="task-agent eval-run cancel")
+    set_handler(cancel_cmd, "task-agent eval-run cancel", task_agent_cmd._cmd_task_agent_eval_run_cancel)
 
     results_cmd = sub.add_parser(
         "results",
@@ -1326,7 +1328,7 @@ def _register_eval_run_group(task_agent_sub: argparse._SubParsersAction[argparse
         **rich_parser_kwargs("Fetch aggregate run and candidate results.", examples=["vectorvein task-agent eval-run results --run-id run_xxx"]),
     )
     results_cmd.add_argument("--run-id", required=True, help="Evaluation run ID.")
-    results_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_run_results, command="task-agent eval-run results")
+    set_handler(results_cmd, "task-agent eval-run results", task_agent_cmd._cmd_task_agent_eval_run_results)
 
     case_results_cmd = sub.add_parser(
         "case-results",
@@ -1336,7 +1338,7 @@ def _register_eval_run_group(task_agent_sub: argparse._SubParsersAction[argparse
     case_results_cmd.add_argument("--run-id", required=True, help="Evaluation run ID.")
     case_results_cmd.add_argument("--candidate-id", help="Candidate ID filter.")
     case_results_cmd.add_argument("--case-run-id", help="Case run ID filter.")
-    case_results_cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_eval_run_case_results, command="task-agent eval-run case-results")
+    set_handler(case_results_cmd, "task-agent eval-run case-results", task_agent_cmd._cmd_task_agent_eval_run_case_results)
 
 
 def _register_skill_review_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -1353,7 +1355,7 @@ def _register_skill_review_group(task_agent_sub: argparse._SubParsersAction[argp
     )
     review_list.add_argument("--skill-id", required=True, help="Skill ID.")
     add_paging_arguments(review_list, default_page_size=20)
-    review_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_review_list, command="task-agent skill-review list")
+    set_handler(review_list, "task-agent skill-review list", task_agent_cmd._cmd_task_agent_skill_review_list)
 
     review_create = review_sub.add_parser(
         "create",
@@ -1363,7 +1365,7 @@ def _register_skill_review_group(task_agent_sub: argparse._SubParsersAction[argp
     review_create.add_argument("--skill-id", required=True, help="Skill ID.")
     review_create.add_argument("--rating", required=True, type=int, help="Rating value.")
     review_create.add_argument("--comment", help="Review comment or @file.")
-    review_create.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_review_create, command="task-agent skill-review create")
+    set_handler(review_create, "task-agent skill-review create", task_agent_cmd._cmd_task_agent_skill_review_create)
 
     review_delete = review_sub.add_parser(
         "delete",
@@ -1371,7 +1373,7 @@ def _register_skill_review_group(task_agent_sub: argparse._SubParsersAction[argp
         **rich_parser_kwargs("Delete a skill review by review ID.", examples=["vectorvein task-agent skill-review delete --review-id review_xxx"]),
     )
     review_delete.add_argument("--review-id", required=True, help="Review ID.")
-    review_delete.set_defaults(handler=task_agent_cmd._cmd_task_agent_skill_review_delete, command="task-agent skill-review delete")
+    set_handler(review_delete, "task-agent skill-review delete", task_agent_cmd._cmd_task_agent_skill_review_delete)
 
 
 def _register_task_category_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -1383,7 +1385,7 @@ def _register_task_category_group(task_agent_sub: argparse._SubParsersAction[arg
     sub = parser.add_subparsers(dest="task_agent_task_category_command")
     sub.required = True
     cmd = sub.add_parser("list", help="List task categories.", **rich_parser_kwargs("List task categories.", examples=["vectorvein task-agent task-category list"]))
-    cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_category_list, command="task-agent task-category list")
+    set_handler(cmd, "task-agent task-category list", task_agent_cmd._cmd_task_agent_task_category_list)
 
 
 def _register_tool_category_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -1395,7 +1397,7 @@ def _register_tool_category_group(task_agent_sub: argparse._SubParsersAction[arg
     sub = parser.add_subparsers(dest="task_agent_tool_category_command")
     sub.required = True
     cmd = sub.add_parser("list", help="List tool categories.", **rich_parser_kwargs("List workflow tool categories.", examples=["vectorvein task-agent tool-category list"]))
-    cmd.set_defaults(handler=task_agent_cmd._cmd_task_agent_tool_category_list, command="task-agent tool-category list")
+    set_handler(cmd, "task-agent tool-category list", task_agent_cmd._cmd_task_agent_tool_category_list)
 
 
 def _register_workflow_tool_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -1421,7 +1423,7 @@ def _register_workflow_tool_group(task_agent_sub: argparse._SubParsersAction[arg
         **rich_parser_kwargs("List official workflow tools.", examples=["vectorvein task-agent workflow-tool official-list --category-id cat_xxx"]),
     )
     _add_list_args(official_list)
-    official_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_workflow_tool_official_list, command="task-agent workflow-tool official-list")
+    set_handler(official_list, "task-agent workflow-tool official-list", task_agent_cmd._cmd_task_agent_workflow_tool_official_list)
 
     my_list = sub.add_parser(
         "my-list",
@@ -1429,7 +1431,7 @@ def _register_workflow_tool_group(task_agent_sub: argparse._SubParsersAction[arg
         **rich_parser_kwargs("List workflow tools created by the current user.", examples=["vectorvein task-agent workflow-tool my-list"]),
     )
     _add_list_args(my_list)
-    my_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_workflow_tool_my_list, command="task-agent workflow-tool my-list")
+    set_handler(my_list, "task-agent workflow-tool my-list", task_agent_cmd._cmd_task_agent_workflow_tool_my_list)
 
     def _add_workflow_tool_payload_args(cmd: argparse.ArgumentParser) -> None:
         cmd.add_argument("--workflow-wid", help="Workflow WID.")
@@ -1445,7 +1447,7 @@ def _register_workflow_tool_group(task_agent_sub: argparse._SubParsersAction[arg
         **rich_parser_kwargs("Create a workflow tool.", examples=["vectorvein task-agent workflow-tool create --workflow-wid wf_xxx --category-id cat_xxx"]),
     )
     _add_workflow_tool_payload_args(workflow_tool_create)
-    workflow_tool_create.set_defaults(handler=task_agent_cmd._cmd_task_agent_workflow_tool_create, command="task-agent workflow-tool create")
+    set_handler(workflow_tool_create, "task-agent workflow-tool create", task_agent_cmd._cmd_task_agent_workflow_tool_create)
 
     workflow_tool_update = sub.add_parser(
         "update",
@@ -1454,13 +1456,13 @@ def _register_workflow_tool_group(task_agent_sub: argparse._SubParsersAction[arg
     )
     workflow_tool_update.add_argument("--tool-id", required=True, help="Tool ID.")
     _add_workflow_tool_payload_args(workflow_tool_update)
-    workflow_tool_update.set_defaults(handler=task_agent_cmd._cmd_task_agent_workflow_tool_update, command="task-agent workflow-tool update")
+    set_handler(workflow_tool_update, "task-agent workflow-tool update", task_agent_cmd._cmd_task_agent_workflow_tool_update)
 
     workflow_tool_delete = sub.add_parser(
         "delete", help="Delete one workflow tool.", **rich_parser_kwargs("Delete a workflow tool.", examples=["vectorvein task-agent workflow-tool delete --tool-id tool_xxx"])
     )
     workflow_tool_delete.add_argument("--tool-id", required=True, help="Tool ID.")
-    workflow_tool_delete.set_defaults(handler=task_agent_cmd._cmd_task_agent_workflow_tool_delete, command="task-agent workflow-tool delete")
+    set_handler(workflow_tool_delete, "task-agent workflow-tool delete", task_agent_cmd._cmd_task_agent_workflow_tool_delete)
 
     workflow_tool_detail = sub.add_parser(
         "detail",
@@ -1468,7 +1470,7 @@ def _register_workflow_tool_group(task_agent_sub: argparse._SubParsersAction[arg
         **rich_parser_kwargs("Fetch workflow tool detail by tool ID.", examples=["vectorvein task-agent workflow-tool detail --tool-id tool_xxx"]),
     )
     workflow_tool_detail.add_argument("--tool-id", required=True, help="Tool ID.")
-    workflow_tool_detail.set_defaults(handler=task_agent_cmd._cmd_task_agent_workflow_tool_detail, command="task-agent workflow-tool detail")
+    set_handler(workflow_tool_detail, "task-agent workflow-tool detail", task_agent_cmd._cmd_task_agent_workflow_tool_detail)
 
     workflow_tool_batch_create = sub.add_parser(
         "batch-create",
@@ -1481,7 +1483,7 @@ def _register_workflow_tool_group(task_agent_sub: argparse._SubParsersAction[arg
     workflow_tool_batch_create.add_argument("--workflow-wids", help=_json_array_help("workflow WIDs"))
     workflow_tool_batch_create.add_argument("--template-tids", help=_json_array_help("template TIDs"))
     workflow_tool_batch_create.add_argument("--category-id", help="Category ID.")
-    workflow_tool_batch_create.set_defaults(handler=task_agent_cmd._cmd_task_agent_workflow_tool_batch_create, command="task-agent workflow-tool batch-create")
+    set_handler(workflow_tool_batch_create, "task-agent workflow-tool batch-create", task_agent_cmd._cmd_task_agent_workflow_tool_batch_create)
 
 
 def _register_task_schedule_group(task_agent_sub: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -1503,7 +1505,7 @@ def _register_task_schedule_group(task_agent_sub: argparse._SubParsersAction[arg
     schedule_list.add_argument("--agent-id", help="Agent ID filter.")
     add_bool_text_argument(schedule_list, "--enabled", help_text="Filter by enabled state.")
     add_json_data_argument(schedule_list)
-    schedule_list.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_schedule_list, command="task-agent task-schedule list")
+    set_handler(schedule_list, "task-agent task-schedule list", task_agent_cmd._cmd_task_agent_task_schedule_list)
 
     schedule_get = sub.add_parser(
         "get",
@@ -1511,7 +1513,7 @@ def _register_task_schedule_group(task_agent_sub: argparse._SubParsersAction[arg
         **rich_parser_kwargs("Fetch one task schedule by schedule ID.", examples=["vectorvein task-agent task-schedule get --schedule-id sid_xxx"]),
     )
     schedule_get.add_argument("--schedule-id", required=True, help="Schedule ID.")
-    schedule_get.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_schedule_get, command="task-agent task-schedule get")
+    set_handler(schedule_get, "task-agent task-schedule get", task_agent_cmd._cmd_task_agent_task_schedule_get)
 
     schedule_update = sub.add_parser(
         "update",
@@ -1532,7 +1534,7 @@ def _register_task_schedule_group(task_agent_sub: argparse._SubParsersAction[arg
     schedule_update.add_argument("--max-cycles", type=int, help="Max cycles.")
     add_bool_text_argument(schedule_update, "--send-email", help_text="Whether to send email notifications.")
     add_bool_text_argument(schedule_update, "--load-user-memory", help_text="Whether to load user memory.")
-    schedule_update.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_schedule_update, command="task-agent task-schedule update")
+    set_handler(schedule_update, "task-agent task-schedule update", task_agent_cmd._cmd_task_agent_task_schedule_update)
 
     schedule_delete = sub.add_parser(
         "delete",
@@ -1540,7 +1542,7 @@ def _register_task_schedule_group(task_agent_sub: argparse._SubParsersAction[arg
         **rich_parser_kwargs("Delete a task schedule by ID.", examples=["vectorvein task-agent task-schedule delete --schedule-id sid_xxx"]),
     )
     schedule_delete.add_argument("--schedule-id", required=True, help="Schedule ID.")
-    schedule_delete.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_schedule_delete, command="task-agent task-schedule delete")
+    set_handler(schedule_delete, "task-agent task-schedule delete", task_agent_cmd._cmd_task_agent_task_schedule_delete)
 
     schedule_toggle = sub.add_parser(
         "toggle",
@@ -1549,10 +1551,32 @@ def _register_task_schedule_group(task_agent_sub: argparse._SubParsersAction[arg
     )
     schedule_toggle.add_argument("--schedule-id", required=True, help="Schedule ID.")
     add_bool_text_argument(schedule_toggle, "--enabled", help_text="Target enabled state.")
-    schedule_toggle.set_defaults(handler=task_agent_cmd._cmd_task_agent_task_schedule_toggle, command="task-agent task-schedule toggle")
-
-
-def register_task_agent_parser(top_level: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
+    set_handler(schedule_toggle, "task-agent task-schedule toggle", task_agent_cmd._cmd_task_agent_task_schedule_toggle)
+
+
+_GROUP_REGISTRARS: dict[str, Callable[[argparse._SubParsersAction[argparse.ArgumentParser]], None]] = {
+    "agent": _register_agent_group,
+    "task": _register_task_group,
+    "cycle": _register_cycle_group,
+    "tag": _register_tag_group,
+    "collection": _register_collection_group,
+    "mcp-server": _register_mcp_server_group,
+    "mcp-tool": _register_mcp_tool_group,
+    "user-memory": _register_user_memory_group,
+    "skill": _register_skill_group,
+    "skill-review": _register_skill_review_group,
+    "eval-dataset": _register_eval_dataset_group,
+    "eval-case": _register_eval_case_group,
+    "eval-run": _register_eval_run_group,
+    "task-category": _register_task_category_group,
+    "tool-category": _register_tool_category_group,
+    "workflow-tool": _register_workflow_tool_group,
+    "task-schedule": _register_task_schedule_group,
+}
+
+
+def register_task_agent_parser(top_level: argparse._SubParsersAction[argparse.ArgumentParser], group: str | None = None) -> None:
+    """Register ``task-agent``; a known ``group`` limits registration to that subgroup's parsers."""
     task_agent_parser = top_level.add_parser(
         "task-agent",
         help="Task-agent related commands.",
@@ -1568,20 +1592,6 @@ def register_task_agent_parser(top_level: argparse._SubParsersAction[argparse.Ar
     task_agent_sub = task_agent_parser.add_subparsers(dest="task_agent_group")
     task_agent_sub.required = True
 
-    _register_agent_group(task_agent_sub)
-    _register_task_group(task_agent_sub)
-    _register_cycle_group(task_agent_sub)
-    _register_tag_group(task_agent_sub)
-    _register_collection_group(task_agent_sub)
-    _register_mcp_server_group(task_agent_sub)
-    _register_mcp_tool_group(task_agent_sub)
-    _register_user_memory_group(task_agent_sub)
-    _register_skill_group(task_agent_sub)
-    _register_skill_review_group(task_agent_sub)
-    _register_eval_dataset_group(task_agent_sub)
-    _register_eval_case_group(task_agent_sub)
-    _register_eval_run_group(task_agent_sub)
-    _register_task_category_group(task_agent_sub)
-    _register_tool_category_group(task_agent_sub)
-    _register_workflow_tool_group(task_agent_sub)
-    _register_task_schedule_group(task_agent_sub)
+    registrar = _GROUP_REGISTRARS.get(group or "")
+    for register in (registrar,) if registrar is not None else _GROUP_REGISTRARS.values():
+        register(task_agent_sub)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import argparse
 
-from vectorvein.cli._builders.common import add_paging_arguments, add_search_argument, rich_parser_kwargs
+from vectorvein.cli._builders.common import add_paging_arguments, add_search_argument, rich_parser_kwargs, set_handler
 from vectorvein.cli._commands.workflow import (
     _cmd_workflow_create,
     _cmd_workflow_delete,
@@ -68,7 +68,7 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
     workflow_run.add_argument("--api-key-type", choices=("WORKFLOW", "VAPP"), default="WORKFLOW", help="API key type header (default: WORKFLOW).")
     workflow_run.add_argument("--upload-to", action="append", default=[], help="Upload file and bind to field. Format: node_id:field_name:local_file_path.")
     workflow_run.add_argument("--upload-as", choices=("auto", "single", "list"), default="auto", help="How uploaded paths map to the workflow field value.")
-    workflow_run.set_defaults(handler=_cmd_workflow_run, command="workflow run")
+    set_handler(workflow_run, "workflow run", _cmd_workflow_run)
 
     workflow_status = workflow_sub.add_parser(
         "status",
@@ -78,7 +78,7 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
     workflow_status.add_argument("--rid", required=True, help="Workflow run record ID.")
     workflow_status.add_argument("--wid", help="Required only when --api-key-type is VAPP.")
     workflow_status.add_argument("--api-key-type", choices=("WORKFLOW", "VAPP"), default="WORKFLOW", help="API key type header (default: WORKFLOW).")
-    workflow_status.set_defaults(handler=_cmd_workflow_status, command="workflow status")
+    set_handler(workflow_status, "workflow status", _cmd_workflow_status)
 
     workflow_list = workflow_sub.add_parser(
         "list",
@@ -90,7 +90,7 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
     add_search_argument(workflow_list, option="--search-text", help_text="Search text.")
     workflow_list.add_argument("--sort-field", default="update_time", help="Sort field (default: update_time).")
     workflow_list.add_argument("--sort-order", choices=("ascend", "descend"), default="descend", help="Sort order (default: descend).")
-    workflow_list.set_defaults(handler=_cmd_workflow_list, command="workflow list")
+    set_handler(workflow_list, "workflow list", _cmd_workflow_list)
 
     workflow_get = workflow_sub.add_parser(
         "get",
@@ -98,7 +98,7 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
         **rich_parser_kwargs("Fetch the full workflow definition, including nodes and edges.", examples=["vectorvein workflow get --wid wf_xxx"]),
     )
     workflow_get.add_argument("--wid", required=True, help="Workflow ID.")
-    workflow_get.set_defaults(handler=_cmd_workflow_get, command="workflow get")
+    set_handler(workflow_get, "workflow get", _cmd_workflow_get)
 
     workflow_describe = workflow_sub.add_parser(
         "describe",
@@ -112,7 +112,7 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
         ),
     )
     workflow_describe.add_argument("--wid", required=True, help="Workflow ID.")
-    workflow_describe.set_defaults(handler=_cmd_workflow_describe, command="workflow describe")
+    set_handler(workflow_describe, "workflow describe", _cmd_workflow_describe)
 
     workflow_create = workflow_sub.add_parser(
         "create",
@@ -131,7 +131,7 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
     workflow_create.add_argument("--language", help="Workflow language (default: zh-CN).")
     workflow_create.add_argument("--data", help="JSON object or @file for workflow graph data.")
     workflow_create.add_argument("--source-wid", help="Source workflow ID to copy from.")
-    workflow_create.set_defaults(handler=_cmd_workflow_create, command="workflow create")
+    set_handler(workflow_create, "workflow create", _cmd_workflow_create)
 
     workflow_update = workflow_sub.add_parser(
         "update",
@@ -147,7 +147,7 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
     workflow_update.add_argument("--title", help="New workflow title.")
     workflow_update.add_argument("--brief", help="New workflow brief description or @file.")
     workflow_update.add_argument("--language", help="New workflow language.")
-    workflow_update.set_defaults(handler=_cmd_workflow_update, command="workflow update")
+    set_handler(workflow_update, "workflow update", _cmd_workflow_update)
 
     workflow_delete = workflow_sub.add_parser(
         "delete",
@@ -155,7 +155,7 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
         **rich_parser_kwargs("Delete a workflow by ID.", examples=["vectorvein workflow delete --wid wf_xxx"]),
     )
     workflow_delete.add_argument("--wid", required=True, help="Workflow ID.")
-    workflow_delete.set_defaults(handler=_cmd_workflow_delete, command="workflow delete")
+    set_handler(workflow_delete, "workflow delete", _cmd_workflow_delete)
 
     workflow_search = workflow_sub.add_parser(
         "search",
@@ -167,7 +167,7 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
     workflow_search.add_argument("--tag", action="append", default=[], help="Tag ID filter. Repeat for multiple tags.")
     workflow_search.add_argument("--sort-field", default="update_time", help="Sort field (default: update_time).")
     workflow_search.add_argument("--sort-order", choices=("ascend", "descend"), default="descend", help="Sort order (default: descend).")
-    workflow_search.set_defaults(handler=_cmd_workflow_search, command="workflow search")
+    set_handler(workflow_search, "workflow search", _cmd_workflow_search)
 
     workflow_run_record = workflow_sub.add_parser(
         "run-record",
@@ -195,7 +195,7 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
     add_paging_arguments(workflow_rr_list)
     workflow_rr_list.add_argument("--sort-field", default="start_time", help="Sort field (default: start_time).")
     workflow_rr_list.add_argument("--sort-order", choices=("ascend", "descend"), default="descend", help="Sort order (default: descend).")
-    workflow_rr_list.set_defaults(handler=_cmd_workflow_run_record_list, command="workflow run-record list")
+    set_handler(workflow_rr_list, "workflow run-record list", _cmd_workflow_run_record_list)
 
     workflow_rr_get = workflow_run_record_sub.add_parser(
         "get",
@@ -203,7 +203,7 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
         **rich_parser_kwargs("Fetch a workflow run record by run record ID.", examples=["vectorvein workflow run-record get --rid rid_xxx"]),
     )
     workflow_rr_get.add_argument("--rid", required=True, help="Workflow run record ID.")
-    workflow_rr_get.set_defaults(handler=_cmd_workflow_run_record_get, command="workflow run-record get")
+    set_handler(workflow_rr_get, "workflow run-record get", _cmd_workflow_run_record_get)
 
     workflow_rr_delete = workflow_run_record_sub.add_parser(
         "delete",
@@ -211,7 +211,7 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
         **rich_parser_kwargs("Delete a workflow run record by run record ID.", examples=["vectorvein workflow run-record delete --rid rid_xxx"]),
     )
     workflow_rr_delete.add_argument("--rid", required=True, help="Workflow run record ID.")
-    workflow_rr_delete.set_defaults(handler=_cmd_workflow_run_record_delete, command="workflow run-record delete")
+    set_handler(workflow_rr_delete, "workflow run-record delete", _cmd_workflow_run_record_delete)
 
     workflow_rr_stop = workflow_run_record_sub.add_parser(
         "stop",
@@ -219,4 +219,4 @@ def register_workflow_parser(top_level: argparse._SubParsersAction[argparse.Argu
         **rich_parser_kwargs("Stop a running workflow execution by run record ID.", examples=["vectorvein workflow run-record stop --rid rid_xxx"]),
     )
     workflow_rr_stop.add_argument("--rid", required=True, help="Workflow run record ID.")
-    workflow_rr_stop.set_defaults(handler=_cmd_workflow_run_record_stop, command="workflow run-record stop")
+    set_handler(workflow_rr_stop, "workflow run-record stop", _cmd_workflow_run_record_stop)
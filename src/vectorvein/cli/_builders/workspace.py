@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import argparse
 
-from vectorvein.cli._builders.common import add_paging_arguments, rich_parser_kwargs
+from vectorvein.cli._builders.common import add_paging_arguments, rich_parser_kwargs, set_handler
 from vectorvein.cli._commands.workspace import (
     _cmd_workspace_delete,
     _cmd_workspace_download,
@@ -40,7 +40,7 @@ def register_workspace_parser(top_level: argparse._SubParsersAction[argparse.Arg
         **rich_parser_kwargs("List workspaces that belong to the current account.", examples=["vectorvein agent-workspace list"]),
     )
     add_paging_arguments(workspace_list)
-    workspace_list.set_defaults(handler=_cmd_workspace_list, command="agent-workspace list")
+    set_handler(workspace_list, "agent-workspace list", _cmd_workspace_list)
 
     workspace_get = workspace_sub.add_parser(
         "get",
@@ -48,7 +48,7 @@ def register_workspace_parser(top_level: argparse._SubParsersAction[argparse.Arg
         **rich_parser_kwargs("Fetch a workspace summary by ID.", examples=["vectorvein agent-workspace get --workspace-id ws_xxx"]),
     )
     workspace_get.add_argument("--workspace-id", required=True, help="Workspace ID.")
-    workspace_get.set_defaults(handler=_cmd_workspace_get, command="agent-workspace get")
+    set_handler(workspace_get, "agent-workspace get", _cmd_workspace_get)
 
     workspace_files = workspace_sub.add_parser(
         "files",
@@ -60,7 +60,7 @@ def register_workspace_parser(top_level: argparse._SubParsersAction[argparse.Arg
     workspace_files.add_argument("--workspace-id", required=True, help="Workspace ID.")
     workspace_files.add_argument("--prefix", help="Path prefix filter.")
     workspace_files.add_argument("--tree-view", action="store_true", help="Return files in tree-view style.")
-    workspace_files.set_defaults(handler=_cmd_workspace_files, command="agent-workspace files")
+    set_handler(workspace_files, "agent-workspace files", _cmd_workspace_files)
 
     workspace_read = workspace_sub.add_parser(
         "read",
@@ -74,7 +74,7 @@ def register_workspace_parser(top_level: argparse._SubParsersAction[argparse.Arg
     workspace_read.add_argument("--file-path", required=True, help="File path in workspace.")
     workspace_read.add_argument("--start-line", type=int, help="Start line (1-based).")
     workspace_read.add_argument("--end-line", type=int, help="End line (1-based, inclusive).")
-    workspace_read.set_defaults(handler=_cmd_workspace_read, command="agent-workspace read")
+    set_handler(workspace_read, "agent-workspace read", _cmd_workspace_read)
 
     workspace_write = workspace_sub.add_parser(
         "write",
@@ -91,7 +91,7 @@ def register_workspace_parser(top_level: argparse._SubParsersAction[argparse.Arg
     workspace_write.add_argument("--file-path", required=True, help="File path in workspace.")
     workspace_write.add_argument("--content", help="Inline UTF-8 text content or @file.")
     workspace_write.add_argument("--content-file", help="Read file content from local UTF-8 file.")
-    workspace_write.set_defaults(handler=_cmd_workspace_write, command="agent-workspace write")
+    set_handler(workspace_write, "agent-workspace write", _cmd_workspace_write)
 
     workspace_delete = workspace_sub.add_parser(
         "delete",
@@ -100,7 +100,7 @@ def register_workspace_parser(top_level: argparse._SubParsersAction[argparse.Arg
     )
     workspace_delete.add_argument("--workspace-id", required=True, help="Workspace ID.")
     workspace_delete.add_argument("--file-path", required=True, help="File path in workspace.")
-    workspace_delete.set_defaults(handler=_cmd_workspace_delete, command="agent-workspace delete")
+    set_handler(workspace_delete, "agent-workspace delete", _cmd_workspace_delete)
 
     workspace_download = workspace_sub.add_parser(
         "download",
@@ -109,7 +109,7 @@ def register_workspace_parser(top_level: argparse._SubParsersAction[argparse.Arg
     )
     workspace_download.add_argument("--workspace-id", required=True, help="Workspace ID.")
     workspace_download.add_argument("--file-path", required=True, help="File path in workspace.")
-    workspace_download.set_defaults(handler=_cmd_workspace_download, command="agent-workspace download")
+    set_handler(workspace_download, "agent-workspace download", _cmd_workspace_download)
 
     workspace_zip = workspace_sub.add_parser(
         "zip",
@@ -117,7 +117,7 @@ def register_workspace_parser(top_level: argparse._SubParsersAction[argparse.Arg
         **rich_parser_kwargs("Bundle a workspace into a zip archive and return download metadata.", examples=["vectorvein agent-workspace zip --workspace-id ws_xxx"]),
     )
     workspace_zip.add_argument("--workspace-id", required=True, help="Workspace ID.")
-    workspace_zip.set_defaults(handler=_cmd_workspace_zip, command="agent-workspace zip")
+    set_handler(workspace_zip, "agent-workspace zip", _cmd_workspace_zip)
 
     workspace_sync = workspace_sub.add_parser(
         "sync",
@@ -125,4 +125,4 @@ def register_workspace_parser(top_level: argparse._SubParsersAction[argparse.Arg
         **rich_parser_kwargs("Trigger a workspace sync from the runtime container back to OSS storage.", examples=["vectorvein agent-workspace sync --workspace-id ws_xxx"]),
     )
     workspace_sync.add_argument("--workspace-id", required=True, help="Workspace ID.")
-    workspace_sync.set_defaults(handler=_cmd_workspace_sync, command="agent-workspace sync")
+    set_handler(workspace_sync, "agent-workspace sync", _cmd_workspace_sync)
@@ -0,0 +1,96 @@
+"""Batch command handler that runs many CLI commands through one client."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import shlex
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from vectorvein.cli._builders.common import _HANDLERS
+from vectorvein.cli._output import CLIUsageError, _error_payload, _print_json, _success_payload
+
+if TYPE_CHECKING:
+    from vectorvein.api import VectorVeinClient
+
+
+def _batch_error_type(exc: Exception) -> str:
+    from vectorvein.api import APIKeyError, RequestError, VectorVeinAPIError
+
+    if isinstance(exc, CLIUsageError):
+        return "usage_error"
+    if isinstance(exc, APIKeyError):
+        return "api_key_error"
+    if isinstance(exc, RequestError):
+        return "request_error"
+    if isinstance(exc, VectorVeinAPIError):
+        return "api_error"
+    return "unexpected_error"
+
+
+def _iter_batch_lines(source: str) -> Iterator[str]:
+    if source == "-":
+        yield from sys.stdin
+        return
+    path = Path(source)
+    if not path.is_file():
+        raise CLIUsageError(f"--input file does not exist: {path}")
+    with path.open(encoding="utf-8") as handle:
+        yield from handle
+
+
+def _parse_batch_line(parser: argparse.ArgumentParser, line: str) -> argparse.Namespace:
+    # --help/--version print and exit inside argparse; keep their text out of the batch output and fail only this line.
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            return parser.parse_args(shlex.split(line))
+    except SystemExit:
+        raise CLIUsageError("--help and --version are not supported in batch lines.") from None
+
+
+def _run_batch_line(parser: argparse.ArgumentParser, line: str, line_number: int, client: VectorVeinClient) -> dict[str, Any]:
+    command: str | None = None
+    try:
+        line_args = _parse_batch_line(parser, line)
+        command = str(line_args.command)
+        if command == "batch":
+            raise CLIUsageError("batch commands cannot be nested.")
+        return _success_payload(command, _HANDLERS[command](line_args, client))
+    except Exception as exc:  # noqa: BLE001
+        payload = _error_payload(command, _batch_error_type(exc), str(exc), status_code=getattr(exc, "status_code", None))
+        payload["line"] = line_number
+        return payload
+
+
+def _cmd_batch(args: argparse.Namespace, client: VectorVeinClient) -> Any:
+    from vectorvein.cli._parser_builder import get_parser
+
+    stream = bool(getattr(args, "stream", False))
+    if stream and str(getattr(args, "format", "text")) != "json":
+        raise CLIUsageError(
+            "--stream requires --format json.",
+            hint="Streamed results are newline-delimited JSON; run `vectorvein --format json batch --stream`.",
+        )
+
+    parser = get_parser()
+    results: list[dict[str, Any]] = []
+    total = failed = 0
+    for line_number, line in enumerate(_iter_batch_lines(str(args.input)), start=1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+
+        payload = _run_batch_line(parser, line, line_number, client)
+        total += 1
+        failed += not payload["ok"]
+        if stream:
+            _print_json(payload, compact=True)
+        else:
+            results.append(payload)
+
+    if stream:
+        return {"total": total, "failed": failed}
+    return results
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from vectorvein.api import VectorVeinClient
+if TYPE_CHECKING:
+    from vectorvein.api import VectorVeinClient
 
 from vectorvein.cli._output import CLIUsageError
 
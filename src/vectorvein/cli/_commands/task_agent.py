@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import argparse
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from vectorvein.api import TaskInfo, VectorVeinClient
+if TYPE_CHECKING:
+    from vectorvein.api import VectorVeinClient
 
 from vectorvein.cli._output import CLIUsageError
 from vectorvein.cli._parsers import (
@@ -199,6 +200,8 @@ def _cmd_task_agent_task_create(args: argparse.Namespace, client: VectorVeinClie
             example="vectorvein task-agent task create --text 'Do work' --model-preference custom --custom-backend-type openai --custom-model-name gpt-4o",
         )
 
+    from vectorvein.api import TaskInfo
+
     task_info = TaskInfo(
         text=_load_text_value(args.text, "--text"),
         attachments_detail=_collect_attachments(args),
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import argparse
-import json
+import io
 import sys
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
+from itertools import islice
 from typing import Any, NoReturn
 
+from vectorvein._json import dumps_bytes
+
 
 def _repair_usage_message(message: str, prog: str) -> tuple[str, str | None, list[str], str | None, str | None]:
     normalized_prog = prog.strip()
@@ -87,24 +90,64 @@ class CLIArgumentParser(argparse.ArgumentParser):
         )
 
 
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def _normalize(value: Any) -> Any:
-    """Convert SDK models/dataclasses into plain JSON-serializable data."""
-    if is_dataclass(value):
-        return _normalize(asdict(value))
+    """Convert SDK models/dataclasses into plain JSON-serializable data.
+
+    Containers that already hold only JSON-native data are returned as-is rather than copied.
+    """
+    if type(value) in _ATOMIC_TYPES:
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return {item.name: _normalize(getattr(value, item.name)) for item in fields(value)}
     if isinstance(value, dict):
-        return {str(key): _normalize(val) for key, val in value.items()}
+        return _normalize_dict(value)
     if isinstance(value, list):
-        return [_normalize(item) for item in value]
+        return _normalize_list(value)
     if isinstance(value, tuple):
+        if hasattr(value, "_asdict"):
+            return _normalize_dict(value._asdict())
         return [_normalize(item) for item in value]
     return value
 
 
+def _normalize_dict(value: dict[Any, Any]) -> dict[str, Any]:
+    normalized: dict[str, Any] | None = None
+    for index, (key, child) in enumerate(value.items()):
+        new_child = _normalize(child)
+        if normalized is None:
+            if new_child is child and type(key) is str:
+                continue
+            normalized = dict(islice(value.items(), index))
+        normalized[str(key)] = new_child
+    return value if normalized is None else normalized
+
+
+def _normalize_list(value: list[Any]) -> list[Any]:
+    normalized: list[Any] | None = None
+    for index, item in enumerate(value):
+        new_item = _normalize(item)
+        if normalized is None:
+            if new_item is item:
+                continue
+            normalized = value[:index]
+        normalized.append(new_item)
+    return value if normalized is None else normalized
+
+
 def _print_json(payload: dict[str, Any], *, compact: bool, stream: Any | None = None) -> None:
     target_stream = sys.stdout if stream is None else stream
-    indent = None if compact else 2
-    json_text = json.dumps(payload, ensure_ascii=False, indent=indent)
-    target_stream.write(f"{json_text}\n")
+    json_bytes = dumps_bytes(payload, indent=not compact) + b"\n"
+    buffer = getattr(target_stream, "buffer", None)
+    if buffer is None or str(getattr(target_stream, "encoding", "")).lower().replace("-", "") != "utf8":
+        target_stream.write(json_bytes.decode("utf-8"))
+        return
+    # UTF-8 text stream: flush pending text, then write the encoded bytes without a decode/encode round trip.
+    target_stream.flush()
+    buffer.write(json_bytes)
+    buffer.flush()
 
 
 def _is_scalar(value: Any) -> bool:
@@ -119,45 +162,53 @@ def _format_scalar(value: Any) -> str:
     return str(value)
 
 
-def _render_text_lines(value: Any, indent: int = 0) -> list[str]:
+def _scalar_text(value: Any) -> str | None:
+    """Return the text form of a scalar, or ``None`` for containers and other objects."""
+    return _format_scalar(value) if _is_scalar(value) else None
+
+
+def _render_text_lines(value: Any, buf: io.StringIO, indent: int = 0) -> None:
     prefix = " " * indent
-    if _is_scalar(value):
-        return [f"{prefix}{_format_scalar(value)}"]
+    text = _scalar_text(value)
+    if text is not None:
+        buf.write(f"{prefix}{text}\n")
+        return
 
     if isinstance(value, dict):
         if not value:
-            return [f"{prefix}{{}}"]
-        lines: list[str] = []
+            buf.write(f"{prefix}{{}}\n")
+            return
         for key, child in value.items():
-            key_text = str(key)
-            if _is_scalar(child):
-                lines.append(f"{prefix}{key_text}: {_format_scalar(child)}")
+            text = _scalar_text(child)
+            if text is not None:
+                buf.write(f"{prefix}{key}: {text}\n")
             else:
-                lines.append(f"{prefix}{key_text}:")
-                lines.extend(_render_text_lines(child, indent + 2))
-        return lines
+                buf.write(f"{prefix}{key}:\n")
+                _render_text_lines(child, buf, indent + 2)
+        return
 
     if isinstance(value, list):
         if not value:
-            return [f"{prefix}[]"]
-        lines = []
+            buf.write(f"{prefix}[]\n")
+            return
         for item in value:
-            if _is_scalar(item):
-                lines.append(f"{prefix}- {_format_scalar(item)}")
+            text = _scalar_text(item)
+            if text is not None:
+                buf.write(f"{prefix}- {text}\n")
             else:
-                lines.append(f"{prefix}-")
-                lines.extend(_render_text_lines(item, indent + 2))
-        return lines
+                buf.write(f"{prefix}-\n")
+                _render_text_lines(item, buf, indent + 2)
+        return
 
-    return [f"{prefix}{value}"]
+    buf.write(f"{prefix}{value}\n")
 
 
 def _print_text_success(data: Any, stream: Any | None = None) -> None:
+    """Render ``data`` as indented text; ``data`` must already be normalized (see ``_success_payload``)."""
     target_stream = sys.stdout if stream is None else stream
-    normalized = _normalize(data)
-    lines = _render_text_lines(normalized)
-    target_stream.write("\n".join(lines))
-    target_stream.write("\n")
+    buf = io.StringIO()
+    _render_text_lines(data, buf)
+    target_stream.write(buf.getvalue())
 
 
 def _print_text_error(payload: dict[str, Any], stream: Any | None = None) -> None:
@@ -173,26 +224,23 @@ def _print_text_error(payload: dict[str, Any], stream: Any | None = None) -> Non
     example = error.get("example")
     details = error.get("details")
 
-    if command:
-        target_stream.write(f"Error [{error_type}] ({command}): {message}\n")
-    else:
-        target_stream.write(f"Error [{error_type}]: {message}\n")
-
+    lines = [f"Error [{error_type}] ({command}): {message}" if command else f"Error [{error_type}]: {message}"]
     if status_code is not None:
-        target_stream.write(f"Status Code: {status_code}\n")
+        lines.append(f"Status Code: {status_code}")
     if hint:
-        target_stream.write(f"Hint: {hint}\n")
+        lines.append(f"Hint: {hint}")
     if expected_command:
-        target_stream.write(f"Expected Command: {expected_command}\n")
+        lines.append(f"Expected Command: {expected_command}")
     if suggestions:
-        target_stream.write("Suggestions:\n")
-        for suggestion in suggestions:
-            target_stream.write(f"  - {suggestion}\n")
+        lines.append("Suggestions:")
+        lines.extend(f"  - {suggestion}" for suggestion in suggestions)
     if example:
-        target_stream.write(f"Example: {example}\n")
+        lines.append(f"Example: {example}")
     if isinstance(details, dict) and "traceback" in details:
-        target_stream.write("\nTraceback:\n")
-        target_stream.write(f"{details['traceback']}\n")
+        lines.append("\nTraceback:")
+        lines.append(str(details["traceback"]))
+    lines.append("")
+    target_stream.write("\n".join(lines))
 
 
 def _success_payload(command: str, data: Any) -> dict[str, Any]:
@@ -3,27 +3,63 @@
 from __future__ import annotations
 
 import argparse
-from importlib.metadata import PackageNotFoundError, version as package_version
+import sys
+from collections.abc import Callable
+from functools import cache
 
 from vectorvein.cli._builders.api import register_api_parser
 from vectorvein.cli._builders.auth import register_auth_parsers
+from vectorvein.cli._builders.batch import register_batch_parser
 from vectorvein.cli._builders.common import RichHelpFormatter
 from vectorvein.cli._builders.file import register_file_parser
-from vectorvein.cli._builders.task_agent import register_task_agent_parser
+from vectorvein.cli._builders.task_agent import _GROUP_REGISTRARS as _TASK_AGENT_GROUPS, register_task_agent_parser
 from vectorvein.cli._builders.workflow import register_workflow_parser
 from vectorvein.cli._builders.workspace import register_workspace_parser
 from vectorvein.cli._output import CLIArgumentParser
 from vectorvein.cli._parsers import ENV_API_KEY, ENV_BASE_URL
 
 
+@cache
 def _current_version() -> str:
+    # importlib.metadata pulls in email/csv/zipfile (~15 ms); only pay for it when --version is used.
+    from importlib.metadata import PackageNotFoundError, version as package_version
+
     try:
         return package_version("vectorvein-sdk")
     except PackageNotFoundError:
         return "dev"
 
 
-def build_parser() -> argparse.ArgumentParser:
+class _LazyVersionAction(argparse.Action):
+    """``--version`` action that looks up the installed version only when the flag is used."""
+
+    def __init__(self, option_strings: list[str], dest: str = argparse.SUPPRESS, default: str = argparse.SUPPRESS, help: str | None = None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser: argparse.ArgumentParser, namespace: argparse.Namespace, values: object, option_string: str | None = None) -> None:
+        sys.stdout.write(f"{parser.prog} {_current_version()}\n")
+        parser.exit()
+
+
+_MODULE_REGISTRARS: dict[str, Callable[[argparse._SubParsersAction[argparse.ArgumentParser]], None]] = {
+    "auth": register_auth_parsers,
+    "user": register_auth_parsers,
+    "workflow": register_workflow_parser,
+    "file": register_file_parser,
+    "task-agent": register_task_agent_parser,
+    "agent-workspace": register_workspace_parser,
+    "api": register_api_parser,
+    "batch": register_batch_parser,
+}
+
+
+def build_parser(module: str | None = None, group: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    When ``module`` names a known top-level command only that subtree is registered, which keeps
+    startup cheap; otherwise (top-level help, typos) the full tree is built. ``group`` narrows the
+    large ``task-agent`` module to a single subgroup the same way.
+    """
     parser = CLIArgumentParser(
         prog="vectorvein",
         description=(
@@ -41,7 +77,8 @@ def build_parser() -> argparse.ArgumentParser:
             "  vectorvein task-agent task create --agent-id agent_xxx --text 'Summarize this report' --wait\n"
             "  vectorvein task-agent skill install --skill-id skill_xxx --permission-level auto\n"
             "  vectorvein agent-workspace read --workspace-id ws_xxx --file-path notes.txt --start-line 1 --end-line 20\n"
-            '  vectorvein api request --method POST --endpoint workflow/list --body \'{"page":1,"page_size":5}\'\n\n'
+            '  vectorvein api request --method POST --endpoint workflow/list --body \'{"page":1,"page_size":5}\'\n'
+            "  vectorvein batch --input commands.txt\n\n"
             "JSON inputs support @file syntax, for example --input-fields @payload.json.\n"
             "Selected text inputs also support @file syntax, for example --description @desc.md, --system-prompt @prompt.md, or --brief @workflow_brief.md.\n\n"
             "Exit codes:\n"
@@ -57,18 +94,38 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--api-key", help=f"VectorVein API key. Overrides {ENV_API_KEY}.")
     parser.add_argument("--base-url", help=f"Open API base URL. Overrides {ENV_BASE_URL}.")
     parser.add_argument("--format", choices=("text", "json"), default="text", help="Output format (default: text).")
-    parser.add_argument("--compact", action="store_true", help="Output compact one-line JSON.")
+    parser.add_argument("--compact", action="store_true", help="Output compact one-line JSON (the default when stdout is not a terminal).")
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON output even when stdout is not a terminal.")
     parser.add_argument("--debug", action="store_true", help="Include traceback details in error output.")
-    parser.add_argument("--version", action="version", version=f"%(prog)s {_current_version()}")
+    parser.add_argument("--version", action=_LazyVersionAction, help="Show the installed vectorvein-sdk version and exit.")
 
     top_level = parser.add_subparsers(dest="module")
     top_level.required = True
 
-    register_auth_parsers(top_level)
-    register_workflow_parser(top_level)
-    register_file_parser(top_level)
-    register_task_agent_parser(top_level)
-    register_workspace_parser(top_level)
-    register_api_parser(top_level)
+    registrar = _MODULE_REGISTRARS.get(module or "")
+    if registrar is register_task_agent_parser:
+        register_task_agent_parser(top_level, group=group)
+    elif registrar is not None:
+        registrar(top_level)
+    else:
+        for register in dict.fromkeys(_MODULE_REGISTRARS.values()):
+            register(top_level)
 
     return parser
+
+
+@cache
+def _cached_parser(module: str | None, group: str | None) -> argparse.ArgumentParser:
+    return build_parser(module, group)
+
+
+def get_parser(module: str | None = None, group: str | None = None) -> argparse.ArgumentParser:
+    """Return a shared parser for ``module``/``group``, building it on first use.
+
+    Parsing never mutates a parser, so repeated ``main()`` calls and ``batch`` lines reuse the same instance.
+    """
+    if module not in _MODULE_REGISTRARS:
+        return _cached_parser(None, None)
+    if module != "task-agent" or group not in _TASK_AGENT_GROUPS:
+        group = None
+    return _cached_parser(module, group)
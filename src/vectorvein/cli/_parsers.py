@@ -7,19 +7,21 @@ import json
 import os
 import time
 from pathlib import Path
-from typing import Any
-
-from vectorvein.api import (
-    AgentDefinition,
-    AgentSettings,
-    AttachmentDetail,
-    OssAttachmentDetail,
-    VectorVeinClient,
-    WorkflowInputField,
-)
+from typing import TYPE_CHECKING, Any
 
+from vectorvein._json import loads
 from vectorvein.cli._output import CLIUsageError
 
+if TYPE_CHECKING:
+    from vectorvein.api import (
+        AgentDefinition,
+        AgentSettings,
+        AttachmentDetail,
+        OssAttachmentDetail,
+        VectorVeinClient,
+        WorkflowInputField,
+    )
+
 ENV_API_KEY = "VECTORVEIN_API_KEY"
 ENV_BASE_URL = "VECTORVEIN_BASE_URL"
 _AGENT_DEFINITION_EXAMPLE = '{"model_name":"gpt-4o","backend_type":"openai","compress_memory_after_tokens":64000}'
@@ -47,32 +49,36 @@ def _parse_bool_text(value: str) -> bool:
     raise argparse.ArgumentTypeError("expected a boolean value: true or false")
 
 
-def _load_json_value(raw: str, option_name: str) -> Any:
-    source = option_name
-    text = raw
-    if raw.startswith("@"):
-        path = Path(raw[1:])
+def _at_file_path(raw: str, option_name: str) -> Path:
+    path = Path(raw[1:])
+    if not path.is_file():
         if not path.exists():
             raise CLIUsageError(f"{option_name} references missing file: {path}")
-        if not path.is_file():
-            raise CLIUsageError(f"{option_name} expects a file path after '@': {path}")
-        text = path.read_text(encoding="utf-8")
-        source = f"{option_name} ({path})"
+        raise CLIUsageError(f"{option_name} expects a file path after '@': {path}")
+    return path
+
+
+def _invalid_json_error(source: str, exc: json.JSONDecodeError) -> CLIUsageError:
+    return CLIUsageError(f"{source} contains invalid JSON at line {exc.lineno}, column {exc.colno}: {exc.msg}")
+
+
+def _load_json_value(raw: str, option_name: str) -> Any:
+    if not raw.startswith("@"):
+        try:
+            return loads(raw)
+        except json.JSONDecodeError as exc:
+            raise _invalid_json_error(option_name, exc) from exc
 
+    path = _at_file_path(raw, option_name)
     try:
-        return json.loads(text)
+        return loads(path.read_bytes())
     except json.JSONDecodeError as exc:
-        raise CLIUsageError(f"{source} contains invalid JSON at line {exc.lineno}, column {exc.colno}: {exc.msg}") from exc
+        raise _invalid_json_error(f"{option_name} ({path})", exc) from exc
 
 
 def _load_text_value(raw: str, option_name: str) -> str:
     if raw.startswith("@"):
-        path = Path(raw[1:])
-        if not path.exists():
-            raise CLIUsageError(f"{option_name} references missing file: {path}")
-        if not path.is_file():
-            raise CLIUsageError(f"{option_name} expects a file path after '@': {path}")
-        return path.read_text(encoding="utf-8")
+        return _at_file_path(raw, option_name).read_text(encoding="utf-8")
     return raw
 
 
@@ -127,6 +133,8 @@ def _resolve_base_url(args: argparse.Namespace) -> str | None:
 
 
 def _parse_workflow_input_field(value: Any, source: str) -> WorkflowInputField:
+    from vectorvein.api import WorkflowInputField
+
     if not isinstance(value, dict):
         raise CLIUsageError(f"{source} must be a JSON object with keys: node_id, field_name, value")
 
@@ -192,6 +200,8 @@ def _parse_upload_to_spec(spec: str, source: str) -> tuple[str, str, Path]:
 
 
 def _collect_uploaded_workflow_input_fields(args: argparse.Namespace, client: VectorVeinClient) -> list[WorkflowInputField]:
+    from vectorvein.api import WorkflowInputField
+
     upload_specs = list(args.upload_to or [])
     if not upload_specs:
         return []
@@ -224,6 +234,8 @@ def _collect_uploaded_workflow_input_fields(args: argparse.Namespace, client: Ve
 
 
 def _parse_attachment_item(value: Any, source: str) -> AttachmentDetail | OssAttachmentDetail:
+    from vectorvein.api import AttachmentDetail, OssAttachmentDetail
+
     if not isinstance(value, dict):
         raise CLIUsageError(f"{source} must be a JSON object")
 
@@ -256,6 +268,8 @@ def _collect_attachments(args: argparse.Namespace) -> list[AttachmentDetail | Os
 
 
 def _collect_url_attachments(args: argparse.Namespace) -> list[AttachmentDetail] | None:
+    from vectorvein.api import AttachmentDetail
+
     attachments = _collect_attachments(args)
     if not attachments:
         return None
@@ -270,6 +284,8 @@ def _collect_url_attachments(args: argparse.Namespace) -> list[AttachmentDetail]
 
 
 def _load_optional_agent_definition(raw: str | None) -> AgentDefinition | None:
+    from vectorvein.api import AgentDefinition
+
     if not raw:
         return None
     payload = _load_json_object(raw, "--agent-definition")
@@ -291,6 +307,8 @@ def _load_optional_agent_definition(raw: str | None) -> AgentDefinition | None:
 
 
 def _load_optional_agent_settings(raw: str | None) -> AgentSettings | None:
+    from vectorvein.api import AgentSettings
+
     if not raw:
         return None
     payload = _load_json_object(raw, "--agent-settings")
@@ -333,9 +351,9 @@ def _poll_task_until_done(
     timeout: int,
 ) -> Any:
     """Poll task status until terminal, waiting, or timeout."""
-    start_time = time.time()
+    deadline = time.monotonic() + timeout
     while True:
-        if time.time() - start_time > timeout:
+        if time.monotonic() > deadline:
             return {"task_id": task_id, "status": "timeout", "timeout": timeout}
         task = client.get_agent_task(task_id=task_id)
         normalized_status = _normalize_task_status(task.status)
@@ -2,19 +2,14 @@
 
 from __future__ import annotations
 
+import argparse
 import sys
 import time  # noqa: F401 — kept for monkeypatch compatibility
 import traceback
 from collections.abc import Sequence
 from typing import Any
 
-from vectorvein.api import (
-    APIKeyError,
-    RequestError,
-    VectorVeinAPIError,
-    VectorVeinClient,
-)
-
+from vectorvein.cli._builders.common import _HANDLERS
 from vectorvein.cli._output import (
     CLIUsageError,
     _error_payload,
@@ -28,7 +23,7 @@ from vectorvein.cli._parsers import (
     _require_api_key,
     _resolve_base_url,
 )
-from vectorvein.cli._parser_builder import build_parser
+from vectorvein.cli._parser_builder import get_parser
 
 EXIT_OK = 0
 EXIT_UNEXPECTED = 1
@@ -37,16 +32,42 @@ EXIT_AUTH = 3
 EXIT_API = 4
 EXIT_REQUEST = 5
 
-GLOBAL_FLAG_OPTIONS = {"--compact", "--debug", "--version"}
-GLOBAL_VALUE_OPTIONS = {"--api-key", "--base-url", "--format"}
+GLOBAL_FLAG_OPTIONS = frozenset({"--compact", "--pretty", "--debug", "--version"})
+GLOBAL_VALUE_OPTIONS = frozenset({"--api-key", "--base-url", "--format"})
+_GLOBAL_INLINE_PREFIXES = tuple(f"{option}=" for option in (*sorted(GLOBAL_VALUE_OPTIONS), "--version"))
+
+_LAZY_API_NAMES = frozenset({"APIKeyError", "RequestError", "VectorVeinAPIError", "VectorVeinClient"})
+
+
+def _api(name: str) -> Any:
+    """Return a ``vectorvein.api`` attribute, importing the SDK only on first use.
+
+    ``--help``/``--version`` exit inside argparse and never pay for the client import.
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        import vectorvein.api
+
+        value = globals()[name] = getattr(vectorvein.api, name)
+        return value
+
 
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_API_NAMES:
+        return _api(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def _normalize_global_options(argv: Sequence[str] | None) -> list[str] | None:
-    if argv is None:
-        return None
 
+def _preprocess_argv(argv: Sequence[str]) -> tuple[list[str], bool, tuple[str, ...]]:
+    """Scan ``argv`` once, moving global options to the front.
+
+    Returns the reordered arguments, whether the first ``--format`` asks for JSON, and up to two
+    leading command words (module and group) used to build only the parsers that are needed.
+    """
     moved: list[str] = []
     remaining: list[str] = []
+    json_output: bool | None = None
     args = list(argv)
 
     index = 0
@@ -61,13 +82,17 @@ def _normalize_global_options(argv: Sequence[str] | None) -> list[str] | None:
         if token in GLOBAL_VALUE_OPTIONS:
             moved.append(token)
             if index + 1 < len(args):
+                if token == "--format" and json_output is None:
+                    json_output = args[index + 1] == "json"
                 moved.append(args[index + 1])
                 index += 2
             else:
                 index += 1
             continue
 
-        if any(token.startswith(f"{option}=") for option in GLOBAL_VALUE_OPTIONS | {"--version"}):
+        if token.startswith(_GLOBAL_INLINE_PREFIXES):
+            if token.startswith("--format=") and json_output is None:
+                json_output = token.split("=", 1)[1] == "json"
             moved.append(token)
             index += 1
             continue
@@ -75,46 +100,96 @@ def _normalize_global_options(argv: Sequence[str] | None) -> list[str] | None:
         remaining.append(token)
         index += 1
 
-    return moved + remaining
+    command_words: list[str] = []
+    for token in remaining[:2]:
+        if token.startswith("-"):
+            break
+        command_words.append(token)
+    return moved + remaining, bool(json_output), tuple(command_words)
+
+
+def _command_parser(command: str) -> argparse.ArgumentParser:
+    words = command.split()
+    parser = get_parser(words[0] if words else None)
+    for word in words:
+        subparsers = next((action for action in parser._actions if isinstance(action, argparse._SubParsersAction)), None)
+        if subparsers is None or word not in subparsers.choices:
+            raise CLIUsageError(f"Unknown command: {command!r}", hint="Use the command path shown in `vectorvein --help`, for example 'workflow get'.")
+        parser = subparsers.choices[word]
+    if parser.get_default("command") is None:
+        raise CLIUsageError(f"{command!r} is a command group, not a command.", hint=f"Run `vectorvein {command} --help` to list its actions.")
+    return parser
 
 
-def _is_json_output_requested(raw_args: Sequence[str]) -> bool:
-    args = list(raw_args)
-    for index, token in enumerate(args):
-        if token == "--format" and index + 1 < len(args):
-            return args[index + 1] == "json"
-        if token.startswith("--format="):
-            return token.split("=", 1)[1] == "json"
-    return False
+def dispatch(command: str, client: Any, **options: Any) -> Any:
+    """Run a CLI command handler directly, without building or parsing an argv list.
+
+    ``options`` use the argparse destination names (``workspace_id`` for ``--workspace-id``) and take
+    Python values; omitted options fall back to the CLI defaults. Returns the handler's raw result.
+    """
+    parser = _command_parser(command)
+    values: dict[str, Any] = {}
+    missing: list[str] = []
+    for action in parser._actions:
+        dest = action.dest
+        if dest == argparse.SUPPRESS or dest == "help":
+            continue
+        if dest in options:
+            values[dest] = options.pop(dest)
+        elif action.required:
+            missing.append(dest)
+        elif isinstance(action.default, str) and callable(action.type):
+            values[dest] = action.type(action.default)
+        else:
+            values[dest] = action.default
+    if options:
+        raise CLIUsageError(f"{command} got unexpected option(s): {', '.join(sorted(options))}")
+    if missing:
+        raise CLIUsageError(f"{command} is missing required option(s): {', '.join(missing)}")
+
+    args = argparse.Namespace(**values)
+    args.command = parser.get_default("command")
+    return _HANDLERS[args.command](args, client)
 
 
 def _run_with_client(args: Any) -> dict[str, Any]:
-    if not hasattr(args, "handler"):
+    handler = _HANDLERS.get(getattr(args, "command", None) or "")
+    if handler is None:
         raise CLIUsageError("No command specified. Run `vectorvein --help` for usage.")
 
     api_key = _require_api_key(args)
     base_url = _resolve_base_url(args)
-    with VectorVeinClient(api_key=api_key, base_url=base_url) as client:
-        result = args.handler(args, client)
+    with _api("VectorVeinClient")(api_key=api_key, base_url=base_url) as client:
+        result = handler(args, client)
     return _success_payload(str(args.command), result)
 
 
+def _is_terminal(stream: Any) -> bool:
+    isatty = getattr(stream, "isatty", None)
+    return bool(isatty and isatty())
+
+
 def main(argv: Sequence[str] | None = None) -> int:
-    parser = build_parser()
-    compact_output = False
+    compact_output = not _is_terminal(sys.stdout)
     json_output = False
     command: str | None = None
     debug = False
 
     try:
         raw_args = list(argv) if argv is not None else sys.argv[1:]
-        json_output = _is_json_output_requested(raw_args)
+        normalized_args, json_output, command_words = _preprocess_argv(raw_args)
+        if "--compact" in normalized_args:
+            compact_output = True
+        elif "--pretty" in normalized_args:
+            compact_output = False
         if not raw_args:
-            parser.print_help()
+            get_parser().print_help()
             return EXIT_OK
-        args = parser.parse_args(_normalize_global_options(raw_args))
-        compact_output = bool(getattr(args, "compact", False))
+        args = get_parser(*command_words).parse_args(normalized_args)
         json_output = str(getattr(args, "format", "text")) == "json"
+        if getattr(args, "stream", False):
+            # Streamed results are one JSON object per line; keep the final summary on one line as well.
+            compact_output = True
         command = str(getattr(args, "command", "")) or None
         debug = bool(getattr(args, "debug", False))
         payload = _run_with_client(args)
@@ -123,6 +198,9 @@ def main(argv: Sequence[str] | None = None) -> int:
         else:
             _print_text_success(payload.get("data"))
         return EXIT_OK
+    except SystemExit:
+        # argparse exits for --help/--version; re-raise before the handlers below resolve the lazy API exception classes.
+        raise
     except CLIUsageError as exc:
         details = {"traceback": traceback.format_exc()} if debug else None
         payload = _error_payload(
@@ -140,7 +218,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         else:
             _print_text_error(payload, stream=sys.stderr)
         return EXIT_USAGE
-    except APIKeyError as exc:
+    except _api("APIKeyError") as exc:
         details = {"traceback": traceback.format_exc()} if debug else None
         payload = _error_payload(
             command=command,
@@ -155,7 +233,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         else:
             _print_text_error(payload, stream=sys.stderr)
         return EXIT_AUTH
-    except RequestError as exc:
+    except _api("RequestError") as exc:
         details = {"traceback": traceback.format_exc()} if debug else None
         payload = _error_payload(
             command=command,
@@ -169,7 +247,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         else:
             _print_text_error(payload, stream=sys.stderr)
         return EXIT_REQUEST
-    except VectorVeinAPIError as exc:
+    except _api("VectorVeinAPIError") as exc:
         details = {"traceback": traceback.format_exc()} if debug else None
         payload = _error_payload(
             command=command,
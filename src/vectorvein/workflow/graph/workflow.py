@@ -49,23 +49,20 @@ class Workflow:
         else:
             target_node_id = target_node
 
-        # 检查源节点是否存在
-        source_node_exists = any(node.id == source_node_id for node in self.nodes)
-        if not source_node_exists:
+        # 检查源节点和目标节点是否存在
+        source_node_obj = next((node for node in self.nodes if node.id == source_node_id), None)
+        if source_node_obj is None:
             raise ValueError(f"Source node not found: {source_node_id}")
 
-        # 检查目标节点是否存在
-        target_node_exists = any(node.id == target_node_id for node in self.nodes)
-        if not target_node_exists:
+        target_node_obj = next((node for node in self.nodes if node.id == target_node_id), None)
+        if target_node_obj is None:
             raise ValueError(f"Target node not found: {target_node_id}")
 
         # 检查源节点的端口是否存在
-        source_node_obj = next(node for node in self.nodes if node.id == source_node_id)
         if not source_node_obj.has_output_port(source_port):
             raise ValueError(f"Source node {source_node_id} has no output port: {source_port}")
 
         # 检查目标节点的端口是否存在
-        target_node_obj = next(node for node in self.nodes if node.id == target_node_id)
         if not target_node_obj.has_input_port(target_port):
             raise ValueError(f"Target node {target_node_id} has no input port: {target_port}")
 
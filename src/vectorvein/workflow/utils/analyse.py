@@ -1,6 +1,8 @@
 import json
 from typing import TypedDict, Any, overload
 
+from ..._json import loads
+
 
 class PortRecord(TypedDict):
     """
@@ -34,18 +36,18 @@ class AnalyseResult(TypedDict):
     nodes: list[NodeRecord]
 
 
-def analyse_workflow_record(json_str: str, connected_only: bool = False, reserver_programming_function_ports: bool = False) -> AnalyseResult:
+def analyse_workflow_record(json_str: str | bytes, connected_only: bool = False, reserver_programming_function_ports: bool = False) -> AnalyseResult:
     """
     分析工作流JSON字符串，提取节点和端口信息
 
     Args:
-        json_str: 工作流JSON字符串
+        json_str: 工作流JSON字符串，也可以直接传入UTF-8编码的bytes
 
     Returns:
         分析结果
     """
     # 解析JSON
-    workflow_data = json.loads(json_str)
+    workflow_data = loads(json_str)
 
     # 收集所有连接的端口
     connected_ports = set()
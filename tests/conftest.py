@@ -1,4 +1,16 @@
 import os
+from pathlib import Path
+
+import pytest
 
 if os.getenv("VECTORVEIN_RUN_LIVE_TESTS", "").strip().lower() not in {"1", "true", "yes", "on"}:
     collect_ignore_glob = ["live/test_*.py"]
+
+
+WORKFLOW_JSON_PATH = Path(__file__).resolve().parent / "workflow.json"
+
+
+@pytest.fixture(scope="session")
+def workflow_json() -> str:
+    """Contents of tests/workflow.json, read once per session."""
+    return WORKFLOW_JSON_PATH.read_text(encoding="utf-8")
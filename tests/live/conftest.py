@@ -0,0 +1,19 @@
+"""Shared fixtures for live tests: one set of credentials and one HTTP client per session."""
+
+import pytest
+
+from tests.live.live_common import load_live_settings
+
+
+@pytest.fixture(scope="session")
+def settings():
+    return load_live_settings()
+
+
+@pytest.fixture(scope="session")
+def client(settings):
+    """Create one API client (and connection pool) for the whole live session."""
+    from vectorvein.api import VectorVeinClient
+
+    with VectorVeinClient(api_key=settings["api_key"], base_url=settings["base_url"]) as c:
+        yield c
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-TRUTHY = {"1", "true", "yes", "on"}
+from functools import cache
+
+TRUTHY = frozenset({"1", "true", "yes", "on"})
 
 
 def _is_placeholder(value: str) -> bool:
     return value.strip().startswith("YOUR_")
 
 
+@cache
 def load_live_settings() -> dict:
     """Load and validate live test credentials from sample_settings.
 
-    Returns a dict with all credential keys.
+    Returns a dict with all credential keys; the result is cached for the session, so treat it as read-only.
     Raises RuntimeError if no usable credentials are found.
     """
     from tests.sample_settings import (
@@ -1,19 +1,6 @@
 """VectorVein API create_workflow integration test (live)."""
 
-import pytest
-
-from vectorvein.api import VectorVeinClient, Workflow
-from tests.live.live_common import load_live_settings
-
-
-@pytest.fixture(scope="module")
-def settings():
-    return load_live_settings()
-
-
-@pytest.fixture
-def client(settings):
-    return VectorVeinClient(api_key=settings["api_key"], base_url=settings["base_url"])
+from vectorvein.api import Workflow
 
 
 def test_create_basic_workflow(client):
@@ -1,21 +1,8 @@
 """VectorVein API create_workflow with proper node builder (live)."""
 
-import pytest
-
-from vectorvein.api import VectorVeinClient, Workflow
+from vectorvein.api import Workflow
 from vectorvein.workflow.graph.workflow import Workflow as WorkflowBuilder
 from vectorvein.workflow.nodes import TextInOut, TemplateCompose, OpenAI, Text
-from tests.live.live_common import load_live_settings
-
-
-@pytest.fixture(scope="module")
-def settings():
-    return load_live_settings()
-
-
-@pytest.fixture
-def client(settings):
-    return VectorVeinClient(api_key=settings["api_key"], base_url=settings["base_url"])
 
 
 def test_create_workflow_with_proper_nodes(client):
@@ -10,19 +10,6 @@ from vectorvein.api import (
     WorkflowError,
     TimeoutError,
 )
-from tests.live.live_common import load_live_settings
-
-
-@pytest.fixture(scope="module")
-def settings():
-    return load_live_settings()
-
-
-@pytest.fixture
-def client(settings):
-    """Create an API client from live settings."""
-    with VectorVeinClient(api_key=settings["api_key"], base_url=settings["base_url"]) as c:
-        yield c
 
 
 def test_init_client(settings):
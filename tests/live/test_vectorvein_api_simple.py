@@ -3,16 +3,9 @@
 import pytest
 
 from vectorvein.api import (
-    VectorVeinClient,
     AsyncVectorVeinClient,
     WorkflowInputField,
 )
-from tests.live.live_common import load_live_settings
-
-
-@pytest.fixture(scope="module")
-def settings():
-    return load_live_settings()
 
 
 INPUT_FIELDS = [
@@ -25,8 +18,7 @@ INPUT_FIELDS = [
 ]
 
 
-def test_sync_workflow(settings):
-    client = VectorVeinClient(api_key=settings["api_key"], base_url=settings["base_url"])
+def test_sync_workflow(client, settings):
     workflow_result = client.run_workflow(
         wid=settings["workflow_id"], input_fields=INPUT_FIELDS, wait_for_completion=True, timeout=300
     )
@@ -35,8 +27,8 @@ def test_sync_workflow(settings):
 
 @pytest.mark.asyncio
 async def test_async_workflow(settings):
-    client = AsyncVectorVeinClient(api_key=settings["vpp_api_key"], base_url=settings["base_url"])
-    workflow_result = await client.run_workflow(
-        wid=settings["vapp_id"], input_fields=INPUT_FIELDS, wait_for_completion=True, api_key_type="VAPP", timeout=300
-    )
+    async with AsyncVectorVeinClient(api_key=settings["vpp_api_key"], base_url=settings["base_url"]) as client:
+        workflow_result = await client.run_workflow(
+            wid=settings["vapp_id"], input_fields=INPUT_FIELDS, wait_for_completion=True, api_key_type="VAPP", timeout=300
+        )
     assert workflow_result is not None
@@ -0,0 +1,38 @@
+"""Recording stand-ins for the API client, shared by the endpoint-mapping tests."""
+
+from collections.abc import Callable
+from typing import Any
+
+ResponseFor = Callable[[str], dict[str, Any]]
+
+
+def ok_response(endpoint: str) -> dict[str, Any]:
+    return {"status": 200, "msg": "", "data": {"ok": True}}
+
+
+def make_sync_recorder(mixin: type, response_for: ResponseFor = ok_response) -> type:
+    """Return a ``mixin`` subclass whose ``_request`` records ``(method, endpoint)`` and answers with ``response_for``."""
+
+    class _SyncRecorder(mixin):
+        def __init__(self):
+            self.calls: list[tuple[str, str]] = []
+
+        def _request(self, method: str, endpoint: str, **_: Any) -> dict[str, Any]:
+            self.calls.append((method, endpoint))
+            return response_for(endpoint)
+
+    return _SyncRecorder
+
+
+def make_async_recorder(mixin: type, response_for: ResponseFor = ok_response) -> type:
+    """Async counterpart of :func:`make_sync_recorder`."""
+
+    class _AsyncRecorder(mixin):
+        def __init__(self):
+            self.calls: list[tuple[str, str]] = []
+
+        async def _request(self, method: str, endpoint: str, **_: Any) -> dict[str, Any]:
+            self.calls.append((method, endpoint))
+            return response_for(endpoint)
+
+    return _AsyncRecorder
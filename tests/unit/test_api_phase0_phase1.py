@@ -1,13 +1,10 @@
 import asyncio
-import sys
+import json
 from typing import Any
-from pathlib import Path
 
 import httpx
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
-
 from vectorvein.api import APIKeyError, RequestError, VectorVeinClient, VectorVeinAPIError
 from vectorvein.api.agent_workspace import AgentWorkspaceAsyncMixin, AgentWorkspaceSyncMixin
 from vectorvein.api.models import APIUserIdentity
@@ -60,6 +57,21 @@ _STUB_RESPONSE_BY_ENDPOINT = {
 }
 
 
+_PHASE1_EXPECTED_CALLS = [
+    ("GET", "user/validate-api-key"),
+    ("GET", "user-info/get"),
+    ("POST", "agent-workspace/list"),
+    ("POST", "agent-workspace/get"),
+    ("POST", "agent-workspace/list-files"),
+    ("POST", "agent-workspace/read-file"),
+    ("POST", "agent-workspace/download-file"),
+    ("POST", "agent-workspace/write-file"),
+    ("POST", "agent-workspace/delete-file"),
+    ("POST", "agent-workspace/zip-files"),
+    ("POST", "agent-workspace/sync-container-to-oss"),
+]
+
+
 class _RecordingSyncClient(UserSyncMixin, AgentWorkspaceSyncMixin):
     def __init__(self):
         self.calls: list[tuple[str, str]] = []
@@ -94,19 +106,7 @@ def test_sync_endpoint_mapping_for_phase1_methods():
     client.zip_workspace_files("ws_1")
     client.sync_workspace_container_to_oss("ws_1")
 
-    assert client.calls == [
-        ("GET", "user/validate-api-key"),
-        ("GET", "user-info/get"),
-        ("POST", "agent-workspace/list"),
-        ("POST", "agent-workspace/get"),
-        ("POST", "agent-workspace/list-files"),
-        ("POST", "agent-workspace/read-file"),
-        ("POST", "agent-workspace/download-file"),
-        ("POST", "agent-workspace/write-file"),
-        ("POST", "agent-workspace/delete-file"),
-        ("POST", "agent-workspace/zip-files"),
-        ("POST", "agent-workspace/sync-container-to-oss"),
-    ]
+    assert client.calls == _PHASE1_EXPECTED_CALLS
 
 
 def test_async_endpoint_mapping_for_phase1_methods():
@@ -126,52 +126,70 @@ def test_async_endpoint_mapping_for_phase1_methods():
         await client.zip_workspace_files("ws_1")
         await client.sync_workspace_container_to_oss("ws_1")
 
-        assert client.calls == [
-            ("GET", "user/validate-api-key"),
-            ("GET", "user-info/get"),
-            ("POST", "agent-workspace/list"),
-            ("POST", "agent-workspace/get"),
-            ("POST", "agent-workspace/list-files"),
-            ("POST", "agent-workspace/read-file"),
-            ("POST", "agent-workspace/download-file"),
-            ("POST", "agent-workspace/write-file"),
-            ("POST", "agent-workspace/delete-file"),
-            ("POST", "agent-workspace/zip-files"),
-            ("POST", "agent-workspace/sync-container-to-oss"),
-        ]
+        assert client.calls == _PHASE1_EXPECTED_CALLS
 
     asyncio.run(_run())
 
 
-def test_base_request_error_mapping():
+def test_async_get_user_info_coalesces_concurrent_calls():
+    async def _run():
+        client = _RecordingAsyncClient()
+
+        results = await asyncio.gather(*(client.get_user_info() for _ in range(5)))
+        assert all(result["username"] == "tester" for result in results)
+        assert len({id(result) for result in results}) == len(results)
+        assert client.calls == [("GET", "user-info/get")]
+
+        await client.get_user_info()
+        assert client.calls == [("GET", "user-info/get"), ("GET", "user-info/get")]
+
+    asyncio.run(_run())
+
+
+def _json_response(body: bytes, content_type: str = "application/json") -> httpx.Response:
+    return httpx.Response(200, request=httpx.Request("GET", "https://example.com"), content=body, headers={"content-type": content_type})
+
+
+@pytest.fixture(scope="module")
+def stub_client():
     with VectorVeinClient(api_key="x" * 32) as client:
-        request = httpx.Request("GET", "https://example.com")
-
-        # 401 -> APIKeyError with status code
-        client._client.request = lambda **_: httpx.Response(200, request=request, json={"status": 401, "msg": "unauthorized"})  # type: ignore[method-assign]
-        with pytest.raises(APIKeyError) as unauthorized:
-            client._request("GET", "dummy")
-        assert unauthorized.value.status_code == 401
-
-        # 403 (generic business error) -> VectorVeinAPIError
-        client._client.request = lambda **_: httpx.Response(200, request=request, json={"status": 403, "msg": "forbidden action"})  # type: ignore[method-assign]
-        with pytest.raises(VectorVeinAPIError) as forbidden:
-            client._request("GET", "dummy")
-        assert forbidden.value.status_code == 403
-        assert not isinstance(forbidden.value, APIKeyError)
-
-        # 403 with api key semantics -> APIKeyError
-        client._client.request = lambda **_: httpx.Response(200, request=request, json={"status": 403, "msg": "API key expired"})  # type: ignore[method-assign]
-        with pytest.raises(APIKeyError) as expired_key:
-            client._request("GET", "dummy")
-        assert expired_key.value.status_code == 403
-
-        # invalid JSON -> RequestError
-        client._client.request = lambda **_: httpx.Response(200, request=request, content=b"not-json", headers={"content-type": "text/plain"})  # type: ignore[method-assign]
-        with pytest.raises(RequestError):
-            client._request("GET", "dummy")
-
-        # missing status -> RequestError
-        client._client.request = lambda **_: httpx.Response(200, request=request, json={"msg": "missing"})  # type: ignore[method-assign]
-        with pytest.raises(RequestError):
-            client._request("GET", "dummy")
+        yield client
+
+
+@pytest.mark.parametrize(
+    ("body", "content_type", "expected_exc", "expected_status_code"),
+    [
+        pytest.param(b'{"status":401,"msg":"unauthorized"}', "application/json", APIKeyError, 401, id="401-api-key-error"),
+        pytest.param(b'{"status":403,"msg":"forbidden action"}', "application/json", VectorVeinAPIError, 403, id="403-business-error"),
+        pytest.param(b'{"status":403,"msg":"API key expired"}', "application/json", APIKeyError, 403, id="403-api-key-semantics"),
+        pytest.param(b"not-json", "text/plain", RequestError, None, id="invalid-json"),
+        pytest.param(b'{"msg":"missing"}', "application/json", RequestError, None, id="missing-status"),
+    ],
+)
+def test_base_request_error_mapping(
+    stub_client: VectorVeinClient, body: bytes, content_type: str, expected_exc: type[Exception], expected_status_code: int | None, monkeypatch: pytest.MonkeyPatch
+):
+    response = _json_response(body, content_type)
+    monkeypatch.setattr(stub_client._client, "request", lambda **_: response)
+
+    with pytest.raises(expected_exc) as exc_info:
+        stub_client._request("GET", "dummy")
+
+    assert type(exc_info.value) is expected_exc
+    if expected_status_code is not None:
+        assert exc_info.value.status_code == expected_status_code
+
+
+def test_base_request_encodes_json_body_once(stub_client: VectorVeinClient, monkeypatch: pytest.MonkeyPatch):
+    captured: dict[str, Any] = {}
+
+    def _fake_request(**kwargs: Any) -> httpx.Response:
+        captured.update(kwargs)
+        return _json_response(b'{"status":200,"data":{}}')
+
+    monkeypatch.setattr(stub_client._client, "request", _fake_request)
+    stub_client._request("POST", "dummy", json={"wid": "wf_1", "title": "标题"})
+
+    assert "json" not in captured
+    assert captured["headers"]["Content-Type"] == "application/json"
+    assert json.loads(captured["content"]) == {"wid": "wf_1", "title": "标题"}
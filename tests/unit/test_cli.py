@@ -1,4 +1,7 @@
-import json
+import io
+import os
+import pickle
+import subprocess
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -6,12 +9,32 @@ from typing import Any
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
-
-from vectorvein.api import APIKeyError, AgentTask, WaitingQuestion
+from vectorvein._json import loads
+from vectorvein.api import APIKeyError, AgentTask, WaitingQuestion, WorkflowOutput
+from vectorvein.cli import _parser_builder
+from vectorvein.cli._builders.common import _HANDLERS
+from vectorvein.cli._commands.workflow import _cmd_workflow_get
+from vectorvein.cli._output import CLIUsageError, _normalize, _print_text_success
+from vectorvein.cli._parser_builder import build_parser, get_parser
+from vectorvein.cli._parsers import _parse_workflow_input_field
+from vectorvein.cli.main import _preprocess_argv, dispatch
 from vectorvein.cli.main import main as cli_main
 
 
+class _FakeClientBase:
+    """Stand-in for VectorVeinClient; tests subclass it and add only the methods they exercise."""
+
+    def __init__(self, api_key: str, base_url: str | None = None):
+        self.api_key = api_key
+        self.base_url = base_url
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        return False
+
+
 def _read_output(capsys: pytest.CaptureFixture[str]) -> tuple[str, str]:
     captured = capsys.readouterr()
     return captured.out, captured.err
@@ -19,34 +42,25 @@ def _read_output(capsys: pytest.CaptureFixture[str]) -> tuple[str, str]:
 
 def _read_json_output(capsys: pytest.CaptureFixture[str]) -> tuple[dict[str, Any], dict[str, Any]]:
     stdout_text, stderr_text = _read_output(capsys)
-    stdout = json.loads(stdout_text) if stdout_text.strip() else {}
-    stderr = json.loads(stderr_text) if stderr_text.strip() else {}
+    stdout = loads(stdout_text) if stdout_text.strip() else {}
+    stderr = loads(stderr_text) if stderr_text.strip() else {}
     return stdout, stderr
 
 
+_WHOAMI_USER_INFO = {"uid": "uid_1", "username": "tester", "email": "tester@example.com", "credits": 42, "date_joined": "1710000000000"}
+
+
 def test_cli_auth_whoami_success_prefers_flag_api_key(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
     captured_init: dict[str, str | None] = {}
 
-    class _FakeClient:
+    class _FakeClient(_FakeClientBase):
         def __init__(self, api_key: str, base_url: str | None = None):
             captured_init["api_key"] = api_key
             captured_init["base_url"] = base_url
 
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
-
         @staticmethod
         def get_user_info():
-            return {
-                "uid": "uid_1",
-                "username": "tester",
-                "email": "tester@example.com",
-                "credits": 42,
-                "date_joined": "1710000000000",
-            }
+            return dict(_WHOAMI_USER_INFO)
 
     monkeypatch.setenv("VECTORVEIN_API_KEY", "env_key_should_not_win")
     monkeypatch.setattr("vectorvein.cli.main.VectorVeinClient", _FakeClient)
@@ -59,13 +73,7 @@ def test_cli_auth_whoami_success_prefers_flag_api_key(monkeypatch: pytest.Monkey
     assert captured_init["api_key"] == "flag_key"
     assert stdout["ok"] is True
     assert stdout["command"] == "auth whoami"
-    assert stdout["data"] == {
-        "uid": "uid_1",
-        "username": "tester",
-        "email": "tester@example.com",
-        "credits": 42,
-        "date_joined": "1710000000000",
-    }
+    assert stdout["data"] == _WHOAMI_USER_INFO
 
 
 def test_cli_missing_api_key_returns_usage_error(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
@@ -82,28 +90,11 @@ def test_cli_missing_api_key_returns_usage_error(monkeypatch: pytest.MonkeyPatch
 
 def test_cli_workflow_run_accepts_mixed_input_sources(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], tmp_path: Path):
     inputs_file = tmp_path / "inputs.json"
-    inputs_file.write_text(
-        json.dumps(
-            [
-                {"node_id": "node_from_file", "field_name": "text", "value": "hello from file"},
-            ]
-        ),
-        encoding="utf-8",
-    )
+    inputs_file.write_bytes(b'[{"node_id":"node_from_file","field_name":"text","value":"hello from file"}]')
 
     captured_run: dict[str, Any] = {}
 
-    class _FakeClient:
-        def __init__(self, api_key: str, base_url: str | None = None):
-            self.api_key = api_key
-            self.base_url = base_url
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
-
+    class _FakeClient(_FakeClientBase):
         def run_workflow(self, **kwargs: Any) -> str:
             captured_run.update(kwargs)
             return "rid_123"
@@ -139,17 +130,7 @@ def test_cli_workflow_run_accepts_mixed_input_sources(monkeypatch: pytest.Monkey
 
 
 def test_cli_maps_api_key_error_to_exit_code_3(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
-    class _FakeClient:
-        def __init__(self, api_key: str, base_url: str | None = None):
-            self.api_key = api_key
-            self.base_url = base_url
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
-
+    class _FakeClient(_FakeClientBase):
         @staticmethod
         def get_user_info():
             raise APIKeyError("invalid api key", status_code=401)
@@ -168,17 +149,7 @@ def test_cli_maps_api_key_error_to_exit_code_3(monkeypatch: pytest.MonkeyPatch,
 
 
 def test_cli_accepts_global_flags_after_subcommand(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
-    class _FakeClient:
-        def __init__(self, api_key: str, base_url: str | None = None):
-            self.api_key = api_key
-            self.base_url = base_url
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
-
+    class _FakeClient(_FakeClientBase):
         @staticmethod
         def list_workflows(**_: Any):
             return {"items": [], "total": 0}
@@ -204,27 +175,55 @@ def test_cli_no_arguments_prints_help(capsys: pytest.CaptureFixture[str]):
     assert stderr == ""
 
 
-def test_cli_auth_whoami_text_output_hides_user_id(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
-    class _FakeClient:
-        def __init__(self, api_key: str, base_url: str | None = None):
-            self.api_key = api_key
-            self.base_url = base_url
+def test_cli_version_resolves_package_version_on_demand(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    lookups: list[str] = []
+    _parser_builder._current_version.cache_clear()
+    monkeypatch.setattr("importlib.metadata.version", lambda name: lookups.append(name) or "9.9.9")
+
+    _parser_builder.build_parser()
+    assert lookups == []
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli_main(["--version"])
+    _parser_builder._current_version.cache_clear()
+
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().out == "vectorvein 9.9.9\n"
+    assert lookups == ["vectorvein-sdk"]
+
+
+def test_cli_help_does_not_import_sdk_client():
+    src_dir = Path(__file__).resolve().parents[2] / "src"
+    code = (
+        "import contextlib, sys\n"
+        "from vectorvein.cli.main import main\n"
+        "main([])\n"
+        "for argv in (['--help'], ['workflow', 'run', '--help'], ['--version']):\n"
+        "    with contextlib.suppress(SystemExit):\n"
+        "        main(argv)\n"
+        "print('vectorvein.api' in sys.modules)"
+    )
+    env = {**os.environ, "PYTHONPATH": str(src_dir)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_subcommand_help_prints_usage_and_exits(capsys: pytest.CaptureFixture[str]):
+    with pytest.raises(SystemExit) as exc_info:
+        cli_main(["workflow", "get", "--help"])
 
-        def __enter__(self):
-            return self
+    assert exc_info.value.code == 0
+    out = capsys.readouterr().out
+    assert out.startswith("usage: vectorvein workflow get [-h] --wid WID")
+    assert "-h, --help  show this help message and exit" in out
 
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
 
+def test_cli_auth_whoami_text_output_hides_user_id(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    class _FakeClient(_FakeClientBase):
         @staticmethod
         def get_user_info():
-            return {
-                "uid": "uid_1",
-                "username": "tester",
-                "email": "tester@example.com",
-                "credits": 99,
-                "date_joined": "1710000000000",
-            }
+            return dict(_WHOAMI_USER_INFO)
 
     monkeypatch.setattr("vectorvein.cli.main.VectorVeinClient", _FakeClient)
     exit_code = cli_main(["auth", "whoami", "--api-key", "k"])
@@ -232,7 +231,7 @@ def test_cli_auth_whoami_text_output_hides_user_id(monkeypatch: pytest.MonkeyPat
 
     assert exit_code == 0
     assert "uid: uid_1" in stdout
-    assert "credits: 99" in stdout
+    assert "credits: 42" in stdout
     assert "user_id" not in stdout
     assert stderr == ""
 
@@ -241,17 +240,7 @@ def test_cli_task_wait_stops_on_backend_uppercase_completed(monkeypatch: pytest.
     poll_statuses = ["PROCESSING", "COMPLETED"]
     sleep_calls: list[int] = []
 
-    class _FakeClient:
-        def __init__(self, api_key: str, base_url: str | None = None):
-            self.api_key = api_key
-            self.base_url = base_url
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
-
+    class _FakeClient(_FakeClientBase):
         @staticmethod
         def get_agent_task(task_id: str):
             status = poll_statuses.pop(0)
@@ -274,17 +263,7 @@ def test_cli_task_wait_stops_on_backend_uppercase_completed(monkeypatch: pytest.
 
 
 def test_cli_task_wait_returns_on_backend_wait_response(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
-    class _FakeClient:
-        def __init__(self, api_key: str, base_url: str | None = None):
-            self.api_key = api_key
-            self.base_url = base_url
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
-
+    class _FakeClient(_FakeClientBase):
         @staticmethod
         def get_agent_task(task_id: str):
             return AgentTask(
@@ -313,17 +292,7 @@ def test_cli_task_wait_returns_on_backend_wait_response(monkeypatch: pytest.Monk
 def test_cli_task_agent_eval_dataset_list_merges_agent_friendly_filters(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
     captured_payload: dict[str, Any] = {}
 
-    class _FakeClient:
-        def __init__(self, api_key: str, base_url: str | None = None):
-            self.api_key = api_key
-            self.base_url = base_url
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
-
+    class _FakeClient(_FakeClientBase):
         @staticmethod
         def list_agent_eval_datasets(**payload: Any):
             captured_payload.update(payload)
@@ -367,17 +336,7 @@ def test_cli_task_agent_eval_dataset_list_merges_agent_friendly_filters(monkeypa
 def test_cli_task_agent_eval_dataset_update_flag_id_overrides_data_id(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
     captured_call: dict[str, Any] = {}
 
-    class _FakeClient:
-        def __init__(self, api_key: str, base_url: str | None = None):
-            self.api_key = api_key
-            self.base_url = base_url
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
-
+    class _FakeClient(_FakeClientBase):
         @staticmethod
         def update_agent_eval_dataset(dataset_id: str, **payload: Any):
             captured_call["dataset_id"] = dataset_id
@@ -415,17 +374,7 @@ def test_cli_task_agent_eval_dataset_update_flag_id_overrides_data_id(monkeypatc
 
 
 def test_cli_workflow_list_hides_verbose_fields(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
-    class _FakeClient:
-        def __init__(self, api_key: str, base_url: str | None = None):
-            self.api_key = api_key
-            self.base_url = base_url
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
-
+    class _FakeClient(_FakeClientBase):
         @staticmethod
         def list_workflows(**_: Any):
             return {
@@ -468,17 +417,7 @@ def test_cli_file_upload_supports_multiple_paths(monkeypatch: pytest.MonkeyPatch
     file_a.write_text("aaa", encoding="utf-8")
     file_b.write_text("bbb", encoding="utf-8")
 
-    class _FakeClient:
-        def __init__(self, api_key: str, base_url: str | None = None):
-            self.api_key = api_key
-            self.base_url = base_url
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
-
+    class _FakeClient(_FakeClientBase):
         @staticmethod
         def upload_file(path: str):
             name = Path(path).name
@@ -514,17 +453,7 @@ def test_cli_workflow_run_can_upload_and_bind_files(monkeypatch: pytest.MonkeyPa
     file_b.write_text("b", encoding="utf-8")
     captured_run: dict[str, Any] = {}
 
-    class _FakeClient:
-        def __init__(self, api_key: str, base_url: str | None = None):
-            self.api_key = api_key
-            self.base_url = base_url
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
-
+    class _FakeClient(_FakeClientBase):
         @staticmethod
         def upload_file(path: str):
             name = Path(path).name
@@ -583,20 +512,7 @@ def test_cli_workflow_run_can_upload_and_bind_files(monkeypatch: pytest.MonkeyPa
 def _make_fake_client(**method_overrides: Any) -> type:
     """Build a FakeClient class with configurable method stubs."""
 
-    class _FakeClient:
-        def __init__(self, api_key: str, base_url: str | None = None):
-            self.api_key = api_key
-            self.base_url = base_url
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_value, exc_tb):
-            return False
-
-    for name, fn in method_overrides.items():
-        setattr(_FakeClient, name, fn)
-    return _FakeClient
+    return type("_FakeClient", (_FakeClientBase,), dict(method_overrides))
 
 
 @dataclass
@@ -1341,3 +1257,220 @@ def test_cli_task_continue_with_wait(monkeypatch: pytest.MonkeyPatch, capsys: py
     assert exit_code == 0
     assert stderr == {}
     assert poll_count["n"] >= 2
+
+
+def test_normalize_reuses_plain_json_containers():
+    plain = {"items": [{"id": 1, "tags": ["a"]}], "total": 1}
+    assert _normalize(plain) is plain
+
+    mixed = {"items": [{"id": 1}, WorkflowOutput("text", "Output", "done")], 2: ("x",)}
+    assert _normalize(mixed) == {"items": [{"id": 1}, {"type": "text", "title": "Output", "value": "done"}], "2": ["x"]}
+    assert _normalize(mixed)["items"][0] is mixed["items"][0]
+
+
+def test_parse_workflow_input_field_reports_shape_errors():
+    field = _parse_workflow_input_field({"node_id": 1, "field_name": "text", "value": [1]}, "input_fields[0]")
+    assert (field.node_id, field.field_name, field.value) == ("1", "text", [1])
+
+    with pytest.raises(CLIUsageError, match=r"input_fields\[1\] is missing required key\(s\): field_name, value"):
+        _parse_workflow_input_field({"node_id": "n1"}, "input_fields[1]")
+    with pytest.raises(CLIUsageError, match="must be a JSON object"):
+        _parse_workflow_input_field(["n1", "text", "v"], "input_fields[2]")
+
+
+def test_cli_batch_runs_each_line_through_one_client(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    created: list[str] = []
+
+    class _FakeClient(_FakeClientBase):
+        def __init__(self, api_key: str, base_url: str | None = None):
+            created.append(api_key)
+
+        @staticmethod
+        def get_workflow(wid: str):
+            if wid == "wf_missing":
+                raise APIKeyError("Invalid API key", 403)
+            return {"wid": wid}
+
+    monkeypatch.setattr("vectorvein.cli.main.VectorVeinClient", _FakeClient)
+    monkeypatch.setattr("sys.stdin", io.StringIO("workflow get --wid wf_1\n\n# comment\nworkflow get --wid wf_missing\nworkflow nope\nworkflow get --wid 'wf 2'\n"))
+
+    exit_code = cli_main(["--format", "json", "--api-key", "k", "batch"])
+    stdout, stderr = _read_json_output(capsys)
+
+    assert exit_code == 0
+    assert stderr == {}
+    assert created == ["k"]
+    results = stdout["data"]
+    assert [item["ok"] for item in results] == [True, False, False, True]
+    assert results[0]["data"] == {"wid": "wf_1"}
+    assert results[1]["error"]["type"] == "api_key_error"
+    assert results[1]["line"] == 4
+    assert results[2]["error"]["type"] == "usage_error"
+    assert results[3]["data"] == {"wid": "wf 2"}
+
+
+def test_cli_batch_reports_help_and_version_lines_as_usage_errors(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    class _FakeClient(_FakeClientBase):
+        @staticmethod
+        def get_workflow(wid: str):
+            return {"wid": wid}
+
+    monkeypatch.setattr("vectorvein.cli.main.VectorVeinClient", _FakeClient)
+    monkeypatch.setattr("sys.stdin", io.StringIO("workflow get --help\n--version\nworkflow get -h\nworkflow get --wid wf_1\n"))
+
+    exit_code = cli_main(["--format", "json", "--api-key", "k", "batch"])
+    stdout, stderr = _read_json_output(capsys)
+
+    assert exit_code == 0
+    assert stderr == {}
+    results = stdout["data"]
+    assert [item["ok"] for item in results] == [False, False, False, True]
+    assert [item["error"]["type"] for item in results[:3]] == ["usage_error"] * 3
+    assert [item["line"] for item in results[:3]] == [1, 2, 3]
+    assert results[3]["data"] == {"wid": "wf_1"}
+
+
+def test_build_parser_registers_only_the_requested_module():
+    def _modules(parser: Any) -> set[str]:
+        return {name for action in parser._subparsers._group_actions for name in action.choices}
+
+    assert _modules(build_parser("workflow")) == {"workflow"}
+    assert _modules(build_parser("user")) == {"auth", "user"}
+    assert {"auth", "workflow", "task-agent", "agent-workspace", "api", "batch"} <= _modules(build_parser("unknown"))
+
+
+def test_get_parser_reuses_one_parser_per_module():
+    assert get_parser("workflow") is get_parser("workflow")
+    assert get_parser("workflw") is get_parser() is get_parser(None)
+    assert get_parser("workflow", "get") is get_parser("workflow")
+    assert get_parser("task-agent", "nope") is get_parser("task-agent")
+
+    task_parser = get_parser("task-agent", "task")
+    task_agent = task_parser._subparsers._group_actions[0].choices["task-agent"]
+    assert set(task_agent._subparsers._group_actions[0].choices) == {"task"}
+
+
+def test_cli_unknown_module_still_lists_all_choices(capsys: pytest.CaptureFixture[str]):
+    exit_code = cli_main(["--format", "json", "workflw", "list"])
+    _, stderr = _read_json_output(capsys)
+
+    assert exit_code == 2
+    assert "workflow" in stderr["error"]["message"]
+    assert "task-agent" in stderr["error"]["message"]
+
+
+def test_preprocess_argv_reorders_globals_and_detects_format_and_module():
+    assert _preprocess_argv(["workflow", "get", "--wid", "wf_1", "--format", "json", "--compact"]) == (
+        ["--format", "json", "--compact", "workflow", "get", "--wid", "wf_1"],
+        True,
+        ("workflow", "get"),
+    )
+    assert _preprocess_argv(["--format=text", "--format", "json", "auth", "whoami"])[1:] == (False, ("auth", "whoami"))
+    assert _preprocess_argv(["task-agent", "--help"])[1:] == (False, ("task-agent",))
+    assert _preprocess_argv(["--api-key", "k", "--help"])[1:] == (False, ())
+
+
+def test_print_text_success_renders_nested_data():
+    stream = io.StringIO()
+    _print_text_success({"ok": True, "missing": None, "items": [1, {"name": "a", "tags": []}], "meta": {}}, stream=stream)
+
+    assert stream.getvalue() == "ok: true\nmissing: null\nitems:\n  - 1\n  -\n    name: a\n    tags:\n      []\nmeta:\n  {}\n"
+
+
+def test_cli_batch_stream_emits_one_json_line_per_command(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    class _FakeClient(_FakeClientBase):
+        @staticmethod
+        def get_workflow(wid: str):
+            return {"wid": wid}
+
+    monkeypatch.setattr("vectorvein.cli.main.VectorVeinClient", _FakeClient)
+    monkeypatch.setattr("sys.stdin", io.StringIO("workflow get --wid wf_1\nworkflow nope\n"))
+
+    exit_code = cli_main(["--format", "json", "--compact", "--api-key", "k", "batch", "--stream"])
+    lines = [loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert exit_code == 0
+    assert [line["ok"] for line in lines] == [True, False, True]
+    assert lines[0]["data"] == {"wid": "wf_1"}
+    assert lines[1]["line"] == 2
+    assert lines[2]["data"] == {"total": 2, "failed": 1}
+
+
+def test_cli_batch_stream_requires_json_format(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    class _FakeClient(_FakeClientBase):
+        @staticmethod
+        def get_workflow(wid: str):
+            raise AssertionError("no line should run")
+
+    monkeypatch.setattr("vectorvein.cli.main.VectorVeinClient", _FakeClient)
+    monkeypatch.setattr("sys.stdin", io.StringIO("workflow get --wid wf_1\n"))
+
+    exit_code = cli_main(["--format", "text", "--api-key", "k", "batch", "--stream"])
+    captured = capsys.readouterr()
+
+    assert exit_code == 2
+    assert captured.out == ""
+    assert "--stream requires --format json" in captured.err
+
+
+def test_cli_batch_stream_summary_is_one_line_on_a_terminal(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    class _FakeClient(_FakeClientBase):
+        @staticmethod
+        def get_workflow(wid: str):
+            return {"wid": wid}
+
+    monkeypatch.setattr("vectorvein.cli.main.VectorVeinClient", _FakeClient)
+    monkeypatch.setattr("vectorvein.cli.main._is_terminal", lambda stream: True)
+    monkeypatch.setattr("sys.stdin", io.StringIO("workflow get --wid wf_1\n"))
+
+    exit_code = cli_main(["--format", "json", "--api-key", "k", "batch", "--stream"])
+    lines = [loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert exit_code == 0
+    assert [line["ok"] for line in lines] == [True, True]
+    assert lines[1]["data"] == {"total": 1, "failed": 0}
+
+
+def test_parsed_args_carry_command_name_not_handler():
+    args = get_parser("workflow").parse_args(["workflow", "get", "--wid", "wf_1"])
+
+    assert not hasattr(args, "handler")
+    assert _HANDLERS[args.command] is _cmd_workflow_get
+    assert pickle.loads(pickle.dumps(args)).wid == "wf_1"
+
+
+def test_dispatch_runs_handler_with_cli_defaults():
+    class _FakeClient:
+        def __init__(self):
+            self.calls: list[dict[str, Any]] = []
+
+        def list_workflows(self, **kwargs: Any):
+            self.calls.append(kwargs)
+            return {"list": [], "total": 0}
+
+        def get_workflow(self, wid: str):
+            return {"wid": wid}
+
+    client = _FakeClient()
+
+    assert dispatch("workflow get", client, wid="wf_1") == {"wid": "wf_1"}
+    dispatch("workflow list", client, page_size=5)
+    assert client.calls[0]["page"] == 1
+    assert client.calls[0]["page_size"] == 5
+
+    with pytest.raises(CLIUsageError, match="missing required option"):
+        dispatch("workflow get", client)
+    with pytest.raises(CLIUsageError, match="unexpected option"):
+        dispatch("workflow get", client, wid="wf_1", bogus=True)
+    with pytest.raises(CLIUsageError, match="command group"):
+        dispatch("workflow", client)
+    with pytest.raises(CLIUsageError, match="Unknown command"):
+        dispatch("workflow nope", client)
+
+
+def test_cli_json_output_is_compact_when_piped_unless_pretty(capsys: pytest.CaptureFixture[str]):
+    cli_main(["--format", "json", "workflw"])
+    assert len(capsys.readouterr().err.strip().splitlines()) == 1
+
+    cli_main(["--format", "json", "--pretty", "workflw"])
+    assert capsys.readouterr().err.startswith("{\n  ")
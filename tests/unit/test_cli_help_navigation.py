@@ -1,11 +1,7 @@
 import json
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
-
 from vectorvein.cli._parser_builder import build_parser
 from vectorvein.cli.main import main as cli_main
 
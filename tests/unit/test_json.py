@@ -0,0 +1,64 @@
+import datetime
+import uuid
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+
+import pytest
+
+from vectorvein import _json
+
+
+@dataclass
+class _Point:
+    x: int
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+def test_dumps_bytes_encodes_plain_values(backend: str):
+    assert _json.dumps_bytes({"a": [1, 2.5, None, "中文"], "b": True}) == '{"a":[1,2.5,null,"中文"],"b":true}'.encode()
+    assert _json.dumps_bytes({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+    assert _json.dumps_bytes({"big": 2**70}) == b'{"big":1180591620717411303424}'
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), [{"x": float("-inf")}]])
+def test_dumps_bytes_rejects_non_finite_floats(backend: str, value):
+    with pytest.raises(ValueError):
+        _json.dumps_bytes({"x": value})
+
+
+@pytest.mark.parametrize("value", [_Point(1), datetime.datetime(2024, 1, 1), datetime.date(2024, 1, 1)])
+def test_dumps_bytes_rejects_values_the_stdlib_cannot_encode(backend: str, value):
+    with pytest.raises(TypeError):
+        _json.dumps_bytes({"x": value})
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+class _Level(IntEnum):
+    HIGH = 3
+
+
+def test_dumps_bytes_encodes_enums_and_uuids_by_value(backend: str):
+    uid = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+    assert _json.dumps_bytes({"c": _Color.RED, "l": _Level.HIGH, "u": uid}) == b'{"c":"red","l":3,"u":"12345678-1234-5678-1234-567812345678"}'
+
+
+def test_dumps_bytes_stringifies_int_float_bool_none_keys(backend: str):
+    assert _json.dumps_bytes({1: "a", 2.5: "b", False: "c", None: "d"}) == b'{"1":"a","2.5":"b","false":"c","null":"d"}'
+
+
+@pytest.mark.parametrize("key", [_Color.RED, datetime.date(2024, 1, 1), uuid.UUID(int=1)])
+def test_dumps_bytes_rejects_other_non_str_keys(backend: str, key):
+    with pytest.raises(TypeError):
+        _json.dumps_bytes({key: 1})
@@ -1,10 +1,6 @@
 import asyncio
-import sys
-from pathlib import Path
 from typing import Any
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
-
 from vectorvein.api.task_agent import TaskAgentAsyncMixin, TaskAgentSyncMixin
 
 
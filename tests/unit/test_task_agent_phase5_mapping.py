@@ -1,11 +1,8 @@
 import asyncio
-import sys
-from pathlib import Path
 from typing import Any
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
-
 from vectorvein.api.task_agent import TaskAgentAsyncMixin, TaskAgentSyncMixin
+from tests.unit._recorders import make_async_recorder, make_sync_recorder
 
 
 _AGENT_DATA = {
@@ -45,25 +42,11 @@ def _task_agent_response_for(endpoint: str) -> dict[str, Any]:
     return {"status": 200, "msg": "", "data": {"ok": True}}
 
 
-class _TaskAgentSyncRecorder(TaskAgentSyncMixin):
-    def __init__(self):
-        self.calls: list[tuple[str, str]] = []
-
-    def _request(self, method: str, endpoint: str, **_: Any) -> dict[str, Any]:
-        self.calls.append((method, endpoint))
-        return _task_agent_response_for(endpoint)
-
+_TaskAgentSyncRecorder = make_sync_recorder(TaskAgentSyncMixin, _task_agent_response_for)
+_TaskAgentAsyncRecorder = make_async_recorder(TaskAgentAsyncMixin, _task_agent_response_for)
 
-class _TaskAgentAsyncRecorder(TaskAgentAsyncMixin):
-    def __init__(self):
-        self.calls: list[tuple[str, str]] = []
 
-    async def _request(self, method: str, endpoint: str, **_: Any) -> dict[str, Any]:
-        self.calls.append((method, endpoint))
-        return _task_agent_response_for(endpoint)
-
-
-_EXPECTED_ENDPOINTS = [
+_EXPECTED_ENDPOINTS = (
     "task-agent/agent/favorite-list",
     "task-agent/agent/toggle-favorite",
     "task-agent/agent/update-system-prompt",
@@ -81,7 +64,9 @@ _EXPECTED_ENDPOINTS = [
     "task-agent/agent-cycle/task-finish",
     "task-agent/agent-cycle/replay-cycles",
     "task-agent/agent-cycle/replay-summary",
-]
+)
+
+_EXPECTED_CALLS = [("POST", endpoint) for endpoint in _EXPECTED_ENDPOINTS]
 
 
 def _exercise_sync(client: _TaskAgentSyncRecorder):
@@ -127,13 +112,13 @@ async def _exercise_async(client: _TaskAgentAsyncRecorder):
 def test_task_agent_phase5_sync_endpoint_mapping():
     client = _TaskAgentSyncRecorder()
     _exercise_sync(client)
-    assert client.calls == [("POST", endpoint) for endpoint in _EXPECTED_ENDPOINTS]
+    assert client.calls == _EXPECTED_CALLS
 
 
 def test_task_agent_phase5_async_endpoint_mapping():
     async def _run():
         client = _TaskAgentAsyncRecorder()
         await _exercise_async(client)
-        assert client.calls == [("POST", endpoint) for endpoint in _EXPECTED_ENDPOINTS]
+        assert client.calls == _EXPECTED_CALLS
 
     asyncio.run(_run())
@@ -1,33 +1,15 @@
 import asyncio
 import io
-import sys
-from pathlib import Path
-from typing import Any
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
 from vectorvein.api.task_agent import TaskAgentAsyncMixin, TaskAgentSyncMixin
+from tests.unit._recorders import make_async_recorder, make_sync_recorder
 
 
-class _TaskAgentSyncRecorder(TaskAgentSyncMixin):
-    def __init__(self):
-        self.calls: list[tuple[str, str]] = []
-
-    def _request(self, method: str, endpoint: str, **_: Any) -> dict[str, Any]:
-        self.calls.append((method, endpoint))
-        return {"status": 200, "msg": "", "data": {"ok": True}}
-
-
-class _TaskAgentAsyncRecorder(TaskAgentAsyncMixin):
-    def __init__(self):
-        self.calls: list[tuple[str, str]] = []
+_TaskAgentSyncRecorder = make_sync_recorder(TaskAgentSyncMixin)
+_TaskAgentAsyncRecorder = make_async_recorder(TaskAgentAsyncMixin)
 
-    async def _request(self, method: str, endpoint: str, **_: Any) -> dict[str, Any]:
-        self.calls.append((method, endpoint))
-        return {"status": 200, "msg": "", "data": {"ok": True}}
 
-
-_EXPECTED_CALLS = [
+_EXPECTED_CALLS = (
     "task-agent/tag/create",
     "task-agent/tag/delete",
     "task-agent/tag/list",
@@ -95,12 +77,11 @@ _EXPECTED_CALLS = [
     "task-agent/task-schedule/update",
     "task-agent/task-schedule/delete",
     "task-agent/task-schedule/toggle",
-]
+)
 
-_GET_ENDPOINTS = {
-    "task-agent/user-memory/stats",
-    "task-agent/user-memory/types",
-}
+_GET_ENDPOINTS = frozenset({"task-agent/user-memory/stats", "task-agent/user-memory/types"})
+
+_EXPECTED_REQUESTS = [("GET" if endpoint in _GET_ENDPOINTS else "POST", endpoint) for endpoint in _EXPECTED_CALLS]
 
 
 def _exercise_sync(client: _TaskAgentSyncRecorder):
@@ -246,13 +227,13 @@ async def _exercise_async(client: _TaskAgentAsyncRecorder):
 def test_task_agent_phase6_phase7_sync_endpoint_mapping():
     client = _TaskAgentSyncRecorder()
     _exercise_sync(client)
-    assert client.calls == [("GET" if endpoint in _GET_ENDPOINTS else "POST", endpoint) for endpoint in _EXPECTED_CALLS]
+    assert client.calls == _EXPECTED_REQUESTS
 
 
 def test_task_agent_phase6_phase7_async_endpoint_mapping():
     async def _run():
         client = _TaskAgentAsyncRecorder()
         await _exercise_async(client)
-        assert client.calls == [("GET" if endpoint in _GET_ENDPOINTS else "POST", endpoint) for endpoint in _EXPECTED_CALLS]
+        assert client.calls == _EXPECTED_REQUESTS
 
     asyncio.run(_run())
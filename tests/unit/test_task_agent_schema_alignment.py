@@ -1,13 +1,9 @@
 import asyncio
 import inspect
-import sys
-from pathlib import Path
 from typing import Any
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
-
 from vectorvein.api.task_agent import TaskAgentAsyncMixin, TaskAgentSyncMixin, _create_agent_from_response
 from vectorvein.cli._output import CLIUsageError
 from vectorvein.cli._parsers import _load_optional_agent_definition, _load_optional_agent_settings
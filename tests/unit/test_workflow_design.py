@@ -51,8 +51,24 @@ def test_workflow_design():
     assert check_result["no_cycle"], "Workflow should have no cycles"
     assert check_result["no_isolated_nodes"], "Workflow should have no isolated nodes"
 
-    workflow.layout()
     data = workflow.to_dict()
 
     assert len(data["nodes"]) == 8
     assert len(data["edges"]) == 7
+
+
+def test_workflow_layout():
+    """Lay out a linear chain and verify nodes advance left to right."""
+    file_upload = FileUpload()
+    pdf_parser = ProgrammingFunction()
+    pdf_parser.add_port(name="upload_files", port_type="input", value=[], multiple=True, field_type="list", show=False)
+    download_link = Text()
+
+    workflow = Workflow()
+    workflow.add_nodes([file_upload, pdf_parser, download_link])
+    workflow.connect(file_upload, "output", pdf_parser, "upload_files")
+    workflow.connect(pdf_parser, "output", download_link, "text")
+
+    assert workflow.layout() is workflow
+    xs = [node.position["x"] for node in (file_upload, pdf_parser, download_link)]
+    assert xs == sorted(xs) and len(set(xs)) == 3
@@ -1,11 +1,8 @@
 import asyncio
-import sys
-from pathlib import Path
 from typing import Any
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
-
 from vectorvein.api.workflow import WorkflowAsyncMixin, WorkflowSyncMixin
+from tests.unit._recorders import make_async_recorder, make_sync_recorder
 
 
 def _workflow_response_for(endpoint: str) -> dict[str, Any]:
@@ -28,25 +25,11 @@ def _workflow_response_for(endpoint: str) -> dict[str, Any]:
     return {"status": 200, "msg": "", "data": {"ok": True}}
 
 
-class _WorkflowSyncRecorder(WorkflowSyncMixin):
-    def __init__(self):
-        self.calls: list[tuple[str, str]] = []
-
-    def _request(self, method: str, endpoint: str, **_: Any) -> dict[str, Any]:
-        self.calls.append((method, endpoint))
-        return _workflow_response_for(endpoint)
-
-
-class _WorkflowAsyncRecorder(WorkflowAsyncMixin):
-    def __init__(self):
-        self.calls: list[tuple[str, str]] = []
-
-    async def _request(self, method: str, endpoint: str, **_: Any) -> dict[str, Any]:
-        self.calls.append((method, endpoint))
-        return _workflow_response_for(endpoint)
+_WorkflowSyncRecorder = make_sync_recorder(WorkflowSyncMixin, _workflow_response_for)
+_WorkflowAsyncRecorder = make_async_recorder(WorkflowAsyncMixin, _workflow_response_for)
 
 
-_EXPECTED_ENDPOINTS = [
+_EXPECTED_ENDPOINTS = (
     "workflow/get",
     "workflow/list",
     "workflow/update",
@@ -84,7 +67,9 @@ _EXPECTED_ENDPOINTS = [
     "workflow/schedule-trigger/get",
     "workflow/schedule-trigger/update",
     "workflow/schedule-trigger/delete",
-]
+)
+
+_EXPECTED_CALLS = [("POST", endpoint) for endpoint in _EXPECTED_ENDPOINTS]
 
 
 def _exercise_sync(client: _WorkflowSyncRecorder):
@@ -171,13 +156,47 @@ def test_workflow_phase2_phase3_sync_endpoint_mapping():
     client = _WorkflowSyncRecorder()
     _exercise_sync(client)
 
-    assert client.calls == [("POST", endpoint) for endpoint in _EXPECTED_ENDPOINTS]
+    assert client.calls == _EXPECTED_CALLS
 
 
 def test_workflow_phase2_phase3_async_endpoint_mapping():
     async def _run():
         client = _WorkflowAsyncRecorder()
         await _exercise_async(client)
-        assert client.calls == [("POST", endpoint) for endpoint in _EXPECTED_ENDPOINTS]
+        assert client.calls == _EXPECTED_CALLS
+
+    asyncio.run(_run())
+
+
+def test_get_workflow_run_records_fetches_each_unique_rid():
+    sync_client = _WorkflowSyncRecorder()
+    assert list(sync_client.get_workflow_run_records(["rid_1", "rid_2", "rid_1"])) == ["rid_1", "rid_2"]
+    assert sync_client.calls == [("POST", "workflow/run-record/get")] * 2
+
+    async def _run():
+        client = _WorkflowAsyncRecorder()
+        records = await client.get_workflow_run_records(["rid_1", "rid_2", "rid_1"], concurrency=1)
+        assert list(records) == ["rid_1", "rid_2"]
+        assert client.calls == [("POST", "workflow/run-record/get")] * 2
+
+    asyncio.run(_run())
+
+
+def test_async_identical_concurrent_reads_share_one_request():
+    async def _run():
+        client = _WorkflowAsyncRecorder()
+        await asyncio.gather(
+            client.get_workflow_template("tpl_1"),
+            client.get_workflow_template("tpl_1"),
+            client.get_workflow_template("tpl_2"),
+            client.delete_workflow_template("tpl_1"),
+            client.delete_workflow_template("tpl_1"),
+        )
+        assert sorted(client.calls) == [
+            ("POST", "workflow/template/delete"),
+            ("POST", "workflow/template/delete"),
+            ("POST", "workflow/template/get"),
+            ("POST", "workflow/template/get"),
+        ]
 
     asyncio.run(_run())
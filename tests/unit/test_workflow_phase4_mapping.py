@@ -1,32 +1,14 @@
 import asyncio
-import sys
-from pathlib import Path
-from typing import Any
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
 from vectorvein.api.workflow import WorkflowAsyncMixin, WorkflowSyncMixin
+from tests.unit._recorders import make_async_recorder, make_sync_recorder
 
 
-class _WorkflowSyncRecorder(WorkflowSyncMixin):
-    def __init__(self):
-        self.calls: list[tuple[str, str]] = []
-
-    def _request(self, method: str, endpoint: str, **_: Any) -> dict[str, Any]:
-        self.calls.append((method, endpoint))
-        return {"status": 200, "msg": "", "data": {"ok": True}}
-
+_WorkflowSyncRecorder = make_sync_recorder(WorkflowSyncMixin)
+_WorkflowAsyncRecorder = make_async_recorder(WorkflowAsyncMixin)
 
-class _WorkflowAsyncRecorder(WorkflowAsyncMixin):
-    def __init__(self):
-        self.calls: list[tuple[str, str]] = []
 
-    async def _request(self, method: str, endpoint: str, **_: Any) -> dict[str, Any]:
-        self.calls.append((method, endpoint))
-        return {"status": 200, "msg": "", "data": {"ok": True}}
-
-
-_EXPECTED_ENDPOINTS = [
+_EXPECTED_ENDPOINTS = (
     "workflow/vector-database/check-access",
     "workflow/vector-database/get",
     "workflow/vector-database/update",
@@ -62,7 +44,9 @@ _EXPECTED_ENDPOINTS = [
     "workflow/relational-database-table-record/update",
     "workflow/relational-database-table-record/delete",
     "workflow/relational-database-table-record/add",
-]
+)
+
+_EXPECTED_CALLS = [("POST", endpoint) for endpoint in _EXPECTED_ENDPOINTS]
 
 
 def _exercise_sync(client: _WorkflowSyncRecorder):
@@ -156,13 +140,13 @@ async def _exercise_async(client: _WorkflowAsyncRecorder):
 def test_workflow_phase4_sync_endpoint_mapping():
     client = _WorkflowSyncRecorder()
     _exercise_sync(client)
-    assert client.calls == [("POST", endpoint) for endpoint in _EXPECTED_ENDPOINTS]
+    assert client.calls == _EXPECTED_CALLS
 
 
 def test_workflow_phase4_async_endpoint_mapping():
     async def _run():
         client = _WorkflowAsyncRecorder()
         await _exercise_async(client)
-        assert client.calls == [("POST", endpoint) for endpoint in _EXPECTED_ENDPOINTS]
+        assert client.calls == _EXPECTED_CALLS
 
     asyncio.run(_run())
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from vectorvein.api import RequestError
+from vectorvein.api.workflow import WorkflowAsyncMixin, WorkflowSyncMixin
+
+
+class _CachingSyncRecorder(WorkflowSyncMixin):
+    def __init__(self, read_cache_ttl: float):
+        self.read_cache_ttl = read_cache_ttl
+        self.calls: list[str] = []
+        self.fail = False
+
+    def _request(self, method: str, endpoint: str, **kwargs: Any) -> dict[str, Any]:
+        self.calls.append(endpoint)
+        if self.fail:
+            raise RequestError("Request failed: connection reset")
+        return {"status": 200, "msg": "", "data": {"endpoint": endpoint, "payload": kwargs.get("json")}}
+
+
+class _CachingAsyncRecorder(WorkflowAsyncMixin):
+    def __init__(self, read_cache_ttl: float):
+        self.read_cache_ttl = read_cache_ttl
+        self.calls: list[str] = []
+        self.read_started = asyncio.Event()
+        self.release_reads = asyncio.Event()
+
+    async def _request(self, method: str, endpoint: str, **kwargs: Any) -> dict[str, Any]:
+        self.calls.append(endpoint)
+        if endpoint.endswith("/get"):
+            self.read_started.set()
+            await self.release_reads.wait()
+        return {"status": 200, "msg": "", "data": {"endpoint": endpoint, "payload": kwargs.get("json")}}
+
+
+def test_read_cache_disabled_by_default():
+    client = _CachingSyncRecorder(read_cache_ttl=0)
+
+    client.get_workflow_template("tpl_1")
+    client.get_workflow_template("tpl_1")
+
+    assert client.calls == ["workflow/template/get", "workflow/template/get"]
+
+
+def test_read_cache_serves_repeated_reads_and_keys_on_payload():
+    client = _CachingSyncRecorder(read_cache_ttl=60)
+
+    first = client.get_workflow_template("tpl_1")
+    first["endpoint"] = "mutated by caller"
+    assert client.get_workflow_template("tpl_1") == {"endpoint": "workflow/template/get", "payload": {"tid": "tpl_1"}}
+    client.get_workflow_template("tpl_2")
+
+    assert client.calls == ["workflow/template/get", "workflow/template/get"]
+
+
+def test_read_cache_is_invalidated_by_other_calls():
+    client = _CachingSyncRecorder(read_cache_ttl=60)
+
+    client.get_vector_database("vid_1")
+    client.update_vector_database("vid_1", name="renamed")
+    client.get_vector_database("vid_1")
+
+    assert client.calls == ["workflow/vector-database/get", "workflow/vector-database/update", "workflow/vector-database/get"]
+
+
+def test_read_cache_survives_uncached_reads():
+    client = _CachingSyncRecorder(read_cache_ttl=60)
+
+    client.get_vector_database("vid_1")
+    client.list_vector_databases()
+    client.get_vector_database("vid_1")
+
+    assert client.calls == ["workflow/vector-database/get", "workflow/vector-database/list"]
+
+
+def test_read_cache_skips_reads_that_raced_a_write():
+    async def _run():
+        client = _CachingAsyncRecorder(read_cache_ttl=60)
+
+        read = asyncio.ensure_future(client.get_vector_database("vid_1"))
+        await client.read_started.wait()
+        await client.update_vector_database("vid_1", name="renamed")
+        client.release_reads.set()
+        await read
+        await client.get_vector_database("vid_1")
+
+        assert client.calls == ["workflow/vector-database/get", "workflow/vector-database/update", "workflow/vector-database/get"]
+
+    asyncio.run(_run())
+
+
+def test_read_cache_serves_stale_value_on_request_error(monkeypatch: pytest.MonkeyPatch):
+    client = _CachingSyncRecorder(read_cache_ttl=1)
+    cached = client.get_relational_database("rdb_1")
+
+    now = time.monotonic()
+    monkeypatch.setattr("vectorvein.api.workflow.time.monotonic", lambda: now + 10)
+    client.fail = True
+
+    assert client.get_relational_database("rdb_1") == cached
+    with pytest.raises(RequestError):
+        client.get_relational_database("rdb_2")
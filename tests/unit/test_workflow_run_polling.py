@@ -0,0 +1,213 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from vectorvein.api import TimeoutError, VectorVeinAPIError, WorkflowInputField, WorkflowRunResult
+from vectorvein.api.workflow import WorkflowAsyncMixin, WorkflowSyncMixin
+
+
+_RUN_RESPONSE = {"status": 200, "msg": "", "data": {"rid": "rid_1"}}
+_PENDING_RESPONSE = {"status": 202, "msg": "running", "data": []}
+_DONE_RESPONSE = {"status": 200, "msg": "", "data": [{"type": "text", "title": "Output", "value": "done"}]}
+
+
+class _PollingSyncRecorder(WorkflowSyncMixin):
+    def __init__(self, pending_checks: int):
+        self.calls: list[str] = []
+        self.pending_checks = pending_checks
+
+    def _request(self, method: str, endpoint: str, **_: Any) -> dict[str, Any]:
+        self.calls.append(endpoint)
+        if endpoint == "workflow/run":
+            return _RUN_RESPONSE
+        if self.pending_checks:
+            self.pending_checks -= 1
+            return _PENDING_RESPONSE
+        return _DONE_RESPONSE
+
+
+class _PollingAsyncRecorder(WorkflowAsyncMixin):
+    def __init__(self, pending_checks: int):
+        self.calls: list[str] = []
+        self.pending_checks = pending_checks
+
+    async def _request(self, method: str, endpoint: str, **_: Any) -> dict[str, Any]:
+        self.calls.append(endpoint)
+        if endpoint == "workflow/run":
+            return _RUN_RESPONSE
+        if self.pending_checks:
+            self.pending_checks -= 1
+            return _PENDING_RESPONSE
+        return _DONE_RESPONSE
+
+
+_INPUT_FIELDS = [WorkflowInputField(node_id="n1", field_name="text", value="hi")]
+
+
+def test_poll_delay_backs_off_exponentially_and_caps():
+    deadline = float("inf")
+    delays = [WorkflowSyncMixin._poll_delay(attempt, deadline) for attempt in range(8)]
+
+    assert delays[:4] == [0.1, 0.2, 0.4, 0.8]
+    assert delays[-1] == WorkflowSyncMixin._POLL_MAX_DELAY
+
+
+def test_poll_delay_stays_capped_for_large_attempts():
+    assert WorkflowSyncMixin._poll_delay(1024, float("inf")) == WorkflowSyncMixin._POLL_MAX_DELAY
+
+
+def test_poll_delay_is_clamped_to_remaining_time():
+    assert WorkflowSyncMixin._poll_delay(10, 0.0) == 0.0
+
+
+def test_sync_run_workflow_polls_with_backoff(monkeypatch: pytest.MonkeyPatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr("vectorvein.api.workflow.time.sleep", sleeps.append)
+    client = _PollingSyncRecorder(pending_checks=2)
+
+    result = client.run_workflow("wf_1", _INPUT_FIELDS, wait_for_completion=True, timeout=30)
+
+    assert isinstance(result, WorkflowRunResult)
+    assert result.data[0].value == "done"
+    assert client.calls == ["workflow/run", "workflow/check-status", "workflow/check-status", "workflow/check-status"]
+    assert sleeps == pytest.approx([0.1, 0.2])
+
+
+def test_sync_run_workflow_times_out(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("vectorvein.api.workflow.time.sleep", lambda _: None)
+    client = _PollingSyncRecorder(pending_checks=10**6)
+
+    with pytest.raises(TimeoutError):
+        client.run_workflow("wf_1", _INPUT_FIELDS, wait_for_completion=True, timeout=0)
+
+
+def test_async_run_workflow_polls_with_backoff(monkeypatch: pytest.MonkeyPatch):
+    sleeps: list[float] = []
+
+    async def _fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("vectorvein.api.workflow.asyncio.sleep", _fake_sleep)
+
+    async def _run():
+        client = _PollingAsyncRecorder(pending_checks=2)
+        result = await client.run_workflow("wf_1", _INPUT_FIELDS, wait_for_completion=True, timeout=30)
+
+        assert isinstance(result, WorkflowRunResult)
+        assert client.calls == ["workflow/run", "workflow/check-status", "workflow/check-status", "workflow/check-status"]
+
+    asyncio.run(_run())
+    assert sleeps == pytest.approx([0.1, 0.2])
+
+
+def test_async_check_workflow_status_coalesces_same_rid():
+    async def _run():
+        client = _PollingAsyncRecorder(pending_checks=0)
+
+        results = await asyncio.gather(*(client.check_workflow_status("rid_1") for _ in range(3)), client.check_workflow_status("rid_2"))
+        assert [result.rid for result in results] == ["rid_1", "rid_1", "rid_1", "rid_2"]
+        assert client.calls == ["workflow/check-status", "workflow/check-status"]
+
+        await client.check_workflow_status("rid_1")
+        assert len(client.calls) == 3
+
+    asyncio.run(_run())
+
+
+def test_async_coalesced_reads_get_independent_copies():
+    async def _run():
+        client = _PollingAsyncRecorder(pending_checks=0)
+
+        first, second = await asyncio.gather(client.get_workflow_run_record("rid_1"), client.get_workflow_run_record("rid_1"))
+        assert client.calls == ["workflow/run-record/get"]
+        assert first == second == _DONE_RESPONSE["data"]
+        assert first is not second and first[0] is not second[0]
+
+    asyncio.run(_run())
+
+
+def test_check_workflow_statuses_deduplicates_rids():
+    client = _PollingSyncRecorder(pending_checks=0)
+
+    results = client.check_workflow_statuses(["rid_1", "rid_2", "rid_1"])
+
+    assert list(results) == ["rid_1", "rid_2"]
+    assert client.calls == ["workflow/check-status", "workflow/check-status"]
+
+
+def test_check_workflow_statuses_requires_wid_for_vapp():
+    client = _PollingSyncRecorder(pending_checks=0)
+
+    with pytest.raises(VectorVeinAPIError):
+        client.check_workflow_statuses(["rid_1"], api_key_type="VAPP")
+    with pytest.raises(VectorVeinAPIError):
+        client.check_workflow_statuses([], api_key_type="VAPP")
+    assert client.calls == []
+    assert client.check_workflow_statuses(["rid_1"], wid="wf_1", api_key_type="VAPP")["rid_1"].rid == "rid_1"
+
+
+def test_async_check_workflow_statuses_runs_concurrently():
+    async def _run():
+        client = _PollingAsyncRecorder(pending_checks=0)
+
+        results = await client.check_workflow_statuses(["rid_1", "rid_2", "rid_1"])
+
+        assert {rid: result.rid for rid, result in results.items()} == {"rid_1": "rid_1", "rid_2": "rid_2"}
+        assert client.calls == ["workflow/check-status", "workflow/check-status"]
+
+    asyncio.run(_run())
+
+
+def test_async_run_workflows_many_keeps_order_and_collects_errors():
+    async def _run():
+        client = _PollingAsyncRecorder(pending_checks=0)
+
+        results = await client.run_workflows_many(
+            [
+                {"wid": "wf_1", "input_fields": _INPUT_FIELDS},
+                {"wid": "wf_2", "input_fields": _INPUT_FIELDS, "wait_for_completion": True},
+                {"wid": "wf_3", "input_fields": _INPUT_FIELDS, "api_key_type": "VAPP", "wait_for_completion": True, "unknown": 1},
+            ],
+            concurrency=2,
+        )
+
+        assert results[0] == "rid_1"
+        assert isinstance(results[1], WorkflowRunResult)
+        assert isinstance(results[2], TypeError)
+
+    asyncio.run(_run())
+
+
+def test_sync_run_workflow_returns_outputs_from_submit_response():
+    class _ImmediateRecorder(_PollingSyncRecorder):
+        def _request(self, method: str, endpoint: str, **kwargs: Any) -> dict[str, Any]:
+            self.calls.append(endpoint)
+            return {"status": 200, "msg": "", "rid": "rid_9", "data": _DONE_RESPONSE["data"]}
+
+    client = _ImmediateRecorder(pending_checks=0)
+
+    result = client.run_workflow("wf_1", _INPUT_FIELDS, wait_for_completion=True)
+
+    assert result.rid == "rid_9"
+    assert result.data[0].value == "done"
+    assert client.calls == ["workflow/run"]
+
+
+def test_sync_run_workflow_memoizes_identical_runs(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("vectorvein.api.workflow.time.sleep", lambda _: None)
+    client = _PollingSyncRecorder(pending_checks=0)
+
+    first = client.run_workflow("wf_1", _INPUT_FIELDS, wait_for_completion=True, memoize=True)
+    second = client.run_workflow("wf_1", _INPUT_FIELDS, wait_for_completion=True, memoize=True)
+    assert second == first and second is not first
+    first.data.clear()
+    assert client.run_workflow("wf_1", _INPUT_FIELDS, wait_for_completion=True, memoize=True) == second
+    assert client.calls == ["workflow/run", "workflow/check-status"]
+
+    client.run_workflow("wf_1", _INPUT_FIELDS, wait_for_completion=True)
+    assert len(client.calls) == 4
+
+    client.delete_workflow("wf_1")
+    client.run_workflow("wf_1", _INPUT_FIELDS, wait_for_completion=True, memoize=True)
+    assert client.calls[-2:] == ["workflow/run", "workflow/check-status"]